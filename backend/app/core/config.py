@@ -0,0 +1,118 @@
+import os
+import tempfile
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# LLM extraction settings
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
+OPENAI_REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "60"))  # Seconds per attempt
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+OPENAI_RETRY_BACKOFF = float(os.getenv("OPENAI_RETRY_BACKOFF", "0.5"))  # Base delay, doubled per attempt
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))  # Shared HTTP pool size
+
+# PDF extraction settings
+# Process pool size per API process; backend.app.server divides the CPUs between its workers
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(os.cpu_count() or 1)))
+PDF_PAGES_PER_CHUNK = int(os.getenv("PDF_PAGES_PER_CHUNK", "8"))  # Documents longer than this are split across workers
+# Text extraction backend: "pypdf2", "pypdfium2" or "pdfplumber", optionally per document type
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pypdf2")
+PDF_BACKENDS_BY_TYPE = {
+    "CIBIL": os.getenv("PDF_BACKEND_CIBIL", PDF_BACKEND),
+    "GST": os.getenv("PDF_BACKEND_GST", PDF_BACKEND),
+}
+
+# Extraction cache settings
+EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "512"))  # In-process LRU size, 0 disables
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", "3600"))  # Seconds, 0 means no expiry
+EXTRACTION_CACHE_DB_TTL = int(os.getenv("EXTRACTION_CACHE_DB_TTL", str(30 * 24 * 3600)))  # Seconds, 0 means no expiry
+
+# Background evaluation job settings
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))  # Concurrent pipelines per process
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "1000"))  # Uploads rejected with 503 beyond this
+JOB_STORAGE_DIR = os.getenv("JOB_STORAGE_DIR", os.path.join(tempfile.gettempdir(), "evaluation_jobs"))
+JOB_STALE_AFTER = int(os.getenv("JOB_STALE_AFTER", "900"))  # Seconds before a RUNNING job is considered orphaned
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_MAX_WAIT = int(os.getenv("JOB_MAX_WAIT", "60"))  # Upper bound for long-polling GET /jobs/{id}
+JOB_RECOVERY_INTERVAL = int(os.getenv("JOB_RECOVERY_INTERVAL", "60"))  # Seconds between sweeps for orphaned jobs
+
+# Upload settings
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(25 * 1024 * 1024)))  # Per file
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "uploads"))
+# Whole request body, enforced while it is received: both files plus form fields
+REQUEST_MAX_BYTES = int(os.getenv("REQUEST_MAX_BYTES", str(2 * UPLOAD_MAX_BYTES + 1024 * 1024)))
+
+# Deterministic GST parser settings
+GST_PARSER_ENABLED = os.getenv("GST_PARSER_ENABLED", "true").lower() == "true"
+GST_PARSER_MIN_MONTHS = int(os.getenv("GST_PARSER_MIN_MONTHS", "24"))  # Needed to compare two 12-month windows
+
+# Observability settings
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # Route/stage/pool metrics at GET /metrics
+# Request profiling: requests carrying PROFILING_HEADER with PROFILING_TOKEN are profiled,
+# plus a random PROFILING_SAMPLE_RATE share of all requests. Without a token the header is
+# ignored and the profile endpoints are disabled
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "true").lower() == "true"
+PROFILING_HEADER = os.getenv("PROFILING_HEADER", "X-Profile-Token")
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", os.path.join(tempfile.gettempdir(), "request_profiles"))
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "100"))  # Oldest profiles are deleted beyond this
+
+# Database query settings
+FILTER_SPEC_CACHE_SIZE = int(os.getenv("FILTER_SPEC_CACHE_SIZE", "256"))  # Resolved filter key sets per model
+
+# Business lookup settings
+BUSINESS_FUZZY_SEARCH_ENABLED = os.getenv("BUSINESS_FUZZY_SEARCH_ENABLED", "true").lower() == "true"  # Needs pg_trgm
+BUSINESS_SEARCH_MAX_RESULTS = int(os.getenv("BUSINESS_SEARCH_MAX_RESULTS", "50"))
+
+# Evaluation log settings
+LOGS_PAGE_SIZE = int(os.getenv("LOGS_PAGE_SIZE", "100"))  # Default page size of GET /fetch/logs
+LOGS_MAX_PAGE_SIZE = int(os.getenv("LOGS_MAX_PAGE_SIZE", "1000"))
+LOGS_STREAM_BATCH_SIZE = int(os.getenv("LOGS_STREAM_BATCH_SIZE", "500"))  # Rows fetched per round-trip when streaming
+
+# Rule engine settings
+RULE_PLAN_CACHE_SIZE = int(os.getenv("RULE_PLAN_CACHE_SIZE", "128"))  # Compiled rule configs kept in memory
+
+# Dashboard statistics settings
+STATS_TIMEZONE = os.getenv("STATS_TIMEZONE", "Asia/Kolkata")  # Day boundaries of the statistics buckets
+STATS_DEFAULT_DAYS = int(os.getenv("STATS_DEFAULT_DAYS", "30"))  # Window of GET /stats without a date range
+STATS_MAX_DAYS = int(os.getenv("STATS_MAX_DAYS", "366"))
+STATS_TOP_CRITERIA = int(os.getenv("STATS_TOP_CRITERIA", "5"))  # Failing criteria listed per bucket
+
+# Portfolio re-scoring settings
+RESCORE_CHUNK_SIZE = int(os.getenv("RESCORE_CHUNK_SIZE", "2000"))  # Businesses scored per worker task
+# Process pool size per API process; backend.app.server divides the CPUs between its workers
+RESCORE_WORKERS = int(os.getenv("RESCORE_WORKERS", str(os.cpu_count() or 1)))
+
+# What-if rule simulation settings
+SIMULATION_MAX_CONFIGS = int(os.getenv("SIMULATION_MAX_CONFIGS", "10"))  # Candidate rule configs per request
+SIMULATION_MAX_FLIPS = int(os.getenv("SIMULATION_MAX_FLIPS", "1000"))  # Flipped applicants listed per candidate
+
+# Active rule cache settings
+RULE_CACHE_LISTEN = os.getenv("RULE_CACHE_LISTEN", "true").lower() == "true"  # LISTEN for rule changes, needs Postgres
+RULE_CACHE_TTL = float(os.getenv("RULE_CACHE_TTL", "5"))  # Seconds a cached rule is trusted while not listening
+RULE_CACHE_RECONNECT_INTERVAL = float(os.getenv("RULE_CACHE_RECONNECT_INTERVAL", "5"))
+
+# Production server settings (python -m backend.app.server)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "0")) or (os.cpu_count() or 1)  # 0 means one per CPU
+SERVER_PRELOAD = os.getenv("SERVER_PRELOAD", "true").lower() == "true"  # Import the app once, before forking workers
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))  # Seconds a stopping worker may finish requests
+SERVER_KEEPALIVE = int(os.getenv("SERVER_KEEPALIVE", "5"))  # Seconds an idle keep-alive connection is held
+SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", "2048"))
+SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", "0"))  # Requests before a worker is replaced, 0 disables
+
+# Database connection pool settings. Each worker process has its own pools, so the total a
+# server opens is SERVER_WORKERS times the per-worker pools; DB_MAX_CONNECTIONS caps that
+# total and must stay below Postgres max_connections minus other clients (migrations, psql)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "90"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "0"))  # Per worker, 0 derives it from DB_MAX_CONNECTIONS
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "-1"))  # Per worker, -1 derives it from DB_MAX_CONNECTIONS
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a connection is replaced
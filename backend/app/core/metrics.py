@@ -0,0 +1,159 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CollectorRegistry, Histogram, Gauge, REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+)
+from prometheus_client.core import GaugeMetricFamily
+from starlette.responses import Response
+
+# Uploads take seconds to minutes end to end, the default buckets stop at 10s
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Latency of HTTP requests by route template",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served",
+    ["method"], multiprocess_mode="livesum"
+)
+STAGE_LATENCY = Histogram(
+    "pipeline_stage_duration_seconds", "Latency of evaluation pipeline stages",
+    ["stage", "outcome"], buckets=LATENCY_BUCKETS
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a database connection from the pool",
+    ["engine"], buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30)
+)
+
+
+@contextmanager
+def stage(name: str):
+    """
+    Time one step of the evaluation pipeline; failures are recorded with outcome="error".
+
+        with stage("llm_CIBIL"):
+            ...
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_LATENCY.labels(name, outcome).observe(elapsed)
+        logging.debug(f"Stage {name} {outcome} in {elapsed * 1000:.1f} ms")
+
+
+def timed_pool(pool_class, engine_name: str):
+    """
+    Subclass of a SQLAlchemy pool class that records how long each checkout waits, for
+    `create_engine(..., poolclass=timed_pool(QueuePool, "sync"))`.
+    """
+    wait = DB_POOL_WAIT.labels(engine_name)
+
+    class TimedPool(pool_class):
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                return super().connect()
+            finally:
+                wait.observe(time.perf_counter() - started)
+
+    TimedPool.__name__ = f"Timed{pool_class.__name__}"
+    return TimedPool
+
+
+class PoolCollector:
+    """
+    Connection pool occupancy read at scrape time, so it costs nothing between scrapes.
+    Engines are looked up on every scrape because `dispose()` replaces their pool.
+    """
+
+    def __init__(self, engines: dict):
+        self.engines = engines
+
+    def collect(self):
+        in_use = GaugeMetricFamily("db_pool_connections_in_use", "Connections checked out of the pool", labels=["engine"])
+        idle = GaugeMetricFamily("db_pool_connections_idle", "Connections idle in the pool", labels=["engine"])
+        size = GaugeMetricFamily("db_pool_size", "Configured pool size", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "Connections opened beyond the pool size", labels=["engine"])
+        for name, engine in self.engines.items():
+            pool = engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue  # NullPool and friends keep no connections
+            in_use.add_metric([name], pool.checkedout())
+            idle.add_metric([name], pool.checkedin())
+            size.add_metric([name], pool.size())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+        yield from (in_use, idle, size, overflow)
+
+
+_pool_collector = None
+
+
+def register_engines(engines: dict):
+    """Report pool occupancy for these engines, keyed by the engine label."""
+    global _pool_collector
+    if _pool_collector is not None:
+        REGISTRY.unregister(_pool_collector)  # Engines recreated after a dispose
+    _pool_collector = PoolCollector(engines)
+    REGISTRY.register(_pool_collector)
+
+
+class MetricsMiddleware:
+    """
+    Record a latency histogram per route template (not per URL, which would explode the label
+    set) and the number of requests in flight.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                method, route.path if route is not None else "unmatched", str(status)
+            ).observe(time.perf_counter() - started)
+
+
+def metrics_response():
+    """
+    The Prometheus exposition. With several worker processes PROMETHEUS_MULTIPROC_DIR must be
+    set, and the metrics of all workers are merged from there.
+    """
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        # Pool occupancy is not shared between processes; this reports the scraped worker's pools
+        if _pool_collector is not None:
+            registry.register(_pool_collector)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,144 @@
+import asyncio
+import cProfile
+import hmac
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+
+PROFILE_ID = re.compile(r"^[0-9]+-[0-9a-f]{8}$")
+
+_profiling = threading.Lock()  # One profiler per process: cProfile would mix concurrent requests' samples
+
+
+class ProfilingMiddleware:
+    """
+    Profile a request with cProfile when it carries the profiling header with the configured
+    token, or when it falls within the sampling rate, and keep the pstats dump in a bounded
+    on-disk ring buffer (see `list_profiles`).
+
+    Requests that are not profiled only pay for a header lookup and, with a sampling rate set,
+    one random number. cProfile sees everything the event loop runs while the request is in
+    flight, so a profile can include work of concurrent requests; only one request is profiled
+    at a time and others are served unprofiled meanwhile.
+    """
+
+    def __init__(self, app, directory: str, max_profiles: int, header: str, token: str = "", sample_rate: float = 0.0,
+                 exclude_paths=("/profiles", "/metrics")):
+        self.app = app
+        # Reading profiles sends the token too; profiling those requests would evict what is being read
+        self.exclude_paths = tuple(exclude_paths)
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self.header = header.lower().encode()
+        self.token = token.encode()
+        self.sample_rate = sample_rate
+
+    def _requested(self, scope):
+        if scope["path"].startswith(self.exclude_paths):
+            return None
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == self.header:
+                    return "header" if hmac.compare_digest(value, self.token) else None
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        trigger = self._requested(scope)
+        if trigger is None or not _profiling.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                profiler.disable()
+        finally:
+            _profiling.release()
+            metadata = {
+                'method': scope["method"],
+                'path': scope["path"],
+                'status': status,
+                'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+                'trigger': trigger
+            }
+            try:
+                await asyncio.to_thread(save_profile, self.directory, self.max_profiles, profiler, metadata)
+            except OSError:
+                logging.exception("Could not store request profile")
+
+
+def save_profile(directory: str, max_profiles: int, profiler: cProfile.Profile, metadata: dict):
+    """
+    Write a pstats dump and its metadata, then drop the oldest profiles beyond `max_profiles`.
+    """
+    os.makedirs(directory, exist_ok=True)
+    profile_id = f"{time.time_ns() // 1_000_000}-{uuid.uuid4().hex[:8]}"
+    profiler.dump_stats(os.path.join(directory, f"{profile_id}.prof"))
+    with open(os.path.join(directory, f"{profile_id}.json"), "w") as f:
+        json.dump({'id': profile_id, 'created_at': time.time(), **metadata}, f)
+
+    # Ids start with the creation time in milliseconds, so sorting them orders by age
+    stored = sorted(name[:-len(".prof")] for name in os.listdir(directory) if name.endswith(".prof"))
+    for expired in stored[:-max_profiles] if max_profiles > 0 else stored:
+        for extension in (".prof", ".json"):
+            try:
+                os.remove(os.path.join(directory, expired + extension))
+            except FileNotFoundError:
+                pass
+
+
+def list_profiles(directory: str):
+    """
+    Metadata of the stored profiles, newest first.
+    """
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in sorted(os.listdir(directory), reverse=True):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError):
+            continue  # Removed by the ring buffer while listing
+    return profiles
+
+
+def profile_path(directory: str, profile_id: str):
+    """Path of a stored pstats dump, or None if the id is unknown or malformed."""
+    if not PROFILE_ID.match(profile_id):
+        return None
+    path = os.path.join(directory, f"{profile_id}.prof")
+    return path if os.path.isfile(path) else None
+
+
+def render_profile(path: str, sort: str = "cumulative", limit: int = 50):
+    """The top functions of a dump as pstats text, for a quick look without downloading it."""
+    output = io.StringIO()
+    pstats.Stats(path, stream=output).strip_dirs().sort_stats(sort).print_stats(limit)
+    return output.getvalue()
@@ -0,0 +1,70 @@
+from starlette.responses import JSONResponse
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject request bodies larger than `max_bytes` with 413 while they are still being received.
+
+    Requests announcing a larger Content-Length are refused before any of the body is read;
+    chunked bodies are counted as they arrive and cut off once the limit is crossed. A
+    Content-Length that is not a number is answered with 400.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def _reject(self, scope, receive, send):
+        response = JSONResponse(
+            content={"error": f"Request body exceeds {self.max_bytes} bytes"},
+            status_code=413
+        )
+        await response(scope, receive, send)
+
+    @staticmethod
+    async def _bad_length(scope, receive, send):
+        response = JSONResponse(content={"error": "Invalid Content-Length header"}, status_code=400)
+        await response(scope, receive, send)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None:
+            try:
+                announced = int(content_length)
+            except ValueError:
+                await self._bad_length(scope, receive, send)
+                return
+            if announced > self.max_bytes:
+                await self._reject(scope, receive, send)
+                return
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive():
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    if not response_started:
+                        await self._reject(scope, receive, send)
+                        rejected = True
+                    # Tell the application the client went away so it stops reading
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        await self.app(scope, limited_receive, guarded_send)
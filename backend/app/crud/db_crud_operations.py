@@ -1,13 +1,82 @@
+import csv
+import enum
+import io
+from contextlib import contextmanager, asynccontextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import groupby
+from types import SimpleNamespace
+
+import simplejson as json
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
-from typing import List, Dict, Any, Optional, Type
+from sqlalchemy import func, select, insert, inspect, JSON
+from typing import List, Dict, Any, Optional, Type, Tuple, Iterator, AsyncIterator
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only as orm_load_only
 
+from backend.app.core.config import FILTER_SPEC_CACHE_SIZE
 
+# Filter key suffixes, e.g. {'created_at__gte': start, 'status__in': [...]}
+FILTER_OPERATORS = {
+    'eq': lambda column, value: column == value,
+    'in': lambda column, value: column.in_(value),
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+}
 
-def fetch_model_entries(
-    db:Session,
+
+@lru_cache(maxsize=FILTER_SPEC_CACHE_SIZE)
+def _filter_spec(model: Any, join_model: Optional[Type], keys: Tuple[str, ...]):
+    """
+    Resolve filter keys to (column, operator) pairs once per model and key set; hot queries
+    only apply the cached operators to the new values.
+    """
+    spec = []
+    for key in keys:
+        # Check for an operator suffix such as '__in' or '__gte'
+        field_name, _, operator = key.partition('__')
+        if operator and operator not in FILTER_OPERATORS:
+            raise ValueError(f"Unknown filter operator '{operator}' in filter key.")
+
+        # Handle 'Model.field' notation for filtering across models
+        if '.' in field_name:
+            model_name, field = field_name.split('.')
+
+            # Check if the field belongs to the main model
+            if model_name == model.__name__:
+                field_attr = getattr(model, field)
+            # Check if the field belongs to the joined model
+            elif join_model and model_name == join_model.__name__:
+                field_attr = getattr(join_model, field)
+            else:
+                raise ValueError(f"Unknown model name '{model_name}' in filter key.")
+        else:
+            # Handle normal field filtering without model prefix
+            field_attr = getattr(model, field_name)
+
+        # Standard equality filter without an operator
+        spec.append((field_attr, FILTER_OPERATORS[operator or 'eq']))
+    return tuple(spec)
+
+
+@lru_cache(maxsize=FILTER_SPEC_CACHE_SIZE)
+def _exclude_spec(model: Any, join_model: Optional[Type], keys: Tuple[str, ...]):
+    """Columns of the exclusion keys; keys on neither model are ignored."""
+    spec = []
+    for key in keys:
+        if hasattr(model, key):
+            spec.append(getattr(model, key))
+        elif join_model and hasattr(join_model, key):
+            spec.append(getattr(join_model, key))
+        else:
+            spec.append(None)
+    return tuple(spec)
+
+
+def _build_select(
     model: Any,
     join_model: Optional[Type] = None,
     filter_data: Optional[Dict[str, Any]] = None,
@@ -17,26 +86,24 @@ def fetch_model_entries(
     group_by: Optional[List[str]] = None,
     skip: int = 0,
     limit: Optional[int] = None,
-    fetch_one: bool = False  # New parameter to determine whether to fetch one or multiple records
-) -> Any:
+    fetch_one: bool = False,
+    columns: Optional[List[str]] = None,
+    load_only: Optional[List[str]] = None
+):
     """
-    Retrieve multiple records from the given model with optional joins, filtering, exclusion, aggregation, ordering, grouping, and pagination.
+    Build the SELECT shared by the sync and async fetch helpers.
 
-    :param db: SQLAlchemy session
-    :param model: SQLAlchemy model class
-    :param join_model: SQLAlchemy model class to join with (optional)
-    :param filter_data: Dictionary of field-value pairs to filter by
-    :param exclude_data: Dictionary of field-value pairs to exclude
-    :param aggregate_data: Dictionary of field-aggregate function pairs
-    :param order_by: List of fields to order by (prefix with '-' for descending order)
-    :param group_by: List of fields to group by
-    :param skip: Number of records to skip
-    :param limit: Maximum number of records to return
-    :param fetch_one: Boolean flag to return a single record instead of a list
-    :return: A single record instance or a list of record instances or aggregated results
+    :return: Tuple of (statement, returns_entities) where returns_entities is False for
+             aggregate and column queries, whose rows are tuples rather than model instances
     """
-
-    query = db.query(model)
+    if columns:
+        # Projection: plain rows of just these columns, no ORM identity map overhead
+        query = select(*[getattr(model, field) for field in columns])
+    else:
+        query = select(model)
+        if load_only:
+            # Entities with only these attributes loaded; the others are deferred
+            query = query.options(orm_load_only(*[getattr(model, field) for field in load_only]))
 
     # Apply join if join_model is provided
     if join_model:
@@ -44,45 +111,17 @@ def fetch_model_entries(
 
     # Apply filters
     if filter_data:
-        filters = []
-        for key, value in filter_data.items():
-            # Check if the key uses '__in' logic
-            if key.endswith('__in'):
-                field_name = key.split('__')[0]
-            else:
-                field_name = key
-
-            # Handle 'Model.field' notation for filtering across models
-            if '.' in field_name:
-                model_name, field = field_name.split('.')
-
-                # Check if the field belongs to the main model
-                if model_name == model.__name__:
-                    field_attr = getattr(model, field)
-                # Check if the field belongs to the joined model
-                elif join_model and model_name == join_model.__name__:
-                    field_attr = getattr(join_model, field)
-                else:
-                    raise ValueError(f"Unknown model name '{model_name}' in filter key.")
-            else:
-                # Handle normal field filtering without model prefix
-                field_attr = getattr(model, field_name)
-
-            # Apply '__in' filter or standard equality filter
-            if key.endswith('__in'):
-                filters.append(field_attr.in_(value))
-            else:
-                filters.append(field_attr == value)
-
-        query = query.filter(*filters)
+        spec = _filter_spec(model, join_model, tuple(filter_data))
+        query = query.filter(*[
+            operator(field_attr, value) for (field_attr, operator), value in zip(spec, filter_data.values())
+        ])
 
     # Apply exclusions
     if exclude_data:
-        for key, value in exclude_data.items():
-            if hasattr(model, key):
-                query = query.filter(getattr(model, key) != value)
-            elif join_model and hasattr(join_model, key):
-                query = query.filter(getattr(join_model, key) != value)
+        spec = _exclude_spec(model, join_model, tuple(exclude_data))
+        query = query.filter(*[
+            field_attr != value for field_attr, value in zip(spec, exclude_data.values()) if field_attr is not None
+        ])
 
     # Apply aggregations
     if aggregate_data:
@@ -99,7 +138,9 @@ def fetch_model_entries(
                 select_columns.append(func.min(field_attr).label(f"{field}_min"))
             elif agg_func == 'max':
                 select_columns.append(func.max(field_attr).label(f"{field}_max"))
-        query = query.with_entities(*select_columns)
+        # Grouped aggregates also return the group's key columns, ahead of the aggregates
+        group_columns = [getattr(model, field) for field in group_by or []]
+        query = query.with_only_columns(*group_columns, *select_columns)
 
     # Apply grouping
     if group_by:
@@ -118,29 +159,451 @@ def fetch_model_entries(
     # Apply pagination
     if skip:
         query = query.offset(skip)
-    if limit:
+    if fetch_one:
+        query = query.limit(1)
+    elif limit:
         query = query.limit(limit)
 
-    # Execute the query
+    return query, not (aggregate_data or columns)
+
+
+def _count_select(query, grouped: bool):
+    """COUNT(*) of the rows the query would return, without fetching them."""
+    if grouped:
+        return select(func.count()).select_from(query.subquery())
+    return query.with_only_columns(func.count(), maintain_column_froms=True)
+
+
+def _fetch_result(result, returns_entities: bool, fetch_one: bool):
+    if returns_entities:
+        result = result.scalars()
     if fetch_one:
-        return query.first()  # Return the first record
-    else:
-        return query.all()  # Return the list of records
-    # Return the list of records
+        return result.first()  # Return the first record
+    return result.all()  # Return the list of records
+
+
+def fetch_model_entries(
+    db:Session,
+    model: Any,
+    join_model: Optional[Type] = None,
+    filter_data: Optional[Dict[str, Any]] = None,
+    exclude_data: Optional[Dict[str, Any]] = None,
+    aggregate_data: Optional[Dict[str, str]] = None,
+    order_by: Optional[List[str]] = None,
+    group_by: Optional[List[str]] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    fetch_one: bool = False,  # New parameter to determine whether to fetch one or multiple records
+    columns: Optional[List[str]] = None,
+    load_only: Optional[List[str]] = None,
+    count: bool = False
+) -> Any:
+    """
+    Retrieve multiple records from the given model with optional joins, filtering, exclusion, aggregation, ordering, grouping, and pagination.
 
-def create_model_entry(db:Session, data: dict, model: Any):
+    :param db: SQLAlchemy session
+    :param model: SQLAlchemy model class
+    :param join_model: SQLAlchemy model class to join with (optional)
+    :param filter_data: Dictionary of field-value pairs to filter by; keys may end in __in, __gt,
+                        __gte, __lt or __lte to filter on something other than equality
+    :param exclude_data: Dictionary of field-value pairs to exclude
+    :param aggregate_data: Dictionary of field-aggregate function pairs
+    :param order_by: List of fields to order by (prefix with '-' for descending order)
+    :param group_by: List of fields to group by
+    :param skip: Number of records to skip
+    :param limit: Maximum number of records to return
+    :param fetch_one: Boolean flag to return a single record instead of a list
+    :param columns: Only select these fields; rows are returned instead of model instances
+    :param load_only: Only load these fields of the returned model instances
+    :param count: Return the number of matching records (groups, for grouped queries) instead of
+                  the records; ordering and pagination are ignored
+    :return: A single record instance or a list of record instances or aggregated results,
+             or the count in count mode
+    """
+    if count:
+        # Ordering and pagination do not change the count of matching records
+        query, _ = _build_select(model, join_model, filter_data, exclude_data, aggregate_data, group_by=group_by)
+        return db.execute(_count_select(query, bool(aggregate_data or group_by))).scalar_one()
+    query, returns_entities = _build_select(
+        model, join_model, filter_data, exclude_data, aggregate_data, order_by, group_by, skip, limit, fetch_one,
+        columns, load_only
+    )
+    return _fetch_result(db.execute(query), returns_entities, fetch_one)
+
+
+def stream_model_entries(
+    db: Session,
+    model: Any,
+    batch_size: int = 1000,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Iterate over the records `fetch_model_entries` would return, fetching `batch_size` rows per
+    round-trip through a server-side cursor, so memory use stays constant however many rows match.
+
+    :param db: SQLAlchemy session
+    :param model: SQLAlchemy model class
+    :param batch_size: Rows buffered at a time
+    :param kwargs: Any other `fetch_model_entries` argument except fetch_one and count
+    :return: Iterator of model instances, or rows for column and aggregate queries
+    """
+    query, returns_entities = _build_select(model, **kwargs)
+    result = db.execute(query.execution_options(yield_per=batch_size))
+    try:
+        yield from result.scalars() if returns_entities else result
+    finally:
+        # Release the cursor even when the caller stops early
+        result.close()
+
+
+async def fetch_model_entries_async(
+    db: AsyncSession,
+    model: Any,
+    join_model: Optional[Type] = None,
+    filter_data: Optional[Dict[str, Any]] = None,
+    exclude_data: Optional[Dict[str, Any]] = None,
+    aggregate_data: Optional[Dict[str, str]] = None,
+    order_by: Optional[List[str]] = None,
+    group_by: Optional[List[str]] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    fetch_one: bool = False,
+    columns: Optional[List[str]] = None,
+    load_only: Optional[List[str]] = None,
+    count: bool = False
+) -> Any:
+    """
+    Async version of `fetch_model_entries` for an `AsyncSession`; takes the same arguments
+    and returns the same results without blocking the event loop.
+    """
+    if count:
+        query, _ = _build_select(model, join_model, filter_data, exclude_data, aggregate_data, group_by=group_by)
+        return (await db.execute(_count_select(query, bool(aggregate_data or group_by)))).scalar_one()
+    query, returns_entities = _build_select(
+        model, join_model, filter_data, exclude_data, aggregate_data, order_by, group_by, skip, limit, fetch_one,
+        columns, load_only
+    )
+    return _fetch_result(await db.execute(query), returns_entities, fetch_one)
+
+
+async def stream_model_entries_async(
+    db: AsyncSession,
+    model: Any,
+    batch_size: int = 1000,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """
+    Async version of `stream_model_entries`: an async iterator over the matching records,
+    read through a server-side cursor `batch_size` rows at a time.
+    """
+    query, returns_entities = _build_select(model, **kwargs)
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    try:
+        async for record in (result.scalars() if returns_entities else result):
+            yield record
+    finally:
+        await result.close()
+
+
+def _column_values(model: Any, data: dict):
+    """
+    Column values of a row as the model would store them. The model's @validates hooks run
+    (Business derives its normalized name in one) without the cost of building an instance.
+    """
+    validators = inspect(model).validators
+    if validators:
+        row = SimpleNamespace(**data)
+        for key, (validator, _) in validators.items():
+            if key in data:
+                setattr(row, key, validator(row, key, data[key]))
+        data = vars(row)
+    return {key: data[key] for key in _column_keys(model) if key in data}
+
+
+@lru_cache(maxsize=None)
+def _column_keys(model: Any):
+    return tuple(attribute.key for attribute in inspect(model).column_attrs)
+
+
+def _insert_batches(model: Any, rows: List[dict], batch_size: int):
+    """
+    Split rows into batches of (input indexes, column values) that share the same columns, so
+    that every batch is a single executemany and omitted columns keep their server defaults.
+    """
+    prepared = [(index, _column_values(model, data)) for index, data in enumerate(rows)]
+    prepared.sort(key=lambda item: tuple(item[1]))
+    for _, group in groupby(prepared, key=lambda item: tuple(item[1])):
+        group = list(group)
+        for start in range(0, len(group), batch_size):
+            batch = group[start:start + batch_size]
+            yield [index for index, _ in batch], [values for _, values in batch]
+
+
+def _insert_statement(model: Any, returning: Optional[List[str]]):
+    columns = [getattr(model, field) for field in returning] if returning else inspect(model).primary_key
+    # Rows come back in the order of the parameters, so they can be matched to their input.
+    # render_nulls keeps None values in the parameters; otherwise the ORM splits a batch into a
+    # separate statement for every run of rows with a different set of non-None columns
+    return (
+        insert(model)
+        .returning(*columns, sort_by_parameter_order=True)
+        .execution_options(render_nulls=True)
+    )
+
+
+def _bulk_result(rows: List[dict]):
+    return {'rows': [None] * len(rows), 'inserted': 0, 'errors': []}
+
+
+def _copy_value(value, column):
+    if isinstance(value, enum.Enum):
+        return value.name
+    if value is not None and isinstance(column.type, JSON):
+        return json.dumps(value)
+    return value
+
+
+def _copy_rows(model: Any, rows: List[dict]):
+    """Column names and value tuples for COPY, all rows sharing the union of their columns."""
+    prepared = [_column_values(model, data) for data in rows]
+    attributes = inspect(model).column_attrs
+    columns = {key: attributes[key].columns[0] for key in _column_keys(model)}
+    # COPY bypasses SQLAlchemy, so scalar Python-side defaults are filled in here; columns
+    # nobody sets are left out and keep their server defaults
+    defaults = {
+        key: column.default.arg for key, column in columns.items()
+        if column.default is not None and column.default.is_scalar
+    }
+    keys = [key for key in columns if key in defaults or any(key in values for values in prepared)]
+    records = [
+        tuple(_copy_value(values.get(key, defaults.get(key)), columns[key]) for key in keys)
+        for values in prepared
+    ]
+    return model.__table__.name, [columns[key].name for key in keys], records
+
+
+def _csv_value(value):
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _copy_csv(records):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        # None is written as an unquoted empty field, which COPY reads as NULL
+        writer.writerow(['' if value is None else _csv_value(value) for value in record])
+    buffer.seek(0)
+    return buffer
+
+
+def create_model_entry(db:Session, data: dict, model: Any, commit: bool = True):
     """
     Create a new User record.
     :param db: SQLAlchemy session
     :param user_data: Dictionary containing the User data
+    :param commit: Commit and refresh the new row. Pass False inside `unit_of_work` to only
+                   flush it; the INSERT then returns the generated columns through RETURNING
+                   and the row is committed together with the rest of the unit of work
     :return: The created User instance
     """
     database = model(**data)
     try:
         db.add(database)
-        db.commit()
-        db.refresh(database)
+        if commit:
+            db.commit()
+            db.refresh(database)
+        else:
+            db.flush([database])
         return database
     except IntegrityError as e:
         db.rollback()
-        raise ValueError(f"Error creating user: {e.orig}")
\ No newline at end of file
+        raise ValueError(f"Error creating user: {e.orig}")
+
+
+@contextmanager
+def unit_of_work(db: Session):
+    """
+    Group several writes into a single transaction that is committed once on exit and
+    rolled back entirely if anything inside the block raises.
+
+    :param db: SQLAlchemy session
+    :return: The same session, for use with `create_model_entry(..., commit=False)`
+    """
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def create_model_entries(
+    db: Session,
+    rows: List[dict],
+    model: Any,
+    batch_size: int = 1000,
+    returning: Optional[List[str]] = None,
+    commit: bool = True,
+    use_copy: bool = False
+):
+    """
+    Insert many rows with one executemany INSERT ... RETURNING per batch instead of a
+    round-trip and a commit per row.
+
+    A batch that violates a constraint is retried in halves inside savepoints until the
+    offending rows are isolated, so one bad row does not discard the others and every failure
+    is reported against its input row.
+
+    :param db: SQLAlchemy session
+    :param rows: Column values of the new rows
+    :param model: SQLAlchemy model class
+    :param batch_size: Rows per INSERT statement
+    :param returning: Fields returned for every inserted row, the primary key by default
+    :param commit: Commit once at the end; False leaves the rows in the caller's transaction
+    :param use_copy: Load through Postgres COPY, the fastest path for very large imports. COPY is
+                     all or nothing and returns nothing: a failure raises ValueError for the
+                     whole load and `rows` is left empty
+    :return: Dict with `rows` (the returned columns of each input row, None where it failed),
+             `inserted` (count) and `errors` (list of {'index', 'error'})
+    """
+    if use_copy:
+        return _copy_model_entries(db, rows, model, commit)
+
+    result = _bulk_result(rows)
+    statement = _insert_statement(model, returning)
+
+    def insert_batch(indexes, values):
+        try:
+            with db.begin_nested():
+                inserted = db.execute(statement, values).all()
+        except IntegrityError as e:
+            if len(values) == 1:
+                result['errors'].append({'index': indexes[0], 'error': str(e.orig)})
+                return
+            middle = len(values) // 2
+            insert_batch(indexes[:middle], values[:middle])
+            insert_batch(indexes[middle:], values[middle:])
+            return
+        for index, row in zip(indexes, inserted):
+            result['rows'][index] = row
+        result['inserted'] += len(inserted)
+
+    for indexes, values in _insert_batches(model, rows, batch_size):
+        insert_batch(indexes, values)
+    if commit:
+        db.commit()
+    result['errors'].sort(key=lambda error: error['index'])
+    return result
+
+
+def _copy_model_entries(db: Session, rows: List[dict], model: Any, commit: bool):
+    table, columns, records = _copy_rows(model, rows)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            _copy_csv(records)
+        )
+    except Exception as e:
+        db.rollback()
+        raise ValueError(f"Error copying {model.__name__} rows: {e}")
+    finally:
+        cursor.close()
+    if commit:
+        db.commit()
+    return {'rows': [], 'inserted': len(records), 'errors': []}
+
+
+async def create_model_entry_async(db: AsyncSession, data: dict, model: Any, commit: bool = True):
+    """
+    Async version of `create_model_entry` for an `AsyncSession`.
+
+    :param db: Async SQLAlchemy session
+    :param data: Column values of the new row
+    :param model: SQLAlchemy model class
+    :param commit: Commit and refresh the new row; False only flushes it (see `unit_of_work_async`)
+    :return: The created model instance
+    """
+    database = model(**data)
+    try:
+        db.add(database)
+        if commit:
+            await db.commit()
+            await db.refresh(database)
+        else:
+            await db.flush([database])
+        return database
+    except IntegrityError as e:
+        await db.rollback()
+        raise ValueError(f"Error creating {model.__name__}: {e.orig}")
+
+
+@asynccontextmanager
+async def unit_of_work_async(db: AsyncSession):
+    """
+    Async version of `unit_of_work`: commit once on exit, roll everything back on error.
+    """
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
+async def create_model_entries_async(
+    db: AsyncSession,
+    rows: List[dict],
+    model: Any,
+    batch_size: int = 1000,
+    returning: Optional[List[str]] = None,
+    commit: bool = True,
+    use_copy: bool = False
+):
+    """
+    Async version of `create_model_entries`; the COPY path uses asyncpg's binary COPY.
+    """
+    if use_copy:
+        table, columns, records = _copy_rows(model, rows)
+        connection = await db.connection()
+        raw = await connection.get_raw_connection()
+        try:
+            await raw.driver_connection.copy_records_to_table(table, records=records, columns=columns)
+        except Exception as e:
+            await db.rollback()
+            raise ValueError(f"Error copying {model.__name__} rows: {e}")
+        if commit:
+            await db.commit()
+        return {'rows': [], 'inserted': len(records), 'errors': []}
+
+    result = _bulk_result(rows)
+    statement = _insert_statement(model, returning)
+
+    async def insert_batch(indexes, values):
+        try:
+            async with db.begin_nested():
+                inserted = (await db.execute(statement, values)).all()
+        except IntegrityError as e:
+            if len(values) == 1:
+                result['errors'].append({'index': indexes[0], 'error': str(e.orig)})
+                return
+            middle = len(values) // 2
+            await insert_batch(indexes[:middle], values[:middle])
+            await insert_batch(indexes[middle:], values[middle:])
+            return
+        for index, row in zip(indexes, inserted):
+            result['rows'][index] = row
+        result['inserted'] += len(inserted)
+
+    for indexes, values in _insert_batches(model, rows, batch_size):
+        await insert_batch(indexes, values)
+    if commit:
+        await db.commit()
+    result['errors'].sort(key=lambda error: error['index'])
+    return result
@@ -1,9 +1,18 @@
+import logging
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from dotenv import load_dotenv
 
+from backend.app.core.config import (
+    SERVER_WORKERS, DB_MAX_CONNECTIONS, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    RULE_CACHE_LISTEN
+)
+from backend.app.core.metrics import timed_pool, register_engines
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -16,25 +25,97 @@ DB_PORT = "5433"
 
 # Build the SQLAlchemy database URL dynamically
 SQLALCHEMY_DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{DB_PORT}/{POSTGRES_DB}"
+# Same database through asyncpg, used by the API so queries do not block the event loop
+ASYNC_SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{DB_PORT}/{POSTGRES_DB}"
 
 if not SQLALCHEMY_DATABASE_URL:
     raise ValueError("SQLALCHEMY_DATABASE_URL is not set in the environment file")
 
-# Create the SQLAlchemy engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    pool_size=20,  # Increase pool size
-    max_overflow=10,  # Allow overflow connections
-    pool_timeout=30,  # Timeout after 30 seconds
-    pool_recycle=1800,  # Recycle connections every 30 minutes
-    pool_pre_ping=True,  # Automatically check if connections are alive before using
-    echo=False,  # Disable logging of SQL queries
-)
+# No request uses the sync engine; it is kept small and only serves scripts and one-off jobs
+SYNC_POOL_SIZE = 1
+SYNC_MAX_OVERFLOW = 1
+
+
+def pool_limits(workers: int = SERVER_WORKERS):
+    """
+    Pool size and overflow of one worker's async engine. Unless DB_POOL_SIZE and DB_MAX_OVERFLOW
+    are set, `workers` processes together stay within DB_MAX_CONNECTIONS, counting each worker's
+    sync pool and rule change listener connection.
 
+    :param workers: Worker processes sharing the database
+    :return: Tuple of (pool_size, max_overflow)
+    """
+    per_worker = DB_MAX_CONNECTIONS // max(workers, 1) - SYNC_POOL_SIZE - SYNC_MAX_OVERFLOW - int(RULE_CACHE_LISTEN)
+    pool_size = DB_POOL_SIZE or max(per_worker // 2, 1)
+    max_overflow = DB_MAX_OVERFLOW if DB_MAX_OVERFLOW >= 0 else max(per_worker - pool_size, 0)
+    if DB_POOL_SIZE == 0 and per_worker < 2:
+        logging.warning(
+            f"DB_MAX_CONNECTIONS={DB_MAX_CONNECTIONS} is too small for {workers} workers, "
+            f"each will still open up to {pool_size + max_overflow} async connections"
+        )
+    return pool_size, max_overflow
+
+
+# Engines are created by `init_engines` when a worker starts, not at import: the drivers are
+# loaded only by processes that use them, and a process that forks workers after importing
+# the app never hands them a connection pool it has already opened
+engine = None
+async_engine = None
 
+# Bound to the engines by `init_engines`
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+# Objects stay usable after commit; with an async session an expired attribute would need
+# an implicit query that cannot be awaited
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
-# Create a configured "Session" class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def init_engines():
+    """
+    Create the database engines and bind the session factories to them. Called on application
+    startup; does nothing if the engines already exist.
+    """
+    global engine, async_engine
+    if async_engine is not None:
+        return
+
+    pool_size, max_overflow = pool_limits()
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=timed_pool(QueuePool, "sync"),  # Reports checkout waits to /metrics
+        pool_size=SYNC_POOL_SIZE,
+        max_overflow=SYNC_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,  # Automatically check if connections are alive before using
+        echo=False,  # Disable logging of SQL queries
+    )
+    async_engine = create_async_engine(
+        ASYNC_SQLALCHEMY_DATABASE_URL,
+        poolclass=timed_pool(AsyncAdaptedQueuePool, "async"),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=False,
+    )
+    logging.info(f"Database pool of worker {os.getpid()}: {pool_size} connections, {max_overflow} overflow")
+    register_engines({"sync": engine, "async": async_engine.sync_engine})
+
+    SessionLocal.configure(bind=engine)
+    AsyncSessionLocal.configure(bind=async_engine)
+
+
+async def dispose_engines():
+    """
+    Close every pooled connection. Called on application shutdown.
+    """
+    global engine, async_engine
+    if async_engine is not None:
+        await async_engine.dispose()
+    if engine is not None:
+        engine.dispose()
+    engine = async_engine = None
 
 # Create a base class for your models
 Base = declarative_base()
@@ -49,3 +130,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency to provide an async database session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -2,7 +2,21 @@
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+
+from backend.app.core.config import (
+    REQUEST_MAX_BYTES, METRICS_ENABLED, PROFILING_ENABLED, PROFILING_DIR, PROFILING_MAX_PROFILES, PROFILING_HEADER,
+    PROFILING_TOKEN, PROFILING_SAMPLE_RATE
+)
+from backend.app.core.metrics import MetricsMiddleware, metrics_response
+from backend.app.core.profiling import ProfilingMiddleware
+from backend.app.core.upload_limits import RequestSizeLimitMiddleware
+from backend.app.db import init_engines, dispose_engines
 from backend.app.routers import backend_routers
+from backend.app.services.job_service import start_job_workers, stop_job_workers
+from backend.app.services.llm_service import close_llm_session
+from backend.app.services.pdf_service import shutdown_pdf_executor
+from backend.app.services.rescore_service import start_rescore_jobs, stop_rescore_jobs
+from backend.app.services.rule_cache import start_rule_listener, stop_rule_listener
 
 
 load_dotenv()
@@ -16,25 +30,76 @@ origins = [
 ]
 
 
-app = FastAPI(docs_url='/api/docs/')
+async def startup_services():
+    init_engines()
+    await start_job_workers()
+    await start_rule_listener()
+    await start_rescore_jobs()
 
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,  # List of allowed origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods
-    allow_headers=["*"],  # Allow all headers
-)
-
-app.include_router(backend_routers)
+async def shutdown_services():
+    await stop_job_workers()
+    await stop_rescore_jobs()
+    await stop_rule_listener()
+    await close_llm_session()
+    shutdown_pdf_executor()
+    await dispose_engines()
 
 
-@app.get("/health")
 async def health_check():
     return {"status": "ok"}  # Global health check
 
 
+async def metrics():
+    return metrics_response()  # Prometheus scrape endpoint
+
+
+def create_app() -> FastAPI:
+    """
+    Build the API application. The only place middleware, routes and lifecycle hooks are
+    registered; `uvicorn backend.app.main:app` and the root main.py serve the instance below,
+    `uvicorn --factory backend.app.main:create_app` builds a fresh one.
+
+    Database engines, PDF and scoring process pools and the LLM client are all created on
+    startup or first use, so building the app only costs the imports.
+    """
+    app = FastAPI(docs_url='/api/docs/')
+
+    # Refuse oversized uploads while they stream in, before they are spooled to disk
+    app.add_middleware(RequestSizeLimitMiddleware, max_bytes=REQUEST_MAX_BYTES)
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,  # List of allowed origins
+        allow_credentials=True,
+        allow_methods=["*"],  # Allow all HTTP methods
+        allow_headers=["*"],  # Allow all headers
+    )
+
+    if PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            directory=PROFILING_DIR,
+            max_profiles=PROFILING_MAX_PROFILES,
+            header=PROFILING_HEADER,
+            token=PROFILING_TOKEN,
+            sample_rate=PROFILING_SAMPLE_RATE
+        )
+
+    # Outermost, so the latency histograms include the time spent in the other middleware
+    if METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    app.include_router(backend_routers)
+
+    app.add_event_handler("startup", startup_services)
+    app.add_event_handler("shutdown", shutdown_services)
+
+    app.add_api_route("/health", health_check, methods=["GET"])
+    if METRICS_ENABLED:
+        app.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
+    return app
 
 
+app = create_app()
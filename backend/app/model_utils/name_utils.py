@@ -0,0 +1,16 @@
+import re
+
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_business_name(name):
+    """
+    Canonical form of a business name used for exact lookups: lower case, with every run of
+    punctuation or whitespace collapsed to one space. "ABC Traders Pvt. Ltd." and
+    "abc traders pvt ltd" normalize to the same value.
+
+    Must stay in sync with the SQL backfill in migration 9e4f2a6b3c11.
+    """
+    if name is None:
+        return None
+    return NON_ALPHANUMERIC.sub(" ", name.lower()).strip() or None
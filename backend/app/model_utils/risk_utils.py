@@ -0,0 +1,41 @@
+import re
+from datetime import datetime, timezone
+
+NON_DIGIT = re.compile(r"[^0-9]")
+
+
+def parse_credit_limit(credit_limit):
+    """
+    Rupee amount of a formatted credit limit such as "Rs 350,000"; None when there is no limit.
+    """
+    if credit_limit is None:
+        return None
+    if isinstance(credit_limit, (int, float)):
+        return int(credit_limit)
+    return int(NON_DIGIT.sub("", credit_limit) or 0) or None
+
+
+def pass_percentage(criteria):
+    """Share of criteria with result "Pass", as the rule engine computes it."""
+    if not criteria:
+        return 0.0
+    return sum(1 for criterion in criteria.values() if criterion.get("result") == "Pass") / len(criteria) * 100
+
+
+def risk_columns(risk_response, computed_at=None):
+    """
+    Values of the Business columns promoted out of a rule engine response, so the dashboard can
+    filter and sort on indexed columns instead of decoding risk_response.
+
+    Must stay in sync with the SQL backfill in migration d9b3f6c2a8e4.
+
+    :param risk_response: Output of `predict_risk_score_based_on_rule_engine`
+    :param computed_at: When the response was computed, now if omitted
+    :return: Dict with verdict, credit_limit, pass_percentage and response_computed_on
+    """
+    return {
+        'verdict': risk_response.get("verdict"),
+        'credit_limit': parse_credit_limit(risk_response.get("credit_limit")),
+        'pass_percentage': pass_percentage(risk_response.get("criteria")),
+        'response_computed_on': computed_at or datetime.now(timezone.utc)
+    }
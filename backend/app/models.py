@@ -1,9 +1,16 @@
+import enum
+
 import pytz
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import (
-    Column, Integer, String, Boolean, TIMESTAMP, Text, JSON, Enum as SQLAlchemyEnum, Float, func, DateTime
+    Column, Integer, String, Boolean, TIMESTAMP, Text, JSON, Enum as SQLAlchemyEnum, Float, func, DateTime, Index,
+    BigInteger, Date
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import validates
+
+from backend.app.model_utils.name_utils import normalize_business_name
 
 Base = declarative_base()
 
@@ -36,6 +43,12 @@ class DefaultTimeStamp(Base):
         return utc_dt.astimezone(ist_zone)
 
 
+class Verdict(str, enum.Enum):
+    APPROVED = "APPROVED"
+    REJECTED = "REJECTED"
+    NEEDS_MANUAL_REVIEW = "NEEDS_MANUAL_REVIEW"
+
+
 class Rule(DefaultTimeStamp):
     __tablename__ = "rules"
 
@@ -46,13 +59,32 @@ class Rule(DefaultTimeStamp):
 
 class Business(DefaultTimeStamp):
     __tablename__ = "business"
+    __table_args__ = (
+        Index('ix_business_created_at_id', 'created_at', 'id'),  # Keyset pagination of the evaluation log
+        Index('ix_business_verdict_created_at_id', 'verdict', 'created_at', 'id'),  # Evaluation log filtered by verdict
+        # The GIN index on risk_response -> 'criteria' is created by migration d9b3f6c2a8e4
+    )
+    # Return server-generated created_at from the INSERT, it decides the statistics bucket
+    __mapper_args__ = {'eager_defaults': True}
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     business_name = Column(String(255), nullable=False)
+    normalized_business_name = Column(String(255), nullable=True, unique=True, index=True)
     business_sector = Column(String(255), nullable=True)
     risk_score = Column(String(255), nullable=True)
-    risk_response = Column(JSON, nullable=True)
-    response_computed_on = Column(DateTime, nullable=True)
+    risk_response = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    response_computed_on = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Promoted out of risk_response when it is written, see model_utils.risk_utils.risk_columns
+    verdict = Column(SQLAlchemyEnum(Verdict, name="verdict"), nullable=True)
+    credit_limit = Column(BigInteger, nullable=True, index=True)  # Rupees, NULL unless approved
+    pass_percentage = Column(Float, nullable=True)
+    data_points = Column(JSON(none_as_null=True), nullable=True)  # Normalized rule engine inputs, for re-scoring without the PDFs
+
+    @validates('business_name')
+    def _set_normalized_business_name(self, key, value):
+        """Keep the indexed lookup column in sync whenever the name is set."""
+        self.normalized_business_name = normalize_business_name(value)
+        return value
 
 
 class DocumentData(DefaultTimeStamp):
@@ -62,6 +94,65 @@ class DocumentData(DefaultTimeStamp):
     type = Column(String(255), nullable=False)
     raw_response = Column(JSON, nullable=True)
     business_id = Column(Integer)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded file
+    extraction_version = Column(String(64), nullable=True)  # Prompt/model version that produced raw_response
+
+
+class EvaluationJob(DefaultTimeStamp):
+    __tablename__ = "evaluation_jobs"
+
+    id = Column(String(36), primary_key=True)  # UUID handed back to the client
+    status = Column(String(32), nullable=False, default="PENDING", index=True)
+    request_data = Column(JSON, nullable=False)  # Form fields of the upload
+    cibil_path = Column(String(1024), nullable=False)
+    gst_path = Column(String(1024), nullable=False)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class RescoreJob(DefaultTimeStamp):
+    __tablename__ = "rescore_jobs"
+
+    id = Column(String(36), primary_key=True)
+    rule_id = Column(Integer, nullable=False)  # Rule the portfolio is re-scored against
+    status = Column(String(32), nullable=False, default="PENDING", index=True)
+    total = Column(Integer, nullable=True)  # Businesses with stored data points
+    processed = Column(Integer, nullable=False, default=0)
+    changed = Column(Integer, nullable=False, default=0)  # Businesses whose verdict, credit limit or pass percentage changed
+    skipped = Column(Integer, nullable=False, default=0)  # Businesses evaluated before data points were stored
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class DailyVerdictStats(DefaultTimeStamp):
+    """
+    Evaluations per day, business sector and verdict, kept up to date by
+    `stats_service.record_evaluations` whenever a risk response is written.
+    """
+    __tablename__ = "daily_verdict_stats"
+
+    day = Column(Date, primary_key=True)  # Day the business was evaluated, in STATS_TIMEZONE
+    business_sector = Column(String(255), primary_key=True)  # Empty string when unknown
+    verdict = Column(SQLAlchemyEnum(Verdict, name="verdict"), primary_key=True)
+    evaluations = Column(Integer, nullable=False, default=0)
+    credit_limit_sum = Column(BigInteger, nullable=False, default=0)
+    credit_limit_count = Column(Integer, nullable=False, default=0)  # Evaluations with a credit limit
+
+
+class DailyCriterionFailures(DefaultTimeStamp):
+    """
+    Failed rule criteria per day and business sector, maintained alongside DailyVerdictStats.
+    """
+    __tablename__ = "daily_criterion_failures"
+
+    day = Column(Date, primary_key=True)
+    business_sector = Column(String(255), primary_key=True)
+    criterion = Column(String(255), primary_key=True)
+    failures = Column(Integer, nullable=False, default=0)
 
 
 class FeatureFlag(DefaultTimeStamp):
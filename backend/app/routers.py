@@ -1,23 +1,37 @@
-import io
+import hmac
 import logging
+from datetime import date, datetime, timedelta
+from typing import Optional
 
 import simplejson as json
 
-import openai
-from PyPDF2 import PdfReader
 from fastapi import (APIRouter, UploadFile, Form,
-                     File, Depends)
-from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
-
-from backend.app.crud.db_crud_operations import fetch_model_entries, create_model_entry
-from backend.app.db import get_db
-from backend.app.models import Business, DocumentData, Rule
-from backend.app.utils.rule_engine_utils import predict_risk_score_based_on_rule_engine
-
-openai.api_key = (
-    "sk-proj-yML_w4bVd34rEH1DHfSLpZzUIpAdC4hcFpj9YenGs-x-08ZuoMRlN5SOpqCwCvMu6wwn-TJTc5T3BlbkFJDaRppjEuqtQr"
-    "xq9gitgMIrATxpC-MLqp3gwsg8DWiI49xDoApZJKJqHH-_sanZTbBLby42xbcA")
+                     File, Depends, Request)
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse, Response, StreamingResponse, FileResponse, PlainTextResponse
+
+from backend.app.crud.db_crud_operations import create_model_entry_async, unit_of_work_async
+from backend.app.db import get_async_db
+from backend.app.models import Rule
+from backend.app.core.config import (
+    BUSINESS_FUZZY_SEARCH_ENABLED, BUSINESS_SEARCH_MAX_RESULTS, SIMULATION_MAX_CONFIGS, LOGS_PAGE_SIZE, LOGS_MAX_PAGE_SIZE,
+    STATS_DEFAULT_DAYS, STATS_MAX_DAYS, PROFILING_DIR, PROFILING_HEADER, PROFILING_TOKEN
+)
+from backend.app.core.profiling import list_profiles, profile_path, render_profile
+from backend.app.services.business_service import (
+    find_business_by_name, search_businesses, list_business_logs, stream_business_logs, InvalidCursor
+)
+from backend.app.services.evaluation_service import evaluate_business, BusinessAlreadyExists
+from backend.app.services.job_service import submit_job, get_job_status, JobQueueFull, JOB_PENDING
+from backend.app.services.rescore_service import create_rescore_job, schedule_rescore_job, get_rescore_status
+from backend.app.services.rule_cache import get_active_rule, set_active_rule, notify_rule_change
+from backend.app.services.simulation_service import simulate_rules
+from backend.app.services.stats_service import get_stats, today
+from backend.app.services.upload_service import spool_upload, remove_uploads, UploadTooLarge
+from backend.app.utils.rule_engine_utils import (
+    compile_rules, VERDICT_APPROVED, VERDICT_REJECTED, VERDICT_MANUAL_REVIEW
+)
 
 backend_routers = APIRouter()
 
@@ -32,7 +46,8 @@ async def upload_financial_docs(
         proprietor_age: int = Form(...),
         company_name: str = Form(...),
         rules: str = Form(...),
-        db: Session = Depends(get_db)
+        async_mode: bool = Form(False),
+        db: AsyncSession = Depends(get_async_db)
 ):
     try:
         rules_dict = json.loads(rules)
@@ -57,229 +72,357 @@ async def upload_financial_docs(
     #     "proprietor_age": "35"
     # }
 
-    used_business = (
-        db.query(Business)
-        .filter(Business.business_name.ilike(f"%{company_name}%"))
-        .first()
-    )
+    used_business = await find_business_by_name(db, company_name)
+    # Release the connection while the files are received from the client
+    await db.commit()
 
     if used_business:
         logging.info(f"Fetched from database cache for company:{company_name}")
         return {
             'business_name': used_business.business_name,
-            'risk_response': used_business.risk_response
+            'risk_response': used_business.risk_response,
+            'cache_hit': True
         }
 
-    # Create Business entry
-    business_data = {
-        'business_name': company_name,
-        'business_sector': "IT",
-        'risk_score': "Not evaluated"
-    }
-    business_object= create_model_entry(db, business_data, Business)
-
-
-    cibil_data = await cibil_file.read()
-    gst_data = await gst_file.read()
-
-    reader = PdfReader(io.BytesIO(cibil_data))
-    cibil_text = ""
-
-    for page in reader.pages:
-        cibil_text += page.extract_text() + "\n"
-
-    reader = PdfReader(io.BytesIO(gst_data))
-    gst_text = ""
-
-    for page in reader.pages:
-        gst_text += page.extract_text() + "\n"
-
-    final_data = {}
-
-    cibil_prompt = f"""
-        Below is a **CIBIL report**. Your task is to extract
-         **specific financial data points** from the CIBIL
-        content and return the result as a **valid JSON**.
-        ---
-        **CIBIL REPORT SNIPPET**:
-        {cibil_text}
-        Extract and return the following data points in JSON format:
-        1. dpd_30_plus_sma_1  (Meaning any entry where days past due is greater than 30)
-        2. dpd_60_plus_sma_2  (Meaning any entry where days past due is greater than 60)
-        3. dpd_90_plus_npa  (Meaning any entry where days past due is greater than 90)
-        4. adverse_remarks — return a list of adverse remarks with their type and source  
-        5. unsecured_credit_enquiries_90_days — number of unsecured credit inquiries in the last 90 days  
-        6. unsecured_loans_disbursed_3_months — number of unsecured loans disbursed in the last 3 months  
-        7. debt_more_than_one_year — total debt older than 1 year
-
-        Also, include a derived boolean summary like this:
-
-        ```json
-        1."is_30_plus_dpd": true/false(Give true when there is a days past due greater than 30),
-        2."is_60_plus_dpd": true/false(Give true when there is a days past due greater than 60),
-        3."is_90_plus_dpd": true/false(Give true when there is a days past due greater than 90),
-        4."adverse_remarks_present": true/false,
-        5."unsecured_credit_enquiries_in_last_90_days": true/false,
-        6."unsecured_number_of_loans_in_last_3_months": <integer>,
-        7."debt_gt_one_year": true/false
-        """
-    # Send the CIBIL text to the OpenAI API
-    cibil_response = openai.ChatCompletion.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": cibil_prompt}],
-        temperature=0.3,
-    )
-    if cibil_response:
-        cibil_data = cibil_response['choices'][0]['message']['content']
-
-    gst_prompt = f"""
-    **GST SNIPPET**:
-    {gst_text}
-    You are an expert at analyzing financial reports. Given a GST sales report, extract and calculate the following data points:
-    1. Turnover DIP Acceptance: Is there a drop or increase in recent 12-month sales compared to the previous 12-months? Mention the percentage change and whether it's acceptable.
-    2. Debt to Turnover: If total debt is provided, calculate debt/turnover ratio using the recent 12-month sales.
-    3. Last 12 Month Sales: Mention the total taxable value for the last 12 months.
-    4. Anchor Dependency: If customer-level sales data is available, calculate the percentage of total sales from the top customer(s).
-    5. Vintage with Anchor: Determine how long the business has been transacting with its key anchor customer.
-    Use accurate formulas and context from the data file. Return the result in structured JSON format.
-    Please always give response in this format:
-    This is the sample response format I expect:
-            {{
-      "Turnover DIP Acceptance": {{
-        "Percentage Change": "182%",
-        "Acceptable": "Yes"
-      }},
-      "Debt to Turnover Ratio": "27.89%",
-      "Last 12 Month Sales": "₹ 60,987,301.20",
-      "Anchor Dependency": "N/A",
-      "Vintage with Anchor": "N/A"
-    }}
-    """
-
-    gst_response = openai.ChatCompletion.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": gst_prompt}],
-        temperature=0.3,
-    )
+    try:
+        cibil_upload = await spool_upload(cibil_file)
+    except UploadTooLarge as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=413
+        )
+    try:
+        gst_upload = await spool_upload(gst_file)
+    except UploadTooLarge as e:
+        remove_uploads(cibil_upload)
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=413
+        )
 
-    if gst_response:
-        gst_data = gst_response['choices'][0]['message']['content']
+    if async_mode:
+        request_data = {
+            'business_vintage': business_vintage,
+            'co_applicant_age': co_applicant_age,
+            'proprietor_age': proprietor_age,
+            'company_name': company_name,
+            'rules': rules_dict
+        }
+        try:
+            job_id = await submit_job(db, cibil_upload, gst_upload, request_data)
+        except JobQueueFull as e:
+            remove_uploads(cibil_upload, gst_upload)
+            return JSONResponse(
+                content={"error": str(e)},
+                status_code=503
+            )
+        return JSONResponse(
+            content={
+                'job_id': job_id,
+                'status': JOB_PENDING,
+                'status_url': f"/jobs/{job_id}"
+            },
+            status_code=202
+        )
 
-    document_data = {
-        'type': "GST",
-        'raw_response': json.loads(gst_data),
-        'business_id': business_object.id
-    }
+    try:
+        return await evaluate_business(
+            db=db,
+            cibil_upload=cibil_upload,
+            gst_upload=gst_upload,
+            business_vintage=business_vintage,
+            co_applicant_age=co_applicant_age,
+            proprietor_age=proprietor_age,
+            company_name=company_name,
+            rules_dict=rules_dict
+        )
+    except BusinessAlreadyExists as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=409
+        )
+    finally:
+        remove_uploads(cibil_upload, gst_upload)
+
+@backend_routers.get("/jobs/{job_id}")
+async def fetch_job(
+        job_id: str,
+        wait: float = 0,
+        db: AsyncSession = Depends(get_async_db)
+):
+    job = await get_job_status(db, job_id, wait=wait)
+    if job is None:
+        return JSONResponse(
+            content={"error": "Job not found"},
+            status_code=404
+        )
+    return job
 
-    gst_data = json.loads(gst_data)
-    debt_to_turnover_ratio = gst_data.get('Debt_to_Turnover_Ratio') or gst_data.get('Debt to Turnover Ratio')
-    last_12_month_sales = gst_data.get('Last_12_Month_Sales_Total_Taxable_Value') or gst_data.get('Last 12 Month Sales')
-    turnover_dip_percent_change_config = gst_data.get('Turnover_DIP_Acceptance') or gst_data.get('Turnover DIP Acceptance')
-    turnover_dip_percent_change = turnover_dip_percent_change_config.get('Percentage_Change') or turnover_dip_percent_change_config.get('Percentage Change')
-    gst_data = {
-        'debt_to_turnover_ratio': float(debt_to_turnover_ratio.replace('%', '').strip()),
-        'business_vintage': business_vintage,
-        'applicant_age': co_applicant_age,
-        'proprietor_age': proprietor_age
-    }
-    print(f"turnover_dip_percent_change----------------",turnover_dip_percent_change)
-    print(f"last_12_month_sales_in_rs----------------",last_12_month_sales)
-    if turnover_dip_percent_change:
-        gst_data['turnover_dip_percent_change'] = float(
-            turnover_dip_percent_change.replace('%', '').strip())
-    if last_12_month_sales:
-        gst_data['last_12_month_sales_in_rs'] = float(last_12_month_sales.replace('₹', '').replace(',', '').strip())
-    print(f"Gst data---------------------{gst_data}",)
-    create_model_entry(db, document_data, DocumentData)
-    clean_cibil_data = cibil_data.strip().strip('```json').strip('```')
-    # Parse the cleaned string into a dictionary
-    cibil_data_dict = json.loads(clean_cibil_data)
-    fetched_data_points = cibil_data_dict.copy()
-    fetched_data_points.update(gst_data)  # Merge gst_data into fetched_data_points
-    # rules = {"is_30_plus_dpd": False,"is_60_plus_dpd": False,"is_90_plus_dpd": False,
-    #          "adverse_remarks_present": False,
-    #          "unsecured_credit_enquiries_90_days": 0,
-    #          "unsecured_loans_disbursed_3_months": 0,
-    #          "debt_gt_one_year": False,"turnover_dip_percent_change": 75,"last_12_month_sales_in_rs": "1000000","debt_to_turnover_ratio": "2","business_vintage": "2","applicant_age": "25","proprietor_age": "35"}
-    risk_response = predict_risk_score_based_on_rule_engine(fetched_data_points, rules_dict, strict=True)
-    # risk_response = predict_risk_score_based_on_rule_engine(fetched_data_points, parsed, strict=True)
-
-    document_data = {
-        'type': "CIBIL",
-        'raw_response': json.loads(clean_cibil_data),
-        'business_id': business_object.id
-    }
-    create_model_entry(db, document_data, DocumentData)
-    business_object.risk_response = risk_response
-    db.add(business_object)
-    db.commit()
 
+@backend_routers.get("/search/business")
+async def search_business(
+        q: str,
+        limit: int = 20,
+        db: AsyncSession = Depends(get_async_db)
+):
+    if not BUSINESS_FUZZY_SEARCH_ENABLED:
+        return JSONResponse(
+            content={"error": "Fuzzy business search is disabled"},
+            status_code=404
+        )
     return {
-        'business_name': business_object.business_name,
-        'risk_response': risk_response
+        "response": await search_businesses(db, q, min(max(limit, 1), BUSINESS_SEARCH_MAX_RESULTS))
     }
 
 
 @backend_routers.get("/fetch/logs")
 async def fetch_logs(
-        db: Session = Depends(get_db)
+        limit: int = LOGS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        verdict: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        format: str = "json",
+        db: AsyncSession = Depends(get_async_db)
 ):
-    business_list  =  fetch_model_entries(
-        db=db,
-        model=Business
-    )
-    response_list = []
-    for business_object in business_list:
-        response_data = {
-            'business_name': business_object.business_name,
-            'risk_response': business_object.risk_response
-        }
-        response_list.append(response_data)
+    if verdict is not None and verdict not in (VERDICT_APPROVED, VERDICT_REJECTED, VERDICT_MANUAL_REVIEW):
+        return JSONResponse(
+            content={"error": f"Unknown verdict: {verdict}"},
+            status_code=400
+        )
+    if format not in ("json", "ndjson"):
+        return JSONResponse(
+            content={"error": "format must be json or ndjson"},
+            status_code=400
+        )
+    try:
+        if format == "ndjson":
+            # Everything that matches, streamed from a server-side cursor
+            return StreamingResponse(
+                stream_business_logs(cursor, verdict, created_from, created_to),
+                media_type="application/x-ndjson"
+            )
+        return await list_business_logs(
+            db, min(max(limit, 1), LOGS_MAX_PAGE_SIZE), cursor, verdict, created_from, created_to
+        )
+    except InvalidCursor as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=400
+        )
+
+
+@backend_routers.get("/stats")
+async def fetch_stats(
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        db: AsyncSession = Depends(get_async_db)
+):
+    date_to = date_to or today()
+    date_from = date_from or date_to - timedelta(days=STATS_DEFAULT_DAYS - 1)
+    if date_from > date_to:
+        return JSONResponse(
+            content={"error": "date_from must not be after date_to"},
+            status_code=400
+        )
+    if (date_to - date_from).days >= STATS_MAX_DAYS:
+        return JSONResponse(
+            content={"error": f"At most {STATS_MAX_DAYS} days can be requested at once"},
+            status_code=400
+        )
     return {
-        "response": response_list
+        "response": await get_stats(db, date_from, date_to)
     }
 
 
 @backend_routers.get("/fetch/default")
 async def fetch_default(
-        db: Session = Depends(get_db)
+        request: Request
 ):
-    rule  =  fetch_model_entries(
-        filter_data={
-            'is_enabled': True
+    # Served from the process-local rule cache, no database round-trip in steady state
+    rule = await get_active_rule()
+    if rule is None:
+        return JSONResponse(
+            content={"error": "No active rule"},
+            status_code=404
+        )
+    headers = {
+        'ETag': rule['etag'],
+        'Cache-Control': 'no-cache'
+    }
+    if _etag_matches(request.headers.get('if-none-match'), rule['etag']):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(
+        content={
+            "response": rule['rule_config'],
+            "version": rule['version']
         },
-        db=db,
-        model=Rule,
-        fetch_one=True
+        headers=headers
     )
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    # If-None-Match uses weak comparison
+    return '*' in tags or etag in [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+
+@backend_routers.post("/update/default")
+async def update_default(
+        request: Request,
+        db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        body = await request.json()
+    except ValueError:
+        return JSONResponse(
+            content={"error": "Invalid JSON string"},
+            status_code=400
+        )
+    rule_config = body.get('rule_config') if isinstance(body, dict) else None
+    if not isinstance(rule_config, dict):
+        return JSONResponse(
+            content={"error": "rule_config must be a JSON object"},
+            status_code=400
+        )
+    try:
+        compile_rules(rule_config)
+    except (TypeError, ValueError) as e:
+        return JSONResponse(
+            content={"error": f"Invalid rule_config: {e}"},
+            status_code=400
+        )
+
+    # Swap the active rule and queue the portfolio re-score in one transaction
+    async with unit_of_work_async(db):
+        await db.execute(
+            update(Rule)
+            .filter(Rule.is_enabled == True)
+            .values(is_enabled=False)
+            .execution_options(synchronize_session=False)
+        )
+        rule_data = {
+            'rule_config': rule_config,
+            'is_enabled': True
+        }
+        rule = await create_model_entry_async(db, rule_data, Rule, commit=False)
+        rescore_job = await create_rescore_job(db, rule.id)
+        # Delivered to the other workers when the transaction commits
+        await notify_rule_change(db, rule.id)
+    set_active_rule(rule)
+    schedule_rescore_job(rescore_job.id)
+
     return {
-        "response": rule.rule_config
+        "response": rule.rule_config,
+        "version": rule.id,
+        "rescore_job_id": rescore_job.id,
+        "status_url": f"/rescore/{rescore_job.id}"
     }
 
-# TODO: fetching rule from input string, to be fetched as dictionary
-from fastapi import Request
-@backend_routers.post("/update/default")
-async def fetch_logs(
-        request: Request,db: Session = Depends(get_db)
 
+@backend_routers.get("/rescore/{job_id}")
+async def fetch_rescore_job(
+        job_id: str,
+        db: AsyncSession = Depends(get_async_db)
 ):
-    rule_config = request.rule_config
+    job = await get_rescore_status(db, job_id)
+    if job is None:
+        return JSONResponse(
+            content={"error": "Rescore job not found"},
+            status_code=404
+        )
+    return job
 
-    rule  =  fetch_model_entries(
-        filter_data={
-            'is_enabled': True
-        },
-        db=db,
-        model=Rule
-    )
-    rule.is_enabled = False
-    rule_data = {
-        'rule_config': rule_config,
-        'is_enabled': True
+
+@backend_routers.post("/simulate/rules")
+async def simulate_rule_changes(
+        request: Request,
+        db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        body = await request.json()
+    except ValueError:
+        return JSONResponse(
+            content={"error": "Invalid JSON string"},
+            status_code=400
+        )
+    rule_configs = body.get('rule_configs') if isinstance(body, dict) else None
+    if (not isinstance(rule_configs, list) or not rule_configs
+            or not all(isinstance(rule_config, dict) for rule_config in rule_configs)):
+        return JSONResponse(
+            content={"error": "rule_configs must be a non-empty list of JSON objects"},
+            status_code=400
+        )
+    if len(rule_configs) > SIMULATION_MAX_CONFIGS:
+        return JSONResponse(
+            content={"error": f"At most {SIMULATION_MAX_CONFIGS} rule configs can be simulated at once"},
+            status_code=400
+        )
+    for index, rule_config in enumerate(rule_configs):
+        try:
+            compile_rules(rule_config)
+        except (TypeError, ValueError) as e:
+            return JSONResponse(
+                content={"error": f"Invalid rule config at index {index}: {e}"},
+                status_code=400
+            )
+
+    return {
+        "response": await simulate_rules(db, rule_configs, strict=bool(body.get('strict', True)))
     }
-    create_model_entry(db, rule_data, Rule)
-    db.add(rule)
-    db.commit()
+
+
+def _profiles_forbidden(request: Request):
+    # Profiles expose code paths and timings, so they need the same token that triggers them
+    if not PROFILING_TOKEN:
+        return JSONResponse(
+            content={"error": "Request profiling is not configured"},
+            status_code=404
+        )
+    if not hmac.compare_digest(request.headers.get(PROFILING_HEADER, "").encode(), PROFILING_TOKEN.encode()):
+        return JSONResponse(
+            content={"error": f"Missing or invalid {PROFILING_HEADER} header"},
+            status_code=403
+        )
+    return None
+
+
+@backend_routers.get("/profiles")
+async def fetch_profiles(
+        request: Request
+):
+    forbidden = _profiles_forbidden(request)
+    if forbidden:
+        return forbidden
     return {
-        "response": rule.rule_config
-    }
\ No newline at end of file
+        "response": list_profiles(PROFILING_DIR)
+    }
+
+
+@backend_routers.get("/profiles/{profile_id}")
+async def download_profile(
+        profile_id: str,
+        request: Request,
+        format: str = "prof",
+        sort: str = "cumulative"
+):
+    forbidden = _profiles_forbidden(request)
+    if forbidden:
+        return forbidden
+    path = profile_path(PROFILING_DIR, profile_id)
+    if path is None:
+        return JSONResponse(
+            content={"error": "Profile not found"},
+            status_code=404
+        )
+    if format == "text":
+        try:
+            return PlainTextResponse(render_profile(path, sort=sort))
+        except KeyError:
+            return JSONResponse(
+                content={"error": f"Unknown sort key: {sort}"},
+                status_code=400
+            )
+    # pstats dump, for snakeviz, flameprof or pstats.Stats
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
@@ -0,0 +1,253 @@
+"""
+Production entrypoint: a pre-forking supervisor that serves the API from one uvicorn worker
+per CPU on a shared listening socket.
+
+    python -m backend.app.server
+    python -m backend.app.server --workers 8 --port 8000
+
+Settings come from backend/app/core/config.py (SERVER_*, DB_*); the flags override the
+matching environment variables. Linux and macOS only, workers are forked.
+
+- The app and the modules it loads lazily are imported once by the supervisor before forking
+  (SERVER_PRELOAD), so workers share those pages copy-on-write and start in milliseconds.
+  Database pools, process pools and the LLM session are created inside each worker.
+- Database connections (DB_MAX_CONNECTIONS) and, unless PDF_WORKERS or RESCORE_WORKERS are
+  set, the CPUs for the PDF and re-scoring process pools are divided between the workers.
+- uvloop and httptools are used when installed, the asyncio loop and h11 otherwise.
+- SIGHUP starts a new generation of workers, then gracefully stops the old one; with
+  SERVER_PRELOAD=false the new workers import the application afresh, picking up code changes.
+- SIGTERM or SIGINT stop every worker gracefully, waiting up to SERVER_GRACEFUL_TIMEOUT.
+- A worker that exits is replaced; a worker that fails during startup stops the server.
+"""
+import argparse
+import gc
+import importlib
+import logging
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+
+from dotenv import load_dotenv
+
+# Modules the workers import on first use; preloading puts them in the shared pages
+PRELOAD_MODULES = ("openai", "aiohttp", "PyPDF2", "pdfplumber", "numpy", "pandas")
+
+# uvicorn exits a worker with this code when the application's startup fails
+STARTUP_FAILURE = 3
+
+
+def _available(module):
+    try:
+        importlib.import_module(module)
+        return True
+    except ImportError:
+        return False
+
+
+class Supervisor:
+    """
+    Fork and watch the worker processes. Signals only queue an action; the main loop acts on
+    it, so no work runs inside a signal handler.
+    """
+
+    def __init__(self, config, workers: int, graceful_timeout: int, metrics_directory=None):
+        self.config = config
+        self.worker_count = workers
+        self.graceful_timeout = graceful_timeout
+        self.metrics_directory = metrics_directory
+        self.socket = None
+        self.workers = {}  # pid -> generation
+        self.generation = 0
+        self.actions = []
+        self.stopping = False
+        self.exit_code = 0
+
+    def spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self.workers[pid] = self.generation
+
+    def _run_worker(self):
+        import uvicorn
+
+        code = 1
+        try:
+            # The terminal's hangup belongs to the supervisor; uvicorn handles SIGINT and SIGTERM
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[self.socket])
+            code = 0 if server.started else STARTUP_FAILURE
+        except BaseException:
+            logging.exception(f"Worker {os.getpid()} crashed")
+        finally:
+            os._exit(code)
+
+    def _queue(self, action):
+        def handler(signum, frame):
+            self.actions.append(action)
+        return handler
+
+    def _reap(self):
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            generation = self.workers.pop(pid, None)
+            if generation is None:
+                continue
+            if self.metrics_directory:
+                from prometheus_client import multiprocess
+
+                multiprocess.mark_process_dead(pid)  # Drops its in-progress gauge values
+            code = os.waitstatus_to_exitcode(status)
+            if self.stopping or generation != self.generation:
+                continue
+            if code == STARTUP_FAILURE:
+                if self.exit_code != STARTUP_FAILURE:
+                    logging.error(f"Worker {pid} failed to start, stopping the server")
+                    self.exit_code = STARTUP_FAILURE
+                    self.actions.append("stop")
+                continue
+            if code == 0:
+                logging.info(f"Worker {pid} exited after SERVER_MAX_REQUESTS, starting a replacement")
+            else:
+                logging.warning(f"Worker {pid} exited with code {code}, starting a replacement")
+            self.spawn()
+
+    def reload(self):
+        old = [pid for pid, generation in self.workers.items() if generation == self.generation]
+        self.generation += 1
+        logging.info(f"Reloading: starting {self.worker_count} workers, then stopping {len(old)}")
+        for _ in range(self.worker_count):
+            self.spawn()
+        for pid in old:
+            self._signal(pid, signal.SIGTERM)
+
+    def stop(self):
+        self.stopping = True
+        for pid in list(self.workers):
+            self._signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.workers):
+            logging.warning(f"Worker {pid} did not stop in time, killing it")
+            self._signal(pid, signal.SIGKILL)
+        self._reap()
+
+    @staticmethod
+    def _signal(pid, signum):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def run(self):
+        self.socket = self.config.bind_socket()
+        signal.signal(signal.SIGTERM, self._queue("stop"))
+        signal.signal(signal.SIGINT, self._queue("stop"))
+        signal.signal(signal.SIGHUP, self._queue("reload"))
+
+        logging.info(f"Supervisor {os.getpid()} starting {self.worker_count} workers")
+        for _ in range(self.worker_count):
+            self.spawn()
+        try:
+            while not self.stopping:
+                while self.actions and not self.stopping:
+                    action = self.actions.pop(0)
+                    if action == "stop":
+                        self.stop()
+                    elif action == "reload":
+                        self.reload()
+                self._reap()
+                time.sleep(0.2)
+        finally:
+            if not self.stopping:
+                self.stop()
+            self.socket.close()
+        return self.exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", help="Overrides SERVER_HOST")
+    parser.add_argument("--port", type=int, help="Overrides SERVER_PORT")
+    parser.add_argument("--workers", type=int, help="Overrides SERVER_WORKERS")
+    args = parser.parse_args()
+
+    # Settings are read when the config module is imported, and workers size their database
+    # pools from SERVER_WORKERS, so the flags go through the environment first
+    for name, value in (("SERVER_HOST", args.host), ("SERVER_PORT", args.port), ("SERVER_WORKERS", args.workers)):
+        if value is not None:
+            os.environ[name] = str(value)
+
+    # Every worker starts its own PDF and re-scoring process pools, which default to one
+    # process per CPU; unless they are set explicitly, split the CPUs between the workers
+    load_dotenv()
+    cpus = os.cpu_count() or 1
+    workers = int(os.getenv("SERVER_WORKERS", "0")) or cpus
+    for name in ("PDF_WORKERS", "RESCORE_WORKERS"):
+        os.environ.setdefault(name, str(max(1, cpus // workers)))
+
+    from backend.app.core.config import (
+        SERVER_HOST, SERVER_PORT, SERVER_WORKERS, SERVER_PRELOAD, SERVER_GRACEFUL_TIMEOUT, SERVER_KEEPALIVE,
+        SERVER_BACKLOG, SERVER_MAX_REQUESTS, METRICS_ENABLED
+    )
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(levelname)s %(message)s")
+
+    # Metrics must go to files shared by every worker; prometheus_client reads this variable
+    # when it is first imported, so before the app is
+    metrics_directory = None
+    if METRICS_ENABLED and SERVER_WORKERS > 1 and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        metrics_directory = tempfile.mkdtemp(prefix="prometheus_")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_directory
+
+    import uvicorn
+
+    app = "backend.app.main:app"
+    if SERVER_PRELOAD:
+        from backend.app.main import app
+
+        for module in PRELOAD_MODULES:
+            _available(module)
+        # Objects created so far are never collected, so the collector does not write to
+        # their headers and un-share the pages workers inherited
+        gc.freeze()
+
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    logging.info(f"Serving on {SERVER_HOST}:{SERVER_PORT} with {loop} and {http}")
+
+    config = uvicorn.Config(
+        app,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        backlog=SERVER_BACKLOG,
+        timeout_keep_alive=SERVER_KEEPALIVE,
+        timeout_graceful_shutdown=SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=SERVER_MAX_REQUESTS or None,
+        access_log=False,
+    )
+    supervisor = Supervisor(config, SERVER_WORKERS, SERVER_GRACEFUL_TIMEOUT, metrics_directory)
+    try:
+        code = supervisor.run()
+    finally:
+        if metrics_directory:
+            shutil.rmtree(metrics_directory, ignore_errors=True)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
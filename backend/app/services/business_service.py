@@ -0,0 +1,161 @@
+import base64
+import binascii
+from datetime import datetime
+
+import simplejson as json
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import LOGS_STREAM_BATCH_SIZE
+from backend.app.crud.db_crud_operations import fetch_model_entries_async
+from backend.app.db import AsyncSessionLocal
+from backend.app.model_utils.name_utils import normalize_business_name
+from backend.app.models import Business
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+async def find_business_by_name(db: AsyncSession, business_name: str):
+    """
+    Exact lookup on the unique normalized-name index.
+
+    :param db: Async SQLAlchemy session
+    :param business_name: Name as entered by the user
+    :return: The matching Business, or None
+    """
+    normalized = normalize_business_name(business_name)
+    if normalized is None:
+        return None
+    return await fetch_model_entries_async(
+        db=db,
+        model=Business,
+        filter_data={
+            'normalized_business_name': normalized
+        },
+        fetch_one=True
+    )
+
+
+async def search_businesses(db: AsyncSession, query: str, limit: int):
+    """
+    Fuzzy name search ranked by trigram similarity. The `%` operator lets Postgres answer
+    from the pg_trgm GIN index instead of scanning the table.
+
+    :param db: Async SQLAlchemy session
+    :param query: Partial or misspelt business name
+    :param limit: Maximum number of matches
+    :return: List of dicts with id, business_name, business_sector and similarity
+    """
+    normalized = normalize_business_name(query)
+    if normalized is None:
+        return []
+    similarity = func.similarity(Business.normalized_business_name, normalized)
+    result = await db.execute(
+        select(Business.id, Business.business_name, Business.business_sector, similarity.label('similarity'))
+        .filter(Business.normalized_business_name.op('%')(normalized))
+        .order_by(similarity.desc())
+        .limit(limit)
+    )
+    rows = result.all()
+    return [
+        {
+            'id': row.id,
+            'business_name': row.business_name,
+            'business_sector': row.business_sector,
+            'similarity': round(float(row.similarity), 3)
+        }
+        for row in rows
+    ]
+
+
+def encode_logs_cursor(created_at: datetime, business_id: int) -> str:
+    """Opaque keyset cursor pointing just after the given row."""
+    position = json.dumps([created_at.isoformat(), business_id])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_logs_cursor(cursor: str):
+    try:
+        created_at, business_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(business_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise InvalidCursor("Invalid cursor")
+
+
+def _logs_query(verdict=None, created_from=None, created_to=None, cursor=None):
+    # Only the columns the log needs, newest first, in the order of the (created_at, id) index
+    query = select(Business.id, Business.business_name, Business.risk_response, Business.created_at)
+    if verdict is not None:
+        query = query.filter(Business.verdict == verdict)
+    if created_from is not None:
+        query = query.filter(Business.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(Business.created_at < created_to)
+    if cursor is not None:
+        query = query.filter(tuple_(Business.created_at, Business.id) < tuple_(*decode_logs_cursor(cursor)))
+    return query.order_by(Business.created_at.desc(), Business.id.desc())
+
+
+def _log_entry(row):
+    return {
+        'id': row.id,
+        'business_name': row.business_name,
+        'risk_response': row.risk_response,
+        'created_at': row.created_at.isoformat() if row.created_at else None
+    }
+
+
+async def list_business_logs(db: AsyncSession, limit: int, cursor: str = None, verdict: str = None,
+                             created_from: datetime = None, created_to: datetime = None):
+    """
+    One page of evaluated businesses, newest first, using keyset pagination on (created_at, id).
+
+    :param db: Async SQLAlchemy session
+    :param limit: Page size
+    :param cursor: `next_cursor` of the previous page, None for the first page
+    :param verdict: Only businesses with this verdict
+    :param created_from: Only businesses created at or after this time
+    :param created_to: Only businesses created before this time
+    :return: Dict with the page under `response` and `next_cursor` (None on the last page)
+    :raises InvalidCursor: If the cursor was not produced by this endpoint
+    """
+    query = _logs_query(verdict, created_from, created_to, cursor)
+    # One extra row tells whether another page exists
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_logs_cursor(rows[-1].created_at, rows[-1].id)
+    return {
+        'response': [_log_entry(row) for row in rows],
+        'next_cursor': next_cursor
+    }
+
+
+def stream_business_logs(cursor: str = None, verdict: str = None,
+                         created_from: datetime = None, created_to: datetime = None):
+    """
+    Every matching business as NDJSON, one object per line, newest first.
+
+    Rows are read through a server-side cursor LOGS_STREAM_BATCH_SIZE at a time, so memory use
+    does not grow with the table. Runs on its own session because the response outlives the
+    request's dependencies.
+
+    :param cursor: Resume after the row this cursor points to
+    :param verdict: Only businesses with this verdict
+    :param created_from: Only businesses created at or after this time
+    :param created_to: Only businesses created before this time
+    :return: Async iterator of NDJSON chunks
+    :raises InvalidCursor: If the cursor was not produced by this endpoint (raised immediately,
+                           before anything is streamed)
+    """
+    return _stream_logs(_logs_query(verdict, created_from, created_to, cursor))
+
+
+async def _stream_logs(query):
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=LOGS_STREAM_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield ''.join(json.dumps(_log_entry(row)) + '\n' for row in rows)
@@ -0,0 +1,94 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import GST_PARSER_ENABLED, PDF_BACKENDS_BY_TYPE
+from backend.app.core.metrics import stage
+from backend.app.services.extraction_cache import (
+    get_cached_text, set_cached_text, get_cached_result, set_cached_result
+)
+from backend.app.services.gst_parser import parse_gst_report, GST_PARSER_VERSION
+from backend.app.services.llm_service import extract_cibil_data, extract_gst_data, PROMPT_VERSIONS
+from backend.app.services.pdf_service import extract_text
+
+EXTRACTORS = {
+    "CIBIL": extract_cibil_data,
+    "GST": extract_gst_data,
+}
+
+# Deterministic parsers tried before the LLM; they return None when they cannot handle a document
+LOCAL_PARSERS = {
+    "GST": (parse_gst_report, GST_PARSER_VERSION),
+} if GST_PARSER_ENABLED else {}
+
+
+def _extraction_versions(doc_type):
+    versions = []
+    if doc_type in LOCAL_PARSERS:
+        versions.append(LOCAL_PARSERS[doc_type][1])
+    versions.append(PROMPT_VERSIONS[doc_type])
+    return versions
+
+
+async def _extract_with_llm(doc_type, upload):
+    backend = PDF_BACKENDS_BY_TYPE.get(doc_type)
+    text_key = (upload['content_hash'], backend)
+    text = get_cached_text(text_key)
+    if text is None:
+        with stage(f"pdf_text_{doc_type}"):
+            text = await extract_text(upload['path'], backend=backend)
+        set_cached_text(text_key, text)
+    with stage(f"llm_{doc_type}"):
+        raw_response = await EXTRACTORS[doc_type](text)
+    return raw_response, PROMPT_VERSIONS[doc_type]
+
+
+async def _extract_document(doc_type: str, upload: dict):
+    if doc_type in LOCAL_PARSERS:
+        parser, version = LOCAL_PARSERS[doc_type]
+        with stage(f"local_parser_{doc_type}"):
+            raw_response = await parser(upload['path'])
+        if raw_response is not None:
+            return raw_response, version
+    return await _extract_with_llm(doc_type, upload)
+
+
+async def extract_documents(db: AsyncSession, documents: dict):
+    """
+    Extract data points from each uploaded document, reusing cached results for identical files.
+
+    Documents are processed concurrently; a cache hit skips both PDF parsing and the LLM call.
+    Document types with a local parser (GST) only go to the LLM when that parser gives up.
+    The session's transaction is committed after the cache lookups, before any extraction.
+
+    :param db: Async SQLAlchemy session
+    :param documents: Mapping of document type ("CIBIL", "GST") to a spooled upload
+                      (see `upload_service.spool_upload`)
+    :return: Mapping of document type to a dict with raw_response, content_hash,
+             extraction_version and cache ("memory", "database" or "miss")
+    """
+    # An AsyncSession cannot run queries concurrently, so the cache is checked one document
+    # at a time; only the expensive extractions run in parallel
+    results = {}
+    for doc_type, upload in documents.items():
+        with stage("extraction_cache_lookup"):
+            raw_response, source, version = await get_cached_result(
+                db, doc_type, upload['content_hash'], _extraction_versions(doc_type)
+            )
+        results[doc_type] = {
+            'raw_response': raw_response,
+            'content_hash': upload['content_hash'],
+            'extraction_version': version,
+            'cache': source or "miss"
+        }
+
+    # End the read transaction the lookups (and the caller's earlier queries) opened, so the
+    # session's connection goes back to the pool for the seconds PDF parsing and the LLM take
+    await db.commit()
+
+    misses = [doc_type for doc_type, result in results.items() if result['raw_response'] is None]
+    extracted = await asyncio.gather(*[_extract_document(doc_type, documents[doc_type]) for doc_type in misses])
+    for doc_type, (raw_response, version) in zip(misses, extracted):
+        set_cached_result(doc_type, documents[doc_type]['content_hash'], version, raw_response)
+        results[doc_type].update(raw_response=raw_response, extraction_version=version)
+    return results
@@ -0,0 +1,131 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.metrics import stage
+
+from backend.app.crud.db_crud_operations import create_model_entry_async, unit_of_work_async
+from backend.app.model_utils.risk_utils import risk_columns
+from backend.app.models import Business, DocumentData
+from backend.app.services.document_service import extract_documents
+from backend.app.services.stats_service import record_evaluations
+from backend.app.utils.rule_engine_utils import predict_risk_score_based_on_rule_engine
+
+
+class BusinessAlreadyExists(Exception):
+    """Raised when another upload created a business with the same normalized name first."""
+
+
+def _parse_number(value):
+    """Parse values like "27.89%" or "₹ 60,987,301.20"; None when absent or not numeric."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).replace('%', '').replace('₹', '').replace(',', '').strip())
+    except ValueError:
+        return None
+
+
+async def evaluate_business(
+        db: AsyncSession,
+        cibil_upload: dict,
+        gst_upload: dict,
+        business_vintage: int,
+        co_applicant_age: int,
+        proprietor_age: int,
+        company_name: str,
+        rules_dict: dict
+):
+    """
+    Run the full evaluation pipeline for one applicant: extract the CIBIL and GST data points,
+    apply the rule engine and persist the business with its documents.
+
+    :param db: Async SQLAlchemy session
+    :param cibil_upload: Spooled CIBIL report (see `upload_service.spool_upload`)
+    :param gst_upload: Spooled GST report
+    :param rules_dict: Rule configuration to evaluate against
+    :return: Upload response with business_name, risk_response and cache details
+    """
+    with stage("extract_documents"):
+        extracted = await extract_documents(db, {"CIBIL": cibil_upload, "GST": gst_upload})
+    cibil_extraction = extracted["CIBIL"]
+    gst_extraction = extracted["GST"]
+
+    gst_data = gst_extraction['raw_response']
+    debt_to_turnover_ratio = gst_data.get('Debt_to_Turnover_Ratio') or gst_data.get('Debt to Turnover Ratio')
+    last_12_month_sales = gst_data.get('Last_12_Month_Sales_Total_Taxable_Value') or gst_data.get('Last 12 Month Sales')
+    turnover_dip_percent_change_config = gst_data.get('Turnover_DIP_Acceptance') or gst_data.get('Turnover DIP Acceptance')
+    turnover_dip_percent_change = turnover_dip_percent_change_config.get('Percentage_Change') or turnover_dip_percent_change_config.get('Percentage Change')
+    gst_data = {
+        'business_vintage': business_vintage,
+        'applicant_age': co_applicant_age,
+        'proprietor_age': proprietor_age
+    }
+    logging.debug(f"turnover_dip_percent_change: {turnover_dip_percent_change}")
+    logging.debug(f"last_12_month_sales_in_rs: {last_12_month_sales}")
+    # Values the report does not support come back as "N/A" and are left to the rule engine as missing
+    debt_to_turnover_ratio = _parse_number(debt_to_turnover_ratio)
+    if debt_to_turnover_ratio is not None:
+        gst_data['debt_to_turnover_ratio'] = debt_to_turnover_ratio
+    turnover_dip_percent_change = _parse_number(turnover_dip_percent_change)
+    if turnover_dip_percent_change is not None:
+        gst_data['turnover_dip_percent_change'] = turnover_dip_percent_change
+    last_12_month_sales = _parse_number(last_12_month_sales)
+    if last_12_month_sales is not None:
+        gst_data['last_12_month_sales_in_rs'] = last_12_month_sales
+    logging.debug(f"Gst data: {gst_data}")
+    cibil_data_dict = cibil_extraction['raw_response']
+    fetched_data_points = cibil_data_dict.copy()
+    fetched_data_points.update(gst_data)  # Merge gst_data into fetched_data_points
+    # rules = {"is_30_plus_dpd": False,"is_60_plus_dpd": False,"is_90_plus_dpd": False,
+    #          "adverse_remarks_present": False,
+    #          "unsecured_credit_enquiries_90_days": 0,
+    #          "unsecured_loans_disbursed_3_months": 0,
+    #          "debt_gt_one_year": False,"turnover_dip_percent_change": 75,"last_12_month_sales_in_rs": "1000000","debt_to_turnover_ratio": "2","business_vintage": "2","applicant_age": "25","proprietor_age": "35"}
+    with stage("rule_engine"):
+        risk_response = predict_risk_score_based_on_rule_engine(fetched_data_points, rules_dict, strict=True)
+    # risk_response = predict_risk_score_based_on_rule_engine(fetched_data_points, parsed, strict=True)
+
+    # Nothing is written until the evaluation has succeeded, so a failed extraction leaves no
+    # half-written business behind; the rows below go out in one transaction and one commit
+    with stage("db_write"):
+        async with unit_of_work_async(db):
+            business_data = {
+                'business_name': company_name,
+                'business_sector': "IT",
+                'risk_score': "Not evaluated",
+                'risk_response': risk_response,
+                'data_points': fetched_data_points,
+                **risk_columns(risk_response)
+            }
+            try:
+                business_object = await create_model_entry_async(db, business_data, Business, commit=False)
+            except ValueError as e:
+                # Unique normalized name: a concurrent upload for the same company won the insert
+                raise BusinessAlreadyExists(f"Business '{company_name}' is already being evaluated") from e
+            await record_evaluations(
+                db, added=[(business_object.created_at, business_object.business_sector, risk_response)]
+            )
+
+            # Both documents are written by the final flush as a single multi-row INSERT
+            db.add_all([
+                DocumentData(
+                    type=doc_type,
+                    raw_response=extraction['raw_response'],
+                    content_hash=extraction['content_hash'],
+                    extraction_version=extraction['extraction_version'],
+                    business_id=business_object.id
+                )
+                for doc_type, extraction in (("GST", gst_extraction), ("CIBIL", cibil_extraction))
+            ])
+
+    return {
+        'business_name': company_name,
+        'risk_response': risk_response,
+        'cache_hit': cibil_extraction['cache'] != "miss" and gst_extraction['cache'] != "miss",
+        'cache': {
+            'CIBIL': cibil_extraction['cache'],
+            'GST': gst_extraction['cache']
+        }
+    }
+
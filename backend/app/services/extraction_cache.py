@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import (
+    EXTRACTION_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_TTL, EXTRACTION_CACHE_DB_TTL
+)
+from backend.app.crud.db_crud_operations import fetch_model_entries_async
+from backend.app.models import DocumentData
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with an optional per-entry TTL.
+    """
+
+    def __init__(self, max_entries, ttl_seconds=0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Extracted text depends on the file and backend, LLM results on the file and prompt version
+_text_cache = LRUCache(EXTRACTION_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_TTL)
+_result_cache = LRUCache(EXTRACTION_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_TTL)
+
+
+def get_cached_text(key):
+    return _text_cache.get(key)
+
+
+def set_cached_text(key, text):
+    _text_cache.set(key, text)
+
+
+async def get_cached_result(db: AsyncSession, doc_type: str, digest: str, versions):
+    """
+    Look up a previous extraction of the same document, first in memory, then in `document_data`.
+
+    :param db: Async SQLAlchemy session
+    :param doc_type: Document type, "CIBIL" or "GST"
+    :param digest: SHA-256 of the uploaded bytes
+    :param versions: Extraction versions whose results are acceptable, in order of preference
+    :return: Tuple of (raw_response, source, version) where source is "memory" or "database";
+             all None on a miss
+    """
+    for version in versions:
+        cached = _result_cache.get((doc_type, digest, version))
+        if cached is not None:
+            return cached, "memory", version
+
+    document = await fetch_model_entries_async(
+        db=db,
+        model=DocumentData,
+        filter_data={
+            'type': doc_type,
+            'content_hash': digest,
+            'extraction_version__in': list(versions)
+        },
+        order_by=['-id'],
+        fetch_one=True
+    )
+    if document is None or document.raw_response is None:
+        return None, None, None
+    if EXTRACTION_CACHE_DB_TTL and document.created_at is not None:
+        created_at = document.created_at
+        if created_at.tzinfo is None:  # If naive datetime
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        if created_at < datetime.now(timezone.utc) - timedelta(seconds=EXTRACTION_CACHE_DB_TTL):
+            return None, None, None
+
+    _result_cache.set((doc_type, digest, document.extraction_version), document.raw_response)
+    return document.raw_response, "database", document.extraction_version
+
+
+def set_cached_result(doc_type: str, digest: str, version: str, raw_response):
+    """
+    Store an extraction in the in-process tier. The database tier is written by the
+    `DocumentData` row the upload pipeline persists anyway.
+    """
+    _result_cache.set((doc_type, digest, version), raw_response)
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import re
+
+from backend.app.core.config import GST_PARSER_MIN_MONTHS
+from backend.app.services.pdf_service import get_pdf_executor
+
+# Bump whenever parsing or metric logic changes, so cached results are recomputed
+GST_PARSER_VERSION = "gst-parser-1"
+
+MONTH_HEADER = re.compile(r"month|period", re.IGNORECASE)
+VALUE_HEADER = re.compile(r"taxable|turnover|sales|value|amount", re.IGNORECASE)
+CUSTOMER_HEADER = re.compile(r"customer|buyer|recipient|party|gstin", re.IGNORECASE)
+TOTAL_DEBT = re.compile(
+    r"total\s+debt[^\d₹]*(?:₹|rs\.?|inr)?\s*([\d,]+(?:\.\d+)?)", re.IGNORECASE
+)
+TEXT_TABLE_SETTINGS = {"vertical_strategy": "text", "horizontal_strategy": "text"}
+
+# pandas and pdfplumber are imported where they are used: parsing runs in the PDF worker
+# processes, and the API process should not pay for them at startup
+
+
+def _find_column(columns, pattern, exclude=()):
+    for column in columns:
+        if column not in exclude and pattern.search(column):
+            return column
+    return None
+
+
+def _to_amounts(series):
+    import pandas as pd
+
+    cleaned = series.astype(str).str.replace(r"₹|Rs\.?|INR|,|\s", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+def _to_months(series):
+    import pandas as pd
+
+    dates = pd.to_datetime(series.astype(str).str.strip(), errors="coerce", format="mixed", dayfirst=True)
+    return dates.dt.to_period("M")
+
+
+def _table_frames(tables):
+    """
+    Turn raw pdfplumber tables into DataFrames with normalized headers. Tables without a
+    recognizable header (page continuations) inherit the columns of the previous table.
+    """
+    import pandas as pd
+
+    frames = []
+    previous_columns = None
+    for table in tables:
+        rows = [row for row in table if row and any(cell for cell in row)]
+        if not rows:
+            continue
+        header = [re.sub(r"\s+", " ", str(cell or "")).strip() for cell in rows[0]]
+        if _find_column(header, MONTH_HEADER) or _find_column(header, CUSTOMER_HEADER):
+            previous_columns = header
+            frames.append(pd.DataFrame(rows[1:], columns=header))
+        elif previous_columns and len(previous_columns) == len(header):
+            frames.append(pd.DataFrame(rows, columns=previous_columns))
+    return frames
+
+
+def _read_report(path):
+    """Collect the tables and text of a GST report. Runs inside a worker process."""
+    import pdfplumber
+
+    tables = []
+    text_parts = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            page_tables = page.extract_tables()
+            if not page_tables:
+                # Unruled tables: fall back to aligning on whitespace
+                page_tables = page.extract_tables(TEXT_TABLE_SETTINGS)
+            tables.extend(page_tables)
+            text_parts.append(page.extract_text() or "")
+    return tables, "\n".join(text_parts)
+
+
+def _monthly_sales(frames):
+    """
+    Build a month -> taxable value series from every table with month and value columns.
+    Customer-level tables are only used when no plain monthly summary is present.
+    """
+    import pandas as pd
+
+    summary, by_customer = [], []
+    for frame in frames:
+        month_column = _find_column(frame.columns, MONTH_HEADER)
+        value_column = _find_column(frame.columns, VALUE_HEADER, exclude=(month_column,))
+        if not month_column or not value_column:
+            continue
+        data = pd.DataFrame({
+            "month": _to_months(frame[month_column]),
+            "value": _to_amounts(frame[value_column]),
+        }).dropna()
+        customer_column = _find_column(frame.columns, CUSTOMER_HEADER, exclude=(month_column, value_column))
+        if customer_column:
+            data["customer"] = frame.loc[data.index, customer_column].astype(str).str.strip()
+            by_customer.append(data)
+        else:
+            summary.append(data)
+
+    customers = pd.concat(by_customer, ignore_index=True) if by_customer else None
+    source = summary or by_customer
+    if not source:
+        return None, customers
+    monthly = pd.concat(source, ignore_index=True).groupby("month")["value"].sum().sort_index()
+    return monthly, customers
+
+
+def compute_gst_metrics(monthly, customers=None, total_debt=None):
+    """
+    Compute the GST data points from monthly sales, in the same shape the LLM extraction returns.
+
+    :param monthly: Series of taxable value indexed by monthly Period, sorted ascending
+    :param customers: Optional DataFrame with month, value and customer columns
+    :param total_debt: Optional total debt in rupees
+    :return: Dict with "Turnover DIP Acceptance", "Debt to Turnover Ratio", "Last 12 Month Sales",
+             "Anchor Dependency" and "Vintage with Anchor"
+    """
+    import pandas as pd
+
+    # Reindex over the full range so months without filings count as zero sales
+    full_range = pd.period_range(monthly.index.min(), monthly.index.max(), freq="M")
+    values = monthly.reindex(full_range, fill_value=0).to_numpy()
+
+    last_12 = values[-12:].sum()
+    previous_12 = values[-24:-12].sum()
+    change = (last_12 - previous_12) / previous_12 * 100 if previous_12 else None
+
+    result = {
+        "Turnover DIP Acceptance": {
+            "Percentage Change": f"{change:.2f}%" if change is not None else "N/A",
+            "Acceptable": "N/A" if change is None else ("Yes" if change >= 0 else "No"),
+        },
+        "Debt to Turnover Ratio": f"{total_debt / last_12 * 100:.2f}%" if total_debt and last_12 else "N/A",
+        "Last 12 Month Sales": f"₹ {last_12:,.2f}",
+        "Anchor Dependency": "N/A",
+        "Vintage with Anchor": "N/A",
+    }
+
+    if customers is not None and not customers.empty:
+        recent = customers[customers["month"] > full_range[-1] - 12]
+        totals = recent.groupby("customer")["value"].sum()
+        if not totals.empty and totals.sum():
+            anchor = totals.idxmax()
+            result["Anchor Dependency"] = f"{totals.max() / totals.sum() * 100:.2f}%"
+            anchor_months = customers.loc[customers["customer"] == anchor, "month"]
+            span = (anchor_months.max() - anchor_months.min()).n + 1
+            result["Vintage with Anchor"] = f"{span} months"
+    return result
+
+
+def parse_gst_tables(tables, text):
+    """
+    Parse GST data points out of pre-extracted tables and page text.
+
+    :return: Metrics dict, or None when no usable monthly sales table was found
+    """
+    monthly, customers = _monthly_sales(_table_frames(tables))
+    if monthly is None or len(monthly) < GST_PARSER_MIN_MONTHS:
+        return None
+
+    debt_match = TOTAL_DEBT.search(text)
+    total_debt = float(debt_match.group(1).replace(",", "")) if debt_match else None
+    return compute_gst_metrics(monthly, customers, total_debt)
+
+
+def _parse_gst_report(path):
+    tables, text = _read_report(path)
+    return parse_gst_tables(tables, text)
+
+
+async def parse_gst_report(path, executor=None):
+    """
+    Extract the GST data points straight from the report's sales tables, without the LLM.
+
+    :param path: Path of the GST report PDF
+    :param executor: Executor to run on (defaults to the shared PDF process pool)
+    :return: Metrics dict, or None if table detection failed and the LLM should be used
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor or get_pdf_executor(), _parse_gst_report, path)
+    except Exception:
+        logging.exception(f"GST table parsing failed for {path}, falling back to LLM extraction")
+        return None
@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import (
+    JOB_WORKERS, JOB_QUEUE_SIZE, JOB_STORAGE_DIR, JOB_STALE_AFTER,
+    JOB_MAX_ATTEMPTS, JOB_MAX_WAIT, JOB_RECOVERY_INTERVAL
+)
+from backend.app.crud.db_crud_operations import fetch_model_entries_async, create_model_entry_async
+from backend.app.db import AsyncSessionLocal
+from backend.app.models import EvaluationJob
+from backend.app.services.evaluation_service import evaluate_business
+from backend.app.services.upload_service import describe_file
+
+JOB_PENDING = "PENDING"
+JOB_RUNNING = "RUNNING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+TERMINAL_STATUSES = (JOB_COMPLETED, JOB_FAILED)
+
+# How often a long-poll re-reads the job, so completions in other processes are noticed
+POLL_INTERVAL = 1.0
+
+
+class JobQueueFull(Exception):
+    """Raised when the local job queue cannot take another upload."""
+
+
+_queue = None
+_tasks = []
+_queued_ids = set()  # Jobs waiting in the local queue, so sweeps don't enqueue them twice
+_running_ids = set()
+_events = {}  # job_id -> asyncio.Event set when the job finishes in this process
+
+
+def _enqueue(job_id):
+    if job_id in _queued_ids:
+        return
+    _queue.put_nowait(job_id)
+    _queued_ids.add(job_id)
+
+
+async def submit_job(db: AsyncSession, cibil_upload: dict, gst_upload: dict, request_data: dict) -> str:
+    """
+    Persist an upload as a PENDING job and queue it for the background workers.
+
+    :param db: Async SQLAlchemy session
+    :param cibil_upload: Spooled CIBIL report, moved into the job's storage directory
+    :param gst_upload: Spooled GST report, moved into the job's storage directory
+    :param request_data: Remaining form fields, passed to `evaluate_business` when the job runs
+    :return: The job id
+    :raises JobQueueFull: If the workers are not running or the queue is at capacity
+    """
+    if _queue is None or _queue.full():
+        raise JobQueueFull("Evaluation queue is full, retry later")
+
+    job_id = str(uuid.uuid4())
+    job_dir = os.path.join(JOB_STORAGE_DIR, job_id)
+    cibil_path = os.path.join(job_dir, "cibil.pdf")
+    gst_path = os.path.join(job_dir, "gst.pdf")
+
+    await asyncio.to_thread(os.makedirs, job_dir, exist_ok=True)
+    await asyncio.gather(
+        asyncio.to_thread(shutil.move, cibil_upload['path'], cibil_path),
+        asyncio.to_thread(shutil.move, gst_upload['path'], gst_path)
+    )
+
+    job_data = {
+        'id': job_id,
+        'status': JOB_PENDING,
+        'request_data': request_data,
+        'cibil_path': cibil_path,
+        'gst_path': gst_path
+    }
+    await create_model_entry_async(db, job_data, EvaluationJob)
+    _enqueue(job_id)
+    return job_id
+
+
+async def _claim_job(db: AsyncSession, job_id: str) -> bool:
+    """Atomically move a job from PENDING to RUNNING; False if another worker got it first."""
+    result = await db.execute(
+        update(EvaluationJob)
+        .filter(EvaluationJob.id == job_id, EvaluationJob.status == JOB_PENDING)
+        .values({
+            EvaluationJob.status: JOB_RUNNING,
+            EvaluationJob.started_at: datetime.now(timezone.utc),
+            EvaluationJob.attempts: EvaluationJob.attempts + 1
+        })
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return bool(result.rowcount)
+
+
+async def run_job(job_id: str):
+    """
+    Run the evaluation pipeline for a queued job and store its outcome.
+    """
+    db = AsyncSessionLocal()
+    try:
+        if not await _claim_job(db, job_id):
+            return
+        _running_ids.add(job_id)
+
+        job = await fetch_model_entries_async(db=db, model=EvaluationJob, filter_data={'id': job_id}, fetch_one=True)
+        job_dir = os.path.dirname(job.cibil_path)
+        request_data = dict(job.request_data)
+        rules_dict = request_data.pop('rules')
+        try:
+            cibil_upload, gst_upload = await asyncio.gather(
+                asyncio.to_thread(describe_file, job.cibil_path),
+                asyncio.to_thread(describe_file, job.gst_path)
+            )
+            result = await evaluate_business(
+                db=db,
+                cibil_upload=cibil_upload,
+                gst_upload=gst_upload,
+                rules_dict=rules_dict,
+                **request_data
+            )
+        except Exception as e:
+            logging.exception(f"Evaluation job {job_id} failed")
+            await db.rollback()
+            job.status = JOB_FAILED
+            job.error = f"{e.__class__.__name__}: {e}"
+        else:
+            job.status = JOB_COMPLETED
+            job.result = result
+        job.finished_at = datetime.now(timezone.utc)
+        db.add(job)
+        await db.commit()
+
+        await asyncio.to_thread(shutil.rmtree, job_dir, True)
+    finally:
+        _running_ids.discard(job_id)
+        await db.close()
+        event = _events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+
+async def _worker():
+    while True:
+        job_id = await _queue.get()
+        _queued_ids.discard(job_id)
+        try:
+            await run_job(job_id)
+        except Exception:
+            logging.exception(f"Evaluation job {job_id} crashed")
+        finally:
+            _queue.task_done()
+
+
+async def recover_jobs(db: AsyncSession):
+    """
+    Requeue jobs left behind by a restart: PENDING jobs, and RUNNING jobs whose worker has not
+    finished them within JOB_STALE_AFTER seconds. Jobs that keep getting orphaned are failed
+    after JOB_MAX_ATTEMPTS.
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=JOB_STALE_AFTER)
+    stale = (
+        update(EvaluationJob)
+        .filter(EvaluationJob.status == JOB_RUNNING, EvaluationJob.started_at < stale_before)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stale.filter(EvaluationJob.attempts >= JOB_MAX_ATTEMPTS).values({
+        EvaluationJob.status: JOB_FAILED,
+        EvaluationJob.error: f"Abandoned after {JOB_MAX_ATTEMPTS} attempts",
+        EvaluationJob.finished_at: datetime.now(timezone.utc)
+    }))
+    await db.execute(stale.filter(EvaluationJob.attempts < JOB_MAX_ATTEMPTS).values(
+        {EvaluationJob.status: JOB_PENDING}
+    ))
+    await db.commit()
+
+    pending = await db.scalars(
+        select(EvaluationJob.id)
+        .filter(EvaluationJob.status == JOB_PENDING)
+        .order_by(EvaluationJob.created_at.asc())
+        .limit(JOB_QUEUE_SIZE)
+    )
+    for job_id in pending.all():
+        if _queue.full():
+            break
+        _enqueue(job_id)
+
+
+async def _recovery_loop():
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await recover_jobs(db)
+        except Exception:
+            logging.exception("Evaluation job recovery failed")
+        await asyncio.sleep(JOB_RECOVERY_INTERVAL)
+
+
+async def start_job_workers():
+    """
+    Start the bounded worker pool and the recovery sweep. Called on application startup.
+    """
+    global _queue
+    _queue = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+    _tasks.extend(asyncio.create_task(_worker()) for _ in range(JOB_WORKERS))
+    _tasks.append(asyncio.create_task(_recovery_loop()))
+
+
+async def stop_job_workers():
+    """
+    Cancel the workers and hand their in-flight jobs back to PENDING so they run again
+    on the next start. Called on application shutdown.
+    """
+    global _queue
+    # Cancelled jobs drop out of _running_ids as they unwind, so take the ids first
+    running_ids = list(_running_ids)
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+
+    if running_ids:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(EvaluationJob)
+                .filter(EvaluationJob.id.in_(running_ids), EvaluationJob.status == JOB_RUNNING)
+                .values({EvaluationJob.status: JOB_PENDING})
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+    _running_ids.clear()
+    _queued_ids.clear()
+    _queue = None
+
+
+def _job_response(job):
+    response = {
+        'job_id': job.id,
+        'status': job.status
+    }
+    if job.status == JOB_COMPLETED:
+        response['result'] = job.result
+    elif job.status == JOB_FAILED:
+        response['error'] = job.error
+    return response
+
+
+async def get_job_status(db: AsyncSession, job_id: str, wait: float = 0):
+    """
+    Return the status of a job, optionally long-polling until it finishes.
+
+    :param db: Async SQLAlchemy session
+    :param job_id: Job id returned by `submit_job`
+    :param wait: Seconds to wait for a terminal status, capped at JOB_MAX_WAIT
+    :return: Dict with job_id, status and result or error, or None if the job does not exist
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(max(wait, 0), JOB_MAX_WAIT)
+    while True:
+        job = await fetch_model_entries_async(db=db, model=EvaluationJob, filter_data={'id': job_id}, fetch_one=True)
+        if job is None:
+            return None
+        remaining = deadline - loop.time()
+        if job.status in TERMINAL_STATUSES:
+            _events.pop(job_id, None)
+            return _job_response(job)
+        if remaining <= 0:
+            return _job_response(job)
+
+        # Release the connection and drop cached state while waiting
+        await db.rollback()
+        event = _events.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=min(remaining, POLL_INTERVAL))
+        except asyncio.TimeoutError:
+            pass
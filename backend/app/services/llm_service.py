@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import logging
+
+import simplejson as json
+
+from backend.app.core.config import (
+    OPENAI_API_KEY, OPENAI_MODEL, OPENAI_TEMPERATURE, OPENAI_REQUEST_TIMEOUT,
+    OPENAI_MAX_RETRIES, OPENAI_RETRY_BACKOFF, OPENAI_MAX_CONNECTIONS
+)
+
+# openai and aiohttp take a few hundred milliseconds to import; workers load them on the
+# first extraction instead of at startup
+_openai = None
+
+
+def _get_openai():
+    """
+    Return the configured openai module, importing it on first use.
+    """
+    global _openai
+    if _openai is None:
+        import openai
+
+        openai.api_key = OPENAI_API_KEY
+        _openai = openai
+    return _openai
+
+
+def _retryable_errors(openai):
+    """Errors worth another attempt; anything else (bad request, auth) fails immediately."""
+    return (
+        asyncio.TimeoutError,
+        openai.error.Timeout,
+        openai.error.APIConnectionError,
+        openai.error.RateLimitError,
+        openai.error.ServiceUnavailableError,
+        openai.error.TryAgain,
+        openai.error.APIError,
+    )
+
+
+_session = None
+
+
+def _get_session():
+    """
+    Return the process-wide aiohttp session used for every OpenAI call, creating it on first use.
+    """
+    global _session
+    if _session is None or _session.closed:
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=OPENAI_MAX_CONNECTIONS, keepalive_timeout=30)
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_llm_session():
+    """
+    Close the shared HTTP session. Called on application shutdown.
+    """
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def build_cibil_prompt(cibil_text):
+    return f"""
+        Below is a **CIBIL report**. Your task is to extract
+         **specific financial data points** from the CIBIL
+        content and return the result as a **valid JSON**.
+        ---
+        **CIBIL REPORT SNIPPET**:
+        {cibil_text}
+        Extract and return the following data points in JSON format:
+        1. dpd_30_plus_sma_1  (Meaning any entry where days past due is greater than 30)
+        2. dpd_60_plus_sma_2  (Meaning any entry where days past due is greater than 60)
+        3. dpd_90_plus_npa  (Meaning any entry where days past due is greater than 90)
+        4. adverse_remarks — return a list of adverse remarks with their type and source
+        5. unsecured_credit_enquiries_90_days — number of unsecured credit inquiries in the last 90 days
+        6. unsecured_loans_disbursed_3_months — number of unsecured loans disbursed in the last 3 months
+        7. debt_more_than_one_year — total debt older than 1 year
+
+        Also, include a derived boolean summary like this:
+
+        ```json
+        1."is_30_plus_dpd": true/false(Give true when there is a days past due greater than 30),
+        2."is_60_plus_dpd": true/false(Give true when there is a days past due greater than 60),
+        3."is_90_plus_dpd": true/false(Give true when there is a days past due greater than 90),
+        4."adverse_remarks_present": true/false,
+        5."unsecured_credit_enquiries_in_last_90_days": true/false,
+        6."unsecured_number_of_loans_in_last_3_months": <integer>,
+        7."debt_gt_one_year": true/false
+        """
+
+
+def build_gst_prompt(gst_text):
+    return f"""
+    **GST SNIPPET**:
+    {gst_text}
+    You are an expert at analyzing financial reports. Given a GST sales report, extract and calculate the following data points:
+    1. Turnover DIP Acceptance: Is there a drop or increase in recent 12-month sales compared to the previous 12-months? Mention the percentage change and whether it's acceptable.
+    2. Debt to Turnover: If total debt is provided, calculate debt/turnover ratio using the recent 12-month sales.
+    3. Last 12 Month Sales: Mention the total taxable value for the last 12 months.
+    4. Anchor Dependency: If customer-level sales data is available, calculate the percentage of total sales from the top customer(s).
+    5. Vintage with Anchor: Determine how long the business has been transacting with its key anchor customer.
+    Use accurate formulas and context from the data file. Return the result in structured JSON format.
+    Please always give response in this format:
+    This is the sample response format I expect:
+            {{
+      "Turnover DIP Acceptance": {{
+        "Percentage Change": "182%",
+        "Acceptable": "Yes"
+      }},
+      "Debt to Turnover Ratio": "27.89%",
+      "Last 12 Month Sales": "₹ 60,987,301.20",
+      "Anchor Dependency": "N/A",
+      "Vintage with Anchor": "N/A"
+    }}
+    """
+
+
+async def chat_completion(prompt):
+    """
+    Send a single-message chat completion through the shared connection pool.
+
+    Each attempt is bounded by OPENAI_REQUEST_TIMEOUT; transient failures are retried
+    up to OPENAI_MAX_RETRIES times with exponential backoff.
+
+    :param prompt: User prompt to send
+    :return: Content of the first choice
+    """
+    openai = _get_openai()
+    retryable_errors = _retryable_errors(openai)
+    # aiosession is a ContextVar, so it is set in the calling task rather than once at startup
+    openai.aiosession.set(_get_session())
+
+    attempt = 0
+    while True:
+        try:
+            response = await asyncio.wait_for(
+                openai.ChatCompletion.acreate(
+                    model=OPENAI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=OPENAI_TEMPERATURE,
+                    request_timeout=OPENAI_REQUEST_TIMEOUT,
+                ),
+                timeout=OPENAI_REQUEST_TIMEOUT,
+            )
+            return response['choices'][0]['message']['content']
+        except retryable_errors as e:
+            if attempt >= OPENAI_MAX_RETRIES:
+                raise
+            delay = OPENAI_RETRY_BACKOFF * (2 ** attempt)
+            attempt += 1
+            logging.warning(f"OpenAI call failed ({e.__class__.__name__}), retry {attempt} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def parse_json_content(content):
+    """
+    Parse a model response into a dict, dropping any markdown code fence around the JSON.
+    """
+    return json.loads(content.strip().strip('```json').strip('```'))
+
+
+async def extract_cibil_data(cibil_text):
+    """
+    Extract the CIBIL data points from report text.
+
+    :param cibil_text: Text extracted from the CIBIL report
+    :return: Parsed JSON response of the model
+    """
+    return parse_json_content(await chat_completion(build_cibil_prompt(cibil_text)))
+
+
+async def extract_gst_data(gst_text):
+    """
+    Extract the GST data points from report text.
+
+    :param gst_text: Text extracted from the GST report
+    :return: Parsed JSON response of the model
+    """
+    return parse_json_content(await chat_completion(build_gst_prompt(gst_text)))
+
+
+def _prompt_version(prompt_template):
+    return hashlib.sha256(f"{OPENAI_MODEL}:{prompt_template}".encode()).hexdigest()[:16]
+
+
+# Changes to the model or a prompt produce a new version, so cached extractions are not reused
+PROMPT_VERSIONS = {
+    "CIBIL": _prompt_version(build_cibil_prompt("")),
+    "GST": _prompt_version(build_gst_prompt("")),
+}
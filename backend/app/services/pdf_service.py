@@ -0,0 +1,178 @@
+import asyncio
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from backend.app.core.config import PDF_WORKERS, PDF_PAGES_PER_CHUNK, PDF_BACKEND
+
+_executor = None
+
+
+def get_pdf_executor():
+    """
+    Return the process pool used for PDF parsing, creating it on first use.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    return _executor
+
+
+def shutdown_pdf_executor():
+    """
+    Stop the PDF worker processes. Called on application shutdown.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+class PdfBackend:
+    """
+    Text extraction backend. Implementations open the file themselves so that they can be
+    used inside worker processes with only a path and a backend name crossing the boundary.
+    """
+    name = None
+
+    def page_count(self, path):
+        raise NotImplementedError
+
+    def iter_page_texts(self, path, start=0, stop=None):
+        """Yield the text of pages [start, stop) one page at a time."""
+        raise NotImplementedError
+
+
+class PyPDF2Backend(PdfBackend):
+    name = "pypdf2"
+
+    @contextmanager
+    def _open(self, path):
+        from PyPDF2 import PdfReader
+
+        # A read-only memory map lets pages be paged in from disk on demand instead of
+        # PyPDF2 copying the whole file onto the heap
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield PdfReader(mapped)
+
+    def page_count(self, path):
+        with self._open(path) as reader:
+            return len(reader.pages)
+
+    def iter_page_texts(self, path, start=0, stop=None):
+        with self._open(path) as reader:
+            stop = len(reader.pages) if stop is None else stop
+            for index in range(start, stop):
+                yield reader.pages[index].extract_text() or ""
+
+
+class PdfiumBackend(PdfBackend):
+    name = "pypdfium2"
+
+    def page_count(self, path):
+        import pypdfium2
+
+        pdf = pypdfium2.PdfDocument(path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    def iter_page_texts(self, path, start=0, stop=None):
+        import pypdfium2
+
+        pdf = pypdfium2.PdfDocument(path)
+        try:
+            stop = len(pdf) if stop is None else stop
+            for index in range(start, stop):
+                page = pdf[index]
+                text_page = page.get_textpage()
+                try:
+                    yield text_page.get_text_bounded().replace("\r\n", "\n")
+                finally:
+                    text_page.close()
+                    page.close()
+        finally:
+            pdf.close()
+
+
+class PdfPlumberBackend(PdfBackend):
+    name = "pdfplumber"
+
+    def page_count(self, path):
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            return len(pdf.pages)
+
+    def iter_page_texts(self, path, start=0, stop=None):
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            stop = len(pdf.pages) if stop is None else stop
+            for index in range(start, stop):
+                page = pdf.pages[index]
+                yield page.extract_text() or ""
+                page.close()  # Drop the page's cached layout objects
+
+
+PDF_BACKENDS = {
+    backend.name: backend for backend in (PyPDF2Backend(), PdfiumBackend(), PdfPlumberBackend())
+}
+
+
+def get_pdf_backend(name=None):
+    """
+    Return the extraction backend registered under `name`, or the configured default.
+    """
+    name = name or PDF_BACKEND
+    try:
+        return PDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF backend '{name}', expected one of {sorted(PDF_BACKENDS)}")
+
+
+def iter_page_texts(path, start=0, stop=None, backend=None):
+    """
+    Yield the text of pages [start, stop) one page at a time.
+    """
+    return get_pdf_backend(backend).iter_page_texts(path, start, stop)
+
+
+def _count_pages(path, backend):
+    return get_pdf_backend(backend).page_count(path)
+
+
+def _extract_page_range(path, start, stop, backend):
+    """Extract the text of pages [start, stop). Runs inside a worker process."""
+    return "".join(f"{text}\n" for text in iter_page_texts(path, start, stop, backend))
+
+
+async def extract_text(path, executor=None, pages_per_chunk=PDF_PAGES_PER_CHUNK, backend=None):
+    """
+    Extract the text of every page of a PDF without blocking the event loop.
+
+    Workers open the file themselves, so only its path crosses the process boundary.
+    Documents longer than `pages_per_chunk` pages are split into page ranges that are
+    parsed in parallel; the per-range results are joined once at the end.
+
+    :param path: Path of the PDF on disk
+    :param executor: Executor to run on (defaults to the shared process pool)
+    :param pages_per_chunk: Maximum number of pages handed to a single worker
+    :param backend: Name of the extraction backend (defaults to PDF_BACKEND)
+    :return: Text of all pages, each followed by a newline
+    """
+    loop = asyncio.get_running_loop()
+    executor = executor or get_pdf_executor()
+    backend = get_pdf_backend(backend).name
+
+    page_count = await loop.run_in_executor(executor, _count_pages, path, backend)
+    ranges = [
+        (start, min(start + pages_per_chunk, page_count))
+        for start in range(0, page_count, pages_per_chunk)
+    ]
+    chunks = await asyncio.gather(*[
+        loop.run_in_executor(executor, _extract_page_range, path, start, stop, backend)
+        for start, stop in ranges
+    ])
+    return "".join(chunks)
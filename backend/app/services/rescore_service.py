@@ -0,0 +1,312 @@
+import asyncio
+import logging
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import RESCORE_CHUNK_SIZE, RESCORE_WORKERS, JOB_STALE_AFTER, JOB_RECOVERY_INTERVAL
+from backend.app.crud.db_crud_operations import fetch_model_entries_async, create_model_entry_async
+from backend.app.db import AsyncSessionLocal
+from backend.app.model_utils.risk_utils import risk_columns
+from backend.app.models import Business, RescoreJob, Rule
+from backend.app.services.job_service import JOB_PENDING, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED
+from backend.app.services.rule_cache import get_active_rule
+from backend.app.services.stats_service import record_evaluations
+from backend.app.utils.rule_engine_utils import predict_risk_score_based_on_rule_engine
+
+# A newer rule was activated before the job finished; that rule's job takes over
+JOB_SUPERSEDED = "SUPERSEDED"
+
+# Uploads are evaluated in strict mode, so re-scoring is too
+STRICT = True
+
+_executor = None
+_tasks = {}  # job_id -> asyncio.Task running in this process
+_resume_task = None
+
+
+def get_scoring_executor():
+    """
+    Return the process pool used for portfolio scoring, creating it on first use.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=RESCORE_WORKERS)
+    return _executor
+
+
+def rescore_chunk(rows, rule_config):
+    """
+    Re-score a chunk of businesses. Runs inside a worker process.
+
+    The whole chunk is scored with the vectorized engine and compared with the stored verdict,
+    credit limit and pass percentage columns; the full risk response, with per-criterion
+    remarks, is only built for businesses whose outcome changed.
+
+    :param rows: List of (business_id, data_points, verdict, credit_limit, pass_percentage)
+    :param rule_config: Rule configuration to score against
+    :return: List of (business_id, risk_response) for businesses whose outcome changed
+    """
+    # pandas is only needed in the worker processes, not at API startup
+    import pandas as pd
+
+    from backend.app.utils.batch_rule_engine import score_portfolio
+
+    scored = score_portfolio(pd.DataFrame([row[1] for row in rows]), rule_config, strict=STRICT)
+    changed = []
+    outcomes = zip(rows, scored['verdict'], scored['credit_limit_value'], scored['pass_percentage'])
+    for (business_id, data_points, *current), verdict, credit_limit, percentage in outcomes:
+        credit_limit = None if pd.isna(credit_limit) else int(credit_limit)
+        if current == [verdict, credit_limit, percentage]:
+            continue
+        changed.append((business_id, predict_risk_score_based_on_rule_engine(data_points, rule_config, strict=STRICT)))
+    return changed
+
+
+async def create_rescore_job(db: AsyncSession, rule_id: int):
+    """
+    Add a PENDING re-score job for a rule to the caller's transaction. Start it with
+    `schedule_rescore_job` once the transaction is committed.
+
+    :param db: Async SQLAlchemy session
+    :param rule_id: Id of the newly activated rule
+    :return: The RescoreJob
+    """
+    job_data = {
+        'id': str(uuid.uuid4()),
+        'rule_id': rule_id,
+        'status': JOB_PENDING
+    }
+    return await create_model_entry_async(db, job_data, RescoreJob, commit=False)
+
+
+def schedule_rescore_job(job_id: str):
+    """
+    Run a committed re-score job in the background of this process.
+    """
+    if job_id not in _tasks:
+        task = asyncio.create_task(run_rescore_job(job_id))
+        _tasks[job_id] = task
+        task.add_done_callback(lambda _: _tasks.pop(job_id, None))
+
+
+async def _claim_job(db: AsyncSession, job_id: str) -> bool:
+    """Atomically move a job from PENDING to RUNNING; False if another process got it first."""
+    result = await db.execute(
+        update(RescoreJob)
+        .filter(RescoreJob.id == job_id, RescoreJob.status == JOB_PENDING)
+        .values({
+            RescoreJob.status: JOB_RUNNING,
+            RescoreJob.started_at: datetime.now(timezone.utc),
+            RescoreJob.processed: 0,
+            RescoreJob.changed: 0
+        })
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return bool(result.rowcount)
+
+
+async def _rule_is_active(db: AsyncSession, rule_id: int) -> bool:
+    # Checked before every chunk, so served from the rule cache
+    active_rule = await get_active_rule(db)
+    return active_rule is not None and active_rule['id'] == rule_id
+
+
+async def _apply_chunk(db: AsyncSession, job: RescoreJob, size: int, changed):
+    if changed:
+        computed_at = datetime.now(timezone.utc)
+        # The replaced responses are taken out of the dashboard statistics
+        previous = (await db.execute(
+            select(Business.id, Business.created_at, Business.business_sector, Business.risk_response)
+            .filter(Business.id.in_([business_id for business_id, _ in changed]))
+        )).all()
+        buckets = {row.id: (row.created_at, row.business_sector) for row in previous}
+        # Bulk UPDATE by primary key, one statement for the whole chunk
+        await db.execute(
+            update(Business),
+            [
+                {'id': business_id, 'risk_response': risk_response, **risk_columns(risk_response, computed_at)}
+                for business_id, risk_response in changed
+            ]
+        )
+        await record_evaluations(
+            db,
+            added=[(*buckets[business_id], risk_response) for business_id, risk_response in changed],
+            removed=[(row.created_at, row.business_sector, row.risk_response) for row in previous]
+        )
+    job.processed += size
+    job.changed += len(changed)
+    await db.commit()
+
+
+async def run_rescore_job(job_id: str):
+    """
+    Re-evaluate every business with stored data points against the job's rule.
+
+    Businesses are read in id order, RESCORE_CHUNK_SIZE at a time, and scored on the process
+    pool with up to RESCORE_WORKERS chunks in flight. Progress is committed after every chunk.
+    Neither the PDFs nor the LLM are involved.
+    """
+    async with AsyncSessionLocal() as db:
+        if not await _claim_job(db, job_id):
+            return
+        job = await fetch_model_entries_async(db=db, model=RescoreJob, filter_data={'id': job_id}, fetch_one=True)
+        loop = asyncio.get_running_loop()
+        in_flight = {}  # future -> chunk size
+        try:
+            rule = await fetch_model_entries_async(db=db, model=Rule, filter_data={'id': job.rule_id}, fetch_one=True)
+            job.total = await db.scalar(
+                select(func.count()).select_from(Business).filter(Business.data_points.isnot(None))
+            )
+            job.skipped = await db.scalar(
+                select(func.count()).select_from(Business).filter(Business.data_points.is_(None))
+            )
+            await db.commit()
+
+            last_id = 0
+            exhausted = False
+            status = JOB_COMPLETED
+            while not exhausted or in_flight:
+                if not exhausted:
+                    if not await _rule_is_active(db, job.rule_id):
+                        status = JOB_SUPERSEDED
+                        break
+                    rows = (await db.execute(
+                        select(
+                            Business.id, Business.data_points,
+                            Business.verdict, Business.credit_limit, Business.pass_percentage
+                        )
+                        .filter(Business.data_points.isnot(None), Business.id > last_id)
+                        .order_by(Business.id)
+                        .limit(RESCORE_CHUNK_SIZE)
+                    )).all()
+                    if rows:
+                        last_id = rows[-1].id
+                        future = loop.run_in_executor(
+                            get_scoring_executor(), rescore_chunk, [tuple(row) for row in rows], rule.rule_config
+                        )
+                        in_flight[future] = len(rows)
+                    else:
+                        exhausted = True
+                # Keep every worker busy while the next chunk is read
+                if in_flight and (exhausted or len(in_flight) >= RESCORE_WORKERS):
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        await _apply_chunk(db, job, in_flight.pop(future), future.result())
+            job.status = status
+        except Exception as e:
+            logging.exception(f"Rescore job {job_id} failed")
+            await db.rollback()
+            job.status = JOB_FAILED
+            job.error = f"{e.__class__.__name__}: {e}"
+        finally:
+            for future in in_flight:
+                future.cancel()
+        job.finished_at = datetime.now(timezone.utc)
+        db.add(job)
+        await db.commit()
+
+
+async def resume_rescore_jobs():
+    """
+    Resume re-score jobs interrupted by a restart.
+
+    RUNNING jobs that have not reported progress for JOB_STALE_AFTER seconds are handed back to
+    PENDING; the pending job of the active rule is resumed and older ones are superseded.
+    Re-scoring a business twice is harmless, so resumed jobs simply start over.
+    """
+    async with AsyncSessionLocal() as db:
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=JOB_STALE_AFTER)
+        await db.execute(
+            update(RescoreJob)
+            .filter(RescoreJob.status == JOB_RUNNING, RescoreJob.updated_at < stale_before)
+            .values({RescoreJob.status: JOB_PENDING})
+            .execution_options(synchronize_session=False)
+        )
+        active_rule_ids = select(Rule.id).filter(Rule.is_enabled == True)
+        await db.execute(
+            update(RescoreJob)
+            .filter(RescoreJob.status == JOB_PENDING, RescoreJob.rule_id.not_in(active_rule_ids))
+            .values({RescoreJob.status: JOB_SUPERSEDED, RescoreJob.finished_at: datetime.now(timezone.utc)})
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        pending = await db.scalars(select(RescoreJob.id).filter(RescoreJob.status == JOB_PENDING))
+        for job_id in pending.all():
+            schedule_rescore_job(job_id)
+
+
+async def _resume_loop():
+    while True:
+        try:
+            await resume_rescore_jobs()
+            return
+        except Exception:
+            logging.exception(f"Resuming re-score jobs failed, retrying in {JOB_RECOVERY_INTERVAL}s")
+        await asyncio.sleep(JOB_RECOVERY_INTERVAL)
+
+
+async def start_rescore_jobs():
+    """
+    Resume interrupted re-score jobs in the background, retrying until the database answers.
+    Called on application startup, which does not wait for it.
+    """
+    global _resume_task
+    if _resume_task is None:
+        _resume_task = asyncio.create_task(_resume_loop())
+
+
+async def stop_rescore_jobs():
+    """
+    Cancel running re-score jobs and hand them back to PENDING, then stop the process pool.
+    Called on application shutdown.
+    """
+    global _executor, _resume_task
+    if _resume_task is not None:
+        _resume_task.cancel()
+        await asyncio.gather(_resume_task, return_exceptions=True)
+        _resume_task = None
+    job_ids = list(_tasks)
+    for task in list(_tasks.values()):
+        task.cancel()
+    await asyncio.gather(*_tasks.values(), return_exceptions=True)
+    if job_ids:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(RescoreJob)
+                .filter(RescoreJob.id.in_(job_ids), RescoreJob.status == JOB_RUNNING)
+                .values({RescoreJob.status: JOB_PENDING})
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+async def get_rescore_status(db: AsyncSession, job_id: str):
+    """
+    Return the progress of a re-score job.
+
+    :param db: Async SQLAlchemy session
+    :param job_id: Id returned when the rule was updated
+    :return: Dict with status and counters, or None if the job does not exist
+    """
+    job = await fetch_model_entries_async(db=db, model=RescoreJob, filter_data={'id': job_id}, fetch_one=True)
+    if job is None:
+        return None
+    return {
+        'job_id': job.id,
+        'rule_id': job.rule_id,
+        'status': job.status,
+        'total': job.total,
+        'processed': job.processed,
+        'changed': job.changed,
+        'skipped': job.skipped,
+        'progress': round(job.processed / job.total, 4) if job.total else None,
+        'error': job.error
+    }
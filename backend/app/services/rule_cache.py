@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import RULE_CACHE_LISTEN, RULE_CACHE_TTL, RULE_CACHE_RECONNECT_INTERVAL
+from backend.app.crud.db_crud_operations import fetch_model_entries_async
+from backend.app.db import AsyncSessionLocal, SQLALCHEMY_DATABASE_URL
+from backend.app.models import Rule
+
+# Postgres channel on which rule changes are announced to every worker
+RULE_CHANNEL = "rule_changes"
+
+_cache = None  # {'rule': described active rule or None, 'loaded_at': monotonic time}
+_generation = 0  # Bumped on every invalidation so an in-flight load cannot store a stale rule
+_lock = asyncio.Lock()
+_listening = False
+_listener_task = None
+
+
+def _describe(rule):
+    if rule is None:
+        return None
+    digest = hashlib.sha256(json.dumps(rule.rule_config, sort_keys=True, default=str).encode()).hexdigest()
+    return {
+        'id': rule.id,
+        'rule_config': rule.rule_config,
+        'version': rule.id,  # Every update creates a new rule row, so ids only grow
+        'etag': f'"rule-{rule.id}-{digest[:16]}"'
+    }
+
+
+def _is_fresh(cached):
+    # While LISTEN is up every change invalidates the cache, so it never has to expire
+    return cached is not None and (_listening or time.monotonic() - cached['loaded_at'] < RULE_CACHE_TTL)
+
+
+async def get_active_rule(db: AsyncSession = None):
+    """
+    Return the enabled rule from the process-local cache, loading it on a miss.
+
+    :param db: Async SQLAlchemy session used on a miss (a new one is opened if omitted)
+    :return: Dict with id, rule_config, version and etag, or None if no rule is enabled
+    """
+    global _cache
+    cached = _cache
+    if _is_fresh(cached):
+        return cached['rule']
+
+    async with _lock:
+        cached = _cache
+        if _is_fresh(cached):
+            return cached['rule']
+        generation = _generation
+        if db is None:
+            async with AsyncSessionLocal() as db:
+                rule = await fetch_model_entries_async(db=db, model=Rule, filter_data={'is_enabled': True}, fetch_one=True)
+        else:
+            rule = await fetch_model_entries_async(db=db, model=Rule, filter_data={'is_enabled': True}, fetch_one=True)
+        described = _describe(rule)
+        if generation == _generation:
+            _cache = {'rule': described, 'loaded_at': time.monotonic()}
+        return described
+
+
+def set_active_rule(rule):
+    """
+    Cache a rule this process has just activated and committed.
+    """
+    global _cache, _generation
+    _generation += 1
+    _cache = {'rule': _describe(rule), 'loaded_at': time.monotonic()}
+
+
+def invalidate_active_rule():
+    """
+    Drop the cached rule; the next read loads it from the database.
+    """
+    global _cache, _generation
+    _generation += 1
+    _cache = None
+
+
+async def notify_rule_change(db: AsyncSession, rule_id: int):
+    """
+    Announce a rule change to the other workers. Postgres delivers the notification when the
+    caller's transaction commits, and drops it if the transaction rolls back.
+    """
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(text("SELECT pg_notify(:channel, :payload)"), {'channel': RULE_CHANNEL, 'payload': str(rule_id)})
+
+
+async def _listen():
+    global _listening
+    import asyncpg
+
+    while True:
+        connection = None
+        try:
+            connection = await asyncpg.connect(SQLALCHEMY_DATABASE_URL)
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            await connection.add_listener(RULE_CHANNEL, lambda *_: invalidate_active_rule())
+            # Changes committed while nobody was listening would otherwise be missed
+            invalidate_active_rule()
+            _listening = True
+            await closed.wait()
+            logging.warning("Rule change listener disconnected")
+        except Exception as e:
+            logging.warning(f"Rule change listener failed, caching for {RULE_CACHE_TTL}s at a time: {e}")
+        finally:
+            _listening = False
+            if connection is not None and not connection.is_closed():
+                await connection.close()
+        await asyncio.sleep(RULE_CACHE_RECONNECT_INTERVAL)
+
+
+async def start_rule_listener():
+    """
+    Start listening for rule changes made by other workers. Called on application startup.
+    Until the listener is connected, cached rules expire after RULE_CACHE_TTL seconds.
+    """
+    global _listener_task
+    if RULE_CACHE_LISTEN and _listener_task is None:
+        _listener_task = asyncio.create_task(_listen())
+
+
+async def stop_rule_listener():
+    """
+    Stop the listener. Called on application shutdown.
+    """
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        await asyncio.gather(_listener_task, return_exceptions=True)
+    _listener_task = None
+    invalidate_active_rule()
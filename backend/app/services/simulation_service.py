@@ -0,0 +1,92 @@
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import SIMULATION_MAX_FLIPS
+from backend.app.models import Business
+from backend.app.services.rescore_service import get_scoring_executor
+from backend.app.services.rule_cache import get_active_rule
+from backend.app.utils.rule_engine_utils import VERDICT_APPROVED, VERDICT_REJECTED, VERDICT_MANUAL_REVIEW
+
+# numpy, pandas and the batch engine are imported on the first simulation, not at API startup
+
+
+def _score_outcomes(frame, rule_config, strict):
+    """Score the portfolio against one rule config. Runs inside a worker process."""
+    from backend.app.utils.batch_rule_engine import score_portfolio
+
+    scored = score_portfolio(frame, rule_config, strict=strict)
+    return scored['verdict'].to_numpy(), scored['credit_limit_value'].to_numpy()
+
+
+def _summary(verdicts, credit_limits):
+    import numpy as np
+
+    applicants = max(len(verdicts), 1)
+    return {
+        'approval_rate': round(np.count_nonzero(verdicts == VERDICT_APPROVED) / applicants, 4),
+        'rejection_rate': round(np.count_nonzero(verdicts == VERDICT_REJECTED) / applicants, 4),
+        'manual_review_rate': round(np.count_nonzero(verdicts == VERDICT_MANUAL_REVIEW) / applicants, 4),
+        'credit_limit_exposure': int(np.nansum(credit_limits))
+    }
+
+
+async def simulate_rules(db: AsyncSession, rule_configs: list, strict: bool = True):
+    """
+    Evaluate candidate rule configs against every stored applicant and compare them with
+    the active rule.
+
+    The portfolio is loaded once; each config is scored in batch on the scoring process
+    pool, all configs in parallel.
+
+    :param db: Async SQLAlchemy session
+    :param rule_configs: Candidate rule configurations
+    :param strict: Evaluate in strict mode, as uploads are
+    :return: Dict with the portfolio size, the active rule's summary and, per candidate, the
+             verdict rates, credit-limit exposure and the applicants whose verdict would flip
+    """
+    import numpy as np
+    import pandas as pd
+
+    rows = (await db.execute(
+        select(Business.id, Business.business_name, Business.data_points)
+        .filter(Business.data_points.isnot(None))
+        .order_by(Business.id)
+    )).all()
+    skipped = await db.scalar(select(func.count()).select_from(Business).filter(Business.data_points.is_(None)))
+    active_rule = await get_active_rule(db)
+
+    frame = pd.DataFrame([row.data_points for row in rows])
+    configs = ([active_rule['rule_config']] if active_rule else []) + list(rule_configs)
+    loop = asyncio.get_running_loop()
+    outcomes = await asyncio.gather(*[
+        loop.run_in_executor(get_scoring_executor(), _score_outcomes, frame, config, strict)
+        for config in configs
+    ])
+    active = outcomes.pop(0) if active_rule else None
+
+    candidates = []
+    for index, (verdicts, credit_limits) in enumerate(outcomes):
+        candidate = {'index': index, **_summary(verdicts, credit_limits)}
+        if active is not None:
+            flipped = np.flatnonzero(verdicts != active[0])
+            candidate['flip_count'] = int(len(flipped))
+            candidate['flips'] = [
+                {
+                    'business_id': rows[position].id,
+                    'business_name': rows[position].business_name,
+                    'active_verdict': active[0][position],
+                    'candidate_verdict': verdicts[position]
+                }
+                for position in flipped[:SIMULATION_MAX_FLIPS]
+            ]
+        candidates.append(candidate)
+
+    return {
+        'applicants': len(rows),
+        'skipped': skipped,
+        'active_rule_id': active_rule['id'] if active_rule else None,
+        'active': _summary(*active) if active is not None else None,
+        'candidates': candidates
+    }
@@ -0,0 +1,164 @@
+from collections import Counter, defaultdict
+from datetime import date, datetime
+
+import pytz
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import STATS_TIMEZONE, STATS_TOP_CRITERIA
+from backend.app.crud.db_crud_operations import fetch_model_entries_async
+from backend.app.model_utils.risk_utils import parse_credit_limit
+from backend.app.models import DailyVerdictStats, DailyCriterionFailures, Verdict
+
+_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+def stats_day(created_at: datetime) -> date:
+    """Statistics bucket of a business: the day it was evaluated, in STATS_TIMEZONE."""
+    if created_at.tzinfo is None:
+        created_at = pytz.utc.localize(created_at)
+    return created_at.astimezone(pytz.timezone(STATS_TIMEZONE)).date()
+
+
+def today() -> date:
+    return stats_day(datetime.now(pytz.utc))
+
+
+async def _increment(db: AsyncSession, model, keys, counters):
+    """
+    Add `counters` to the rows identified by `keys` with one INSERT ... ON CONFLICT DO UPDATE,
+    so concurrent evaluations never lose an increment.
+    """
+    if not counters:
+        return
+    rows = [{**dict(zip(keys, key)), **values} for key, values in sorted(counters.items())]
+    statement = _INSERTS[db.bind.dialect.name](model).values(rows)
+    await db.execute(statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={
+            column: getattr(model, column) + getattr(statement.excluded, column)
+            for column in rows[0] if column not in keys
+        }
+    ))
+
+
+async def record_evaluations(db: AsyncSession, added=(), removed=()):
+    """
+    Update the dashboard statistics for risk responses written or replaced in the caller's
+    transaction. Each item is (created_at, business_sector, risk_response); a re-scored business
+    is removed with its old response and added with the new one.
+
+    :param db: Async SQLAlchemy session
+    :param added: Risk responses now stored
+    :param removed: Risk responses no longer stored
+    """
+    verdicts = defaultdict(Counter)
+    failures = Counter()
+    for sign, items in ((1, added), (-1, removed)):
+        for created_at, business_sector, risk_response in items:
+            bucket = (stats_day(created_at), business_sector or "")
+            verdict = risk_response.get("verdict")
+            if verdict is not None:
+                counter = verdicts[(*bucket, Verdict(verdict))]
+                counter['evaluations'] += sign
+                credit_limit = parse_credit_limit(risk_response.get("credit_limit"))
+                if credit_limit is not None:
+                    counter['credit_limit_sum'] += sign * credit_limit
+                    counter['credit_limit_count'] += sign
+            for criterion, outcome in (risk_response.get("criteria") or {}).items():
+                if outcome.get("result") == "Fail":
+                    failures[(*bucket, criterion)] += sign
+
+    await _increment(
+        db, DailyVerdictStats, ['day', 'business_sector', 'verdict'],
+        {
+            key: {column: counter[column] for column in ('evaluations', 'credit_limit_sum', 'credit_limit_count')}
+            for key, counter in verdicts.items() if any(counter.values())
+        }
+    )
+    await _increment(
+        db, DailyCriterionFailures, ['day', 'business_sector', 'criterion'],
+        {key: {'failures': count} for key, count in failures.items() if count}
+    )
+
+
+def _bucket():
+    return {'evaluations': 0, 'verdicts': Counter(), 'credit_limit_sum': 0, 'credit_limit_count': 0, 'failures': Counter()}
+
+
+def _summary(bucket):
+    evaluations = bucket['evaluations']
+    return {
+        'evaluations': evaluations,
+        'verdicts': {verdict.value: bucket['verdicts'][verdict.value] for verdict in Verdict},
+        'approval_rate': round(bucket['verdicts'][Verdict.APPROVED.value] / evaluations, 4) if evaluations else None,
+        'average_credit_limit': (
+            round(bucket['credit_limit_sum'] / bucket['credit_limit_count']) if bucket['credit_limit_count'] else None
+        ),
+        'top_failing_criteria': [
+            {'criterion': criterion, 'failures': count}
+            for criterion, count in bucket['failures'].most_common(STATS_TOP_CRITERIA) if count > 0
+        ]
+    }
+
+
+async def get_stats(db: AsyncSession, date_from: date, date_to: date):
+    """
+    Dashboard statistics for businesses evaluated between two days, read from the summary
+    tables so the cost depends on the number of days and sectors, not on the number of
+    businesses.
+
+    :param db: Async SQLAlchemy session
+    :param date_from: First day, inclusive
+    :param date_to: Last day, inclusive
+    :return: Dict with the overall summary and one summary per day and per business sector:
+             verdict counts, approval rate, average credit limit of approved businesses and the
+             most common failing criteria
+    """
+    day_range = {'day__gte': date_from, 'day__lte': date_to}
+    verdict_rows = await fetch_model_entries_async(
+        db=db,
+        model=DailyVerdictStats,
+        filter_data=day_range,
+        aggregate_data={'evaluations': 'sum', 'credit_limit_sum': 'sum', 'credit_limit_count': 'sum'},
+        group_by=['day', 'business_sector', 'verdict']
+    )
+    failure_rows = await fetch_model_entries_async(
+        db=db,
+        model=DailyCriterionFailures,
+        filter_data=day_range,
+        aggregate_data={'failures': 'sum'},
+        group_by=['day', 'business_sector', 'criterion']
+    )
+
+    total = _bucket()
+    by_day = defaultdict(_bucket)
+    by_sector = defaultdict(_bucket)
+    # SUM() of a bigint is a numeric on Postgres, hence the int() conversions
+    for day, business_sector, verdict, evaluations, credit_limit_sum, credit_limit_count in verdict_rows:
+        for bucket in (total, by_day[day], by_sector[business_sector]):
+            bucket['evaluations'] += int(evaluations)
+            bucket['verdicts'][Verdict(verdict).value] += int(evaluations)
+            bucket['credit_limit_sum'] += int(credit_limit_sum)
+            bucket['credit_limit_count'] += int(credit_limit_count)
+    for day, business_sector, criterion, failures in failure_rows:
+        for bucket in (total, by_day[day], by_sector[business_sector]):
+            bucket['failures'][criterion] += int(failures)
+
+    return {
+        'date_from': date_from.isoformat(),
+        'date_to': date_to.isoformat(),
+        'total': _summary(total),
+        'by_day': [
+            {'day': day.isoformat(), **_summary(by_day[day])}
+            for day in sorted(by_day) if by_day[day]['evaluations']
+        ],
+        'by_sector': [
+            {'business_sector': business_sector or None, **_summary(by_sector[business_sector])}
+            for business_sector in sorted(by_sector) if by_sector[business_sector]['evaluations']
+        ]
+    }
+
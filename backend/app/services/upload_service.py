@@ -0,0 +1,78 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+
+from fastapi import UploadFile
+
+from backend.app.core.config import UPLOAD_MAX_BYTES, UPLOAD_CHUNK_SIZE, UPLOAD_SPOOL_DIR
+
+
+class UploadTooLarge(Exception):
+    """Raised when an uploaded file exceeds UPLOAD_MAX_BYTES."""
+
+
+def _write_chunk(f, digest, chunk):
+    digest.update(chunk)
+    f.write(chunk)
+
+
+async def spool_upload(upload: UploadFile, max_bytes: int = UPLOAD_MAX_BYTES) -> dict:
+    """
+    Copy an upload to a temporary file chunk by chunk, hashing it on the way.
+
+    Only one chunk is held in memory at a time, and copying stops as soon as
+    the file grows past `max_bytes`.
+
+    :param upload: Uploaded file
+    :param max_bytes: Maximum accepted size in bytes
+    :return: Dict with the spooled file's path, SHA-256 content_hash and size
+    :raises UploadTooLarge: If the file is larger than `max_bytes`
+    """
+    await asyncio.to_thread(os.makedirs, UPLOAD_SPOOL_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=".pdf", dir=UPLOAD_SPOOL_DIR)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"{upload.filename} exceeds the {max_bytes} byte upload limit")
+                await asyncio.to_thread(_write_chunk, f, digest, chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return {
+        'path': path,
+        'content_hash': digest.hexdigest(),
+        'size': size
+    }
+
+
+def describe_file(path: str) -> dict:
+    """
+    Build the same description `spool_upload` returns for a file already on disk.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            digest.update(chunk)
+    return {
+        'path': path,
+        'content_hash': digest.hexdigest(),
+        'size': size
+    }
+
+
+def remove_uploads(*uploads):
+    """
+    Delete spooled upload files, ignoring ones that are already gone.
+    """
+    for upload in uploads:
+        try:
+            os.remove(upload['path'])
+        except FileNotFoundError:
+            pass
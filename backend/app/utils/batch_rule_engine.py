@@ -0,0 +1,151 @@
+import operator
+
+import numpy as np
+import pandas as pd
+
+from backend.app.utils.rule_engine_utils import (
+    compile_rules, VERDICT_APPROVED, VERDICT_REJECTED, VERDICT_MANUAL_REVIEW
+)
+
+
+def score_portfolio(data_points, defined_rules, strict=False, include_masks=False):
+    """
+    Score many applicants at once with the same outcome as calling
+    `predict_risk_score_based_on_rule_engine` for each of them.
+
+    Every criterion becomes a pass/fail mask over the whole column and the verdict and credit
+    limit are computed from the masks with array operations; only the credit limit strings of
+    approved applicants are formatted one by one.
+
+    Args:
+        data_points (pd.DataFrame | dict): One row per applicant, one column per data point.
+            A dict of column name to array or list is accepted too. Missing values (None/NaN)
+            and missing columns mean the data point is not available.
+        defined_rules (dict): Defined threshold rules for approval
+        strict (bool): Whether to use strict mode for evaluation
+        include_masks (bool): Add a boolean `<key>_passed` column per criterion
+
+    Returns:
+        pd.DataFrame: Indexed like the input, with passed_criteria, pass_percentage,
+            critical_failure, verdict, credit_limit (formatted as by the scalar engine, None
+            unless approved) and credit_limit_value (NaN unless approved)
+    """
+    frame = data_points if isinstance(data_points, pd.DataFrame) else pd.DataFrame(data_points)
+    plan = compile_rules(defined_rules)
+    rows = len(frame)
+
+    passed = np.zeros(rows, dtype=np.int64)
+    critical_failure = np.zeros(rows, dtype=bool)
+    masks = {}
+    for key, expected, _, compare, _, _, critical in plan.criteria:
+        column = frame[key] if key in frame else pd.Series(None, index=frame.index, dtype=object)
+        present = column.notna().to_numpy()
+        # Nullable columns (pd.NA) are compared as plain arrays; missing values fail through `present`
+        if compare is operator.eq:
+            values = column.to_numpy(dtype=object, na_value=None) if column.hasnans else column.to_numpy()
+        else:
+            values = pd.to_numeric(column).to_numpy(dtype=float, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            mask = present & np.asarray(compare(values, expected), dtype=bool)
+
+        passed += mask
+        if critical:
+            critical_failure |= present & ~mask
+        masks[key] = mask
+
+    total = len(plan.criteria)
+    pass_percentage = (passed / total) * 100 if total > 0 else np.zeros(rows)
+
+    if strict:
+        approved = passed == total
+        verdict = np.where(approved, VERDICT_APPROVED, VERDICT_REJECTED).astype(object)
+    else:
+        approved = ~critical_failure & (pass_percentage >= 80)
+        review = ~critical_failure & ~approved & (pass_percentage >= 60)
+        verdict = np.select([approved, review], [VERDICT_APPROVED, VERDICT_MANUAL_REVIEW], VERDICT_REJECTED).astype(object)
+
+    credit_limit_value = np.full(rows, np.nan)
+    credit_limit = np.full(rows, None, dtype=object)
+    if approved.any():
+        limits = calculate_credit_limits(frame[approved], plan.rules, pass_percentage[approved])
+        credit_limit_value[approved] = limits
+        credit_limit[approved] = [f"Rs {limit:,.0f}" for limit in limits]
+
+    result = pd.DataFrame({
+        "passed_criteria": passed,
+        "pass_percentage": pass_percentage,
+        "critical_failure": critical_failure,
+        "verdict": verdict,
+        "credit_limit": credit_limit,
+        "credit_limit_value": credit_limit_value
+    }, index=frame.index)
+    if include_masks:
+        for key, mask in masks.items():
+            result[f"{key}_passed"] = mask
+    return result
+
+
+def _numeric_column(frame, key, default):
+    if key not in frame:
+        return np.full(len(frame), float(default))
+    return pd.to_numeric(frame[key]).fillna(default).to_numpy(dtype=float)
+
+
+def calculate_credit_limits(frame, rules, pass_percentage):
+    """
+    Vectorized `_calculate_credit_limit`. The adjustment factors are multiplied in the same
+    order as the scalar version, so the rounded limits are identical.
+
+    Args:
+        frame (pd.DataFrame): Data points of approved applicants
+        rules (dict): Thresholds with string values already converted (`RulePlan.rules`)
+        pass_percentage (np.ndarray): Pass percentage of each applicant
+
+    Returns:
+        np.ndarray: Credit limit of each applicant in rupees
+    """
+    # Base calculation - start with 15% of annual sales
+    annual_sales = _numeric_column(frame, "last_12_month_sales_in_rs", 0)
+    base_limit = annual_sales * 0.15
+
+    # Adjustment factors
+    adjustments = np.ones(len(frame))
+
+    # Debt-to-turnover adjustment (lower is better)
+    debt_ratio = _numeric_column(frame, "debt_to_turnover_ratio", 0)
+    max_debt_ratio = rules.get("debt_to_turnover_ratio", 2)
+    adjustments *= np.select(
+        [debt_ratio < max_debt_ratio * 0.5, debt_ratio < max_debt_ratio * 0.75, debt_ratio > max_debt_ratio * 0.9],
+        [1.2, 1.1, 0.9],
+        1.0
+    )
+
+    # Business vintage adjustment (higher is better)
+    vintage = _numeric_column(frame, "business_vintage", 0)
+    min_vintage = rules.get("business_vintage", 2)
+    adjustments *= np.select(
+        [vintage >= min_vintage * 3, vintage >= min_vintage * 2, vintage >= min_vintage * 1.5],
+        [1.3, 1.2, 1.1],
+        1.0
+    )
+
+    # DPD history adjustment (any DPD reduces limit)
+    if "is_30_plus_dpd" in frame:
+        dpd = frame["is_30_plus_dpd"].astype("boolean").fillna(False).to_numpy(dtype=bool)
+        adjustments *= np.where(dpd, 0.8, 1.0)
+
+    # Turnover dip adjustment
+    dip = _numeric_column(frame, "turnover_dip_percent_change", 0)
+    max_dip = rules.get("turnover_dip_percent_change", 75)
+    adjustments *= np.where(dip > max_dip * 0.8, 0.85, 1.0)
+
+    # Risk profile cap based on pass percentage
+    cap_multiplier = np.select(
+        [pass_percentage >= 95, pass_percentage >= 90, pass_percentage >= 85, pass_percentage >= 80],
+        [1.0, 0.9, 0.8, 0.7],
+        0.6
+    )
+    final_limit = base_limit * adjustments * cap_multiplier
+
+    # Round to nearest 10,000 (half to even, like round()) with a minimum viable limit
+    return np.maximum(np.round(final_limit / 10000) * 10000, 100000)
@@ -1,3 +1,35 @@
+import math
+import operator
+from functools import lru_cache
+
+from backend.app.core.config import RULE_PLAN_CACHE_SIZE
+
+VERDICT_APPROVED = "APPROVED"
+VERDICT_REJECTED = "REJECTED"
+VERDICT_MANUAL_REVIEW = "NEEDS_MANUAL_REVIEW"
+
+# Deal-breakers even in normal mode
+CRITICAL_KEYS = ("is_30_plus_dpd", "is_60_plus_dpd", "is_90_plus_dpd", "adverse_remarks_present")
+# Boolean flags (like DPD indicators, adverse remarks) - actual should match expected
+FLAG_KEYS = CRITICAL_KEYS + ("debt_gt_one_year",)
+# Count fields (like credit enquiries, loans disbursed) - actual should be <= expected
+COUNT_KEYS = ("unsecured_credit_enquiries_90_days", "unsecured_loans_disbursed_3_months")
+# Business vintage, applicant age, proprietor age - actual should be >= expected
+MINIMUM_KEYS = ("business_vintage", "applicant_age", "proprietor_age")
+# String values of these keys are converted before comparison
+DATA_TYPES = {
+    "last_12_month_sales_in_rs": int,
+    "business_vintage": int,
+    "applicant_age": int,
+    "proprietor_age": int,
+    "debt_to_turnover_ratio": float,
+}
+# Keys compared with <= or >=; their thresholds must be numbers or numeric strings
+NUMERIC_KEYS = COUNT_KEYS + MINIMUM_KEYS + (
+    "turnover_dip_percent_change", "last_12_month_sales_in_rs", "debt_to_turnover_ratio"
+)
+
+
 def predict_risk_score_based_on_rule_engine(fetched_data_points, defined_rules, strict=False):
     """
     Predicts risk score and loan approval decision based on fetched data points and defined rules.
@@ -10,157 +42,237 @@ def predict_risk_score_based_on_rule_engine(fetched_data_points, defined_rules,
     Returns:
         dict: Decision output with verdict, credit limit, reason, and detailed criteria evaluation
     """
-    # Initialize results
-    result = {
-        "verdict": "NEEDS_MANUAL_REVIEW",
-        "credit_limit": None,
-        "reason": "",
-        "criteria": {}
-    }
+    return compile_rules(defined_rules).evaluate(fetched_data_points, strict=strict)
 
-    # Track failures
-    failures = []
-    critical_failures = []
-    total_criteria = 0
-    passed_criteria = 0
-
-    # Convert string values to appropriate types for comparison
-    processed_data = _process_data_types(fetched_data_points)
-    processed_rules = _process_data_types(defined_rules)
-
-    # Evaluate each criterion
-    for key, expected_value in processed_rules.items():
-        total_criteria += 1
-        actual_value = processed_data.get(key)
-
-        # Skip if data point not available
-        if actual_value is None:
-            result["criteria"][key] = {
-                "expected": expected_value,
-                "actual": "Not available",
-                "result": "Fail",
-                "remark": "Data point not available"
-            }
-            failures.append(f"Missing data point: {key}")
-            continue
-
-        # Determine comparison logic based on data type and field
-        comparison_result, remark = _compare_values(key, actual_value, expected_value)
-
-        # Record the result
-        result["criteria"][key] = {
-            "expected": expected_value,
-            "actual": actual_value,
-            "result": "Pass" if comparison_result else "Fail",
-            "remark": remark
-        }
 
-        if comparison_result:
-            passed_criteria += 1
-        else:
-            failures.append(remark)
+def compile_rules(defined_rules):
+    """
+    Return the compiled plan for a rule config, reusing the cached plan when the same
+    config has been seen before.
 
-            # Mark critical failures (these are deal-breakers even in normal mode)
-            if key in ["is_30_plus_dpd", "is_60_plus_dpd", "is_90_plus_dpd", "adverse_remarks_present"]:
-                critical_failures.append(remark)
+    Args:
+        defined_rules (dict): Defined threshold rules for approval
+
+    Returns:
+        RulePlan: Plan whose `evaluate` scores one set of data points
+    """
+    # The value types are part of the key so that e.g. True and 1 do not share a plan
+    config_key = (tuple(defined_rules.items()), tuple(map(type, defined_rules.values())))
+    try:
+        return _compile_cached(config_key)
+    except TypeError:
+        # Unhashable threshold values cannot be cached; compile for this call only
+        return RulePlan(defined_rules)
+
+
+@lru_cache(maxsize=RULE_PLAN_CACHE_SIZE)
+def _compile_cached(config_key):
+    return RulePlan(dict(config_key[0]))
+
+
+@lru_cache(maxsize=None)
+def _compile_criterion(key):
+    """
+    Return (comparator, pass remark, fail remark) for a rule key. A remark is either the final
+    string or a function of the actual value and the threshold that renders it.
+    Depends only on the key, so each key is compiled once per process.
+    """
+    title = key.replace('_', ' ').title()
+    if key in FLAG_KEYS:
+        return (
+            operator.eq,
+            f"{title} status is acceptable",
+            f"{title} status doesn't meet requirements"
+        )
+    if key in COUNT_KEYS:
+        return (
+            operator.le,
+            f"{title} count is within limits",
+            f"{title} count exceeds limits"
+        )
+    # Turnover dip - actual should be <= expected (lower dip is better)
+    if key == "turnover_dip_percent_change":
+        return (
+            operator.le,
+            lambda actual, expected: f"Turnover dip is acceptable at {actual}%",
+            lambda actual, expected: f"Turnover dip is too high at {actual}%"
+        )
+    # Annual sales - actual should be >= expected (higher sales are better)
+    if key == "last_12_month_sales_in_rs":
+        return (
+            operator.ge,
+            lambda actual, expected: f"Annual sales of Rs {actual:,} meet minimum requirements",
+            lambda actual, expected: f"Annual sales of Rs {actual:,} below minimum requirement of Rs {expected:,}"
+        )
+    # Debt-to-turnover ratio - actual should be <= expected (lower ratio is better)
+    if key == "debt_to_turnover_ratio":
+        return (
+            operator.le,
+            lambda actual, expected: f"Debt-to-turnover ratio of {actual} is acceptable",
+            lambda actual, expected: f"Debt-to-turnover ratio of {actual} exceeds maximum of {expected}"
+        )
+    if key in MINIMUM_KEYS:
+        return (
+            operator.ge,
+            lambda actual, expected: f"{title} of {actual} meets minimum requirements",
+            lambda actual, expected: f"{title} of {actual} below minimum requirement of {expected}"
+        )
+    # Default case - actual should match expected
+    return (
+        operator.eq,
+        f"{title} meets requirements",
+        f"{title} doesn't meet requirements"
+    )
+
+
+class RulePlan:
+    """
+    A rule config compiled once into typed thresholds, a comparator per key and remark
+    templates, so that scoring a set of data points is a single pass over the criteria.
+    """
 
-    # Determine verdict
-    pass_percentage = (passed_criteria / total_criteria) * 100 if total_criteria > 0 else 0
+    def __init__(self, defined_rules):
+        self.rules = _process_data_types(defined_rules)
+        self.criteria = [
+            (key, expected, DATA_TYPES.get(key), *_compile_criterion(key), key in CRITICAL_KEYS)
+            for key, expected in self.rules.items()
+        ]
+
+    def evaluate(self, fetched_data_points, strict=False):
+        """
+        Score one set of data points; same output as `predict_risk_score_based_on_rule_engine`.
+        """
+        # Initialize results
+        criteria = {}
+        result = {
+            "verdict": "NEEDS_MANUAL_REVIEW",
+            "credit_limit": None,
+            "reason": "",
+            "criteria": criteria
+        }
 
-    if strict and passed_criteria == total_criteria:
-        result["verdict"] = "APPROVED"
-        result["reason"] = "All criteria passed in strict mode."
-    elif not strict:
-        if not critical_failures and pass_percentage >= 80:
+        # Track failures; only critical ones end up in the reason
+        critical_failures = []
+        total_criteria = len(self.criteria)
+        passed_criteria = 0
+
+        # Evaluate each criterion; string data points are converted as they are compared
+        for key, expected_value, convert, compare, on_pass, on_fail, critical in self.criteria:
+            actual_value = fetched_data_points.get(key)
+            if convert is not None and actual_value.__class__ is str:
+                actual_value = convert(actual_value)
+
+            # Skip if data point not available
+            if actual_value is None:
+                criteria[key] = {
+                    "expected": expected_value,
+                    "actual": "Not available",
+                    "result": "Fail",
+                    "remark": "Data point not available"
+                }
+                continue
+
+            if compare(actual_value, expected_value):
+                passed_criteria += 1
+                criteria[key] = {
+                    "expected": expected_value,
+                    "actual": actual_value,
+                    "result": "Pass",
+                    "remark": on_pass if on_pass.__class__ is str else on_pass(actual_value, expected_value)
+                }
+            else:
+                remark = on_fail if on_fail.__class__ is str else on_fail(actual_value, expected_value)
+                criteria[key] = {
+                    "expected": expected_value,
+                    "actual": actual_value,
+                    "result": "Fail",
+                    "remark": remark
+                }
+                if critical:
+                    critical_failures.append(remark)
+
+        # Determine verdict
+        pass_percentage = (passed_criteria / total_criteria) * 100 if total_criteria > 0 else 0
+
+        if strict and passed_criteria == total_criteria:
             result["verdict"] = "APPROVED"
-            result[
-                "reason"] = f"Passed {passed_criteria}/{total_criteria} criteria ({pass_percentage:.1f}%). No critical failures."
-        elif not critical_failures and pass_percentage >= 60:
-            result["verdict"] = "NEEDS_MANUAL_REVIEW"
-            result[
-                "reason"] = f"Passed {passed_criteria}/{total_criteria} criteria ({pass_percentage:.1f}%). Review recommended."
+            result["reason"] = "All criteria passed in strict mode."
+        elif not strict:
+            if not critical_failures and pass_percentage >= 80:
+                result["verdict"] = "APPROVED"
+                result[
+                    "reason"] = f"Passed {passed_criteria}/{total_criteria} criteria ({pass_percentage:.1f}%). No critical failures."
+            elif not critical_failures and pass_percentage >= 60:
+                result["verdict"] = "NEEDS_MANUAL_REVIEW"
+                result[
+                    "reason"] = f"Passed {passed_criteria}/{total_criteria} criteria ({pass_percentage:.1f}%). Review recommended."
+            else:
+                result["verdict"] = "REJECTED"
+                reason = f"Failed {total_criteria - passed_criteria}/{total_criteria} criteria."
+                if critical_failures:
+                    reason += f" Critical failures: {', '.join(critical_failures)}"
+                result["reason"] = reason
         else:
             result["verdict"] = "REJECTED"
-            reason = f"Failed {total_criteria - passed_criteria}/{total_criteria} criteria."
-            if critical_failures:
-                reason += f" Critical failures: {', '.join(critical_failures)}"
-            result["reason"] = reason
-    else:
-        result["verdict"] = "REJECTED"
-        result["reason"] = f"Failed {total_criteria - passed_criteria}/{total_criteria} criteria in strict mode."
+            result["reason"] = f"Failed {total_criteria - passed_criteria}/{total_criteria} criteria in strict mode."
 
-    # Calculate credit limit if approved
-    if result["verdict"] == "APPROVED":
-        result["credit_limit"] = _calculate_credit_limit(processed_data, processed_rules, pass_percentage)
+        # Calculate credit limit if approved
+        if result["verdict"] == "APPROVED":
+            result["credit_limit"] = _calculate_credit_limit(
+                _process_data_points(fetched_data_points), self.rules, pass_percentage
+            )
 
-    return result
+        return result
 
 
 def _process_data_types(data_dict):
-    """Convert string values to appropriate types for comparison"""
+    """
+    Check each threshold against its key and convert string values to the type they are
+    compared as. Raises ValueError for a threshold that could never be compared, e.g. a
+    non-numeric count or a flag that is not a boolean, so a bad rule config is refused
+    when it is compiled rather than failing every evaluation.
+    """
     processed = {}
     for key, value in data_dict.items():
-        if key in ["last_12_month_sales_in_rs", "business_vintage", "applicant_age", "proprietor_age"]:
-            # Convert string numbers to integers
-            processed[key] = int(value) if isinstance(value, str) else value
-        elif key == "debt_to_turnover_ratio":
-            # Convert string ratios to floats
-            processed[key] = float(value) if isinstance(value, str) else value
+        if key in FLAG_KEYS:
+            processed[key] = _flag_threshold(key, value)
+        elif key in NUMERIC_KEYS:
+            processed[key] = _numeric_threshold(key, value)
         else:
             processed[key] = value
     return processed
 
 
-def _compare_values(key, actual, expected):
-    """Compare actual and expected values based on the type of data point"""
-    # Boolean flags (like DPD indicators, adverse remarks) - actual should match expected
-    if key in ["is_30_plus_dpd", "is_60_plus_dpd", "is_90_plus_dpd", "adverse_remarks_present", "debt_gt_one_year"]:
-        if actual == expected:
-            return True, f"{key.replace('_', ' ').title()} status is acceptable"
-        else:
-            return False, f"{key.replace('_', ' ').title()} status doesn't meet requirements"
-
-    # Count fields (like credit enquiries, loans disbursed) - actual should be <= expected
-    elif key in ["unsecured_credit_enquiries_90_days", "unsecured_loans_disbursed_3_months"]:
-        if actual <= expected:
-            return True, f"{key.replace('_', ' ').title()} count is within limits"
-        else:
-            return False, f"{key.replace('_', ' ').title()} count exceeds limits"
-
-    # Turnover dip - actual should be <= expected (lower dip is better)
-    elif key == "turnover_dip_percent_change":
-        if actual <= expected:
-            return True, f"Turnover dip is acceptable at {actual}%"
-        else:
-            return False, f"Turnover dip is too high at {actual}%"
-
-    # Annual sales - actual should be >= expected (higher sales are better)
-    elif key == "last_12_month_sales_in_rs":
-        if actual >= expected:
-            return True, f"Annual sales of Rs {actual:,} meet minimum requirements"
-        else:
-            return False, f"Annual sales of Rs {actual:,} below minimum requirement of Rs {expected:,}"
-
-    # Debt-to-turnover ratio - actual should be <= expected (lower ratio is better)
-    elif key == "debt_to_turnover_ratio":
-        if actual <= expected:
-            return True, f"Debt-to-turnover ratio of {actual} is acceptable"
-        else:
-            return False, f"Debt-to-turnover ratio of {actual} exceeds maximum of {expected}"
+def _process_data_points(fetched_data_points):
+    """Copy of the data points with string values of DATA_TYPES keys converted"""
+    processed = dict(fetched_data_points)
+    for key, convert in DATA_TYPES.items():
+        value = processed.get(key)
+        if isinstance(value, str):
+            processed[key] = convert(value)
+    return processed
 
-    # Business vintage, applicant age, proprietor age - actual should be >= expected
-    elif key in ["business_vintage", "applicant_age", "proprietor_age"]:
-        if actual >= expected:
-            return True, f"{key.replace('_', ' ').title()} of {actual} meets minimum requirements"
-        else:
-            return False, f"{key.replace('_', ' ').title()} of {actual} below minimum requirement of {expected}"
 
-    # Default case
-    else:
-        if actual == expected:
-            return True, f"{key.replace('_', ' ').title()} meets requirements"
-        else:
-            return False, f"{key.replace('_', ' ').title()} doesn't meet requirements"
+def _flag_threshold(key, value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    raise ValueError(f"Rule '{key}' must be true or false, got {value!r}")
+
+
+def _numeric_threshold(key, value):
+    if isinstance(value, str):
+        convert = DATA_TYPES.get(key)
+        try:
+            value = convert(value) if convert else float(value) if '.' in value else int(value)
+        except ValueError:
+            raise ValueError(f"Rule '{key}' must be a number, got {value!r}") from None
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Rule '{key}' must be a number, got {value!r}")
+    if not math.isfinite(value):
+        raise ValueError(f"Rule '{key}' must be a finite number, got {value!r}")
+    return value
 
 
 def _calculate_credit_limit(data, rules, pass_percentage):
@@ -0,0 +1,61 @@
+"""
+Score a synthetic portfolio with the vectorized batch engine and compare it with the scalar
+engine: verdicts, pass percentages and credit limits must match for every applicant.
+
+Usage:
+    python -m benchmarks.bench_batch_scoring --applicants 100000 --check 20000
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from backend.app.utils.batch_rule_engine import score_portfolio
+from backend.app.utils.rule_engine_utils import predict_risk_score_based_on_rule_engine
+from benchmarks.synthetic_applicants import DEFAULT_RULES, make_applicants
+
+
+def check(applicants, scored, strict):
+    """Return the number of applicants whose batch result differs from the scalar engine."""
+    mismatches = 0
+    for applicant, row in zip(applicants, scored.itertuples()):
+        expected = predict_risk_score_based_on_rule_engine(applicant, DEFAULT_RULES, strict=strict)
+        passed = sum(criterion["result"] == "Pass" for criterion in expected["criteria"].values())
+        if (row.verdict, row.credit_limit, row.passed_criteria) != (expected["verdict"], expected["credit_limit"], passed):
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=100000)
+    parser.add_argument("--check", type=int, default=20000, help="Applicants also scored by the scalar engine")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best time is kept")
+    args = parser.parse_args()
+
+    applicants = make_applicants(args.applicants)
+    frame = pd.DataFrame(applicants)
+
+    print(f"{'mode':<7} {'applicants':>10} {'batch s':>8} {'scalar s':>9} {'speedup':>8} {'mismatches':>10}")
+    for strict in (False, True):
+        batch_seconds = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            scored = score_portfolio(frame, DEFAULT_RULES, strict=strict)
+            elapsed = time.perf_counter() - started
+            batch_seconds = elapsed if batch_seconds is None else min(batch_seconds, elapsed)
+
+        sample = applicants[:args.check]
+        started = time.perf_counter()
+        mismatches = check(sample, scored.iloc[:len(sample)], strict)
+        # check() also compares results, so this slightly overstates the scalar cost
+        scalar_seconds = (time.perf_counter() - started) * len(applicants) / max(len(sample), 1)
+
+        print(
+            f"{'strict' if strict else 'normal':<7} {len(applicants):>10} {batch_seconds:>8.3f} "
+            f"{scalar_seconds:>9.2f} {scalar_seconds / batch_seconds:>7.0f}x {mismatches:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Compare the PDF text extraction backends on synthetic CIBIL and GST reports.
+
+For every backend and document the benchmark reports single-core pages per second,
+peak RSS growth while extracting, line fidelity (share of ground-truth lines found in
+the extracted text) and field recall (share of the lines the rule engine depends on).
+Each measurement runs in a fresh process so memory numbers do not leak between backends.
+
+Usage:
+    python -m benchmarks.bench_pdf_backends --sizes 2 10 40 --repeat 3 --json results.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.app.services.pdf_service import PDF_BACKENDS, get_pdf_backend
+from benchmarks.synthetic_pdf import make_cibil_pdf, make_gst_pdf
+
+
+def _normalize(text):
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _recall(expected_lines, text):
+    if not expected_lines:
+        return 1.0
+    normalized = _normalize(text)
+    return sum(_normalize(line) in normalized for line in expected_lines) / len(expected_lines)
+
+
+def _measure(backend_name, path, repeat):
+    """Runs in a fresh worker process."""
+    backend = get_pdf_backend(backend_name)
+    # Warm up imports and library state so they are not counted as extraction cost
+    pages = backend.page_count(path)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    best = None
+    text = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = "".join(f"{page}\n" for page in backend.iter_page_texts(path))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "pages": pages,
+        "seconds": best,
+        "peak_rss_growth_kb": rss_after - rss_before,  # ru_maxrss is in KiB on Linux
+        "text": text,
+    }
+
+
+def build_corpus(sizes, directory):
+    corpus = []
+    for size in sizes:
+        for doc_type, (pdf_bytes, truth) in (
+            ("CIBIL", make_cibil_pdf(accounts=size * 36, seed=size)),
+            ("GST", make_gst_pdf(months=24, customers=max(1, size * 30 // 24), seed=size)),
+        ):
+            path = os.path.join(directory, f"{doc_type.lower()}_{size}.pdf")
+            with open(path, "wb") as f:
+                f.write(pdf_bytes)
+            corpus.append({"doc_type": doc_type, "size": size, "path": path, "truth": truth})
+    return corpus
+
+
+def run(sizes, backends, repeat):
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for document in build_corpus(sizes, directory):
+            for backend_name in backends:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    measured = executor.submit(_measure, backend_name, document["path"], repeat).result()
+                text = measured.pop("text")
+                results.append({
+                    "backend": backend_name,
+                    "doc_type": document["doc_type"],
+                    "file_kb": os.path.getsize(document["path"]) // 1024,
+                    **measured,
+                    "pages_per_second": measured["pages"] / measured["seconds"] if measured["seconds"] else None,
+                    "line_fidelity": _recall(document["truth"]["lines"], text),
+                    "field_recall": _recall(document["truth"]["fields"], text),
+                })
+    return results
+
+
+def recommend(results):
+    """Fastest backend per document type among those that recover every required field."""
+    recommendation = {}
+    for doc_type in sorted({result["doc_type"] for result in results}):
+        totals = {}
+        for result in results:
+            if result["doc_type"] != doc_type:
+                continue
+            total = totals.setdefault(result["backend"], {"pages": 0, "seconds": 0.0, "complete": True})
+            total["pages"] += result["pages"]
+            total["seconds"] += result["seconds"]
+            total["complete"] &= result["field_recall"] == 1.0
+        eligible = {name: t for name, t in totals.items() if t["complete"]}
+        if eligible:
+            recommendation[doc_type] = max(eligible, key=lambda name: eligible[name]["pages"] / eligible[name]["seconds"])
+    return recommendation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 10, 40], help="Approximate pages per document")
+    parser.add_argument("--backends", nargs="+", default=sorted(PDF_BACKENDS), choices=sorted(PDF_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best time is kept")
+    parser.add_argument("--json", help="Write the raw results to this file")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.backends, args.repeat)
+
+    print(f"{'backend':<11} {'doc':<6} {'pages':>5} {'pages/s':>9} {'rss MB':>7} {'fidelity':>9} {'fields':>7}")
+    for result in results:
+        print(
+            f"{result['backend']:<11} {result['doc_type']:<6} {result['pages']:>5} "
+            f"{result['pages_per_second']:>9.1f} {result['peak_rss_growth_kb'] / 1024:>7.1f} "
+            f"{result['line_fidelity']:>9.1%} {result['field_recall']:>7.1%}"
+        )
+    recommendation = recommend(results)
+    for doc_type, backend_name in recommendation.items():
+        print(f"Fastest complete backend for {doc_type}: {backend_name} (PDF_BACKEND_{doc_type}={backend_name})")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"results": results, "recommendation": recommendation}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
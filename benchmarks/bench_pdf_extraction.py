@@ -0,0 +1,54 @@
+"""
+Measure PDF text extraction throughput as the process pool grows.
+
+Usage:
+    python -m benchmarks.bench_pdf_extraction --pages 40 --documents 16
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.app.services.pdf_service import extract_text
+from benchmarks.synthetic_pdf import make_text_pdf
+
+
+async def _run(pdf_path, documents, executor, pages_per_chunk):
+    await asyncio.gather(*[
+        extract_text(pdf_path, executor=executor, pages_per_chunk=pages_per_chunk)
+        for _ in range(documents)
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40, help="Pages per synthetic document")
+    parser.add_argument("--documents", type=int, default=16, help="Documents extracted per run")
+    parser.add_argument("--pages-per-chunk", type=int, default=8)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(make_text_pdf(args.pages))
+        pdf_path = f.name
+    worker_counts = sorted({1, *[2 ** n for n in range(1, 8) if 2 ** n < args.max_workers], args.max_workers})
+
+    print(f"{'workers':>8} {'seconds':>9} {'pages/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Warm the pool so process start-up is not part of the measurement
+            asyncio.run(_run(pdf_path, workers, executor, args.pages_per_chunk))
+            started = time.perf_counter()
+            asyncio.run(_run(pdf_path, args.documents, executor, args.pages_per_chunk))
+            elapsed = time.perf_counter() - started
+        pages_per_second = args.pages * args.documents / elapsed
+        baseline = baseline or pages_per_second
+        print(f"{workers:>8} {elapsed:>9.3f} {pages_per_second:>10.1f} {pages_per_second / baseline:>7.2f}x")
+    os.remove(pdf_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Per-evaluation cost of the rule engine: the original implementation, a plan compiled on
+every call, and the cached plan used by `predict_risk_score_based_on_rule_engine`.
+Results of all three are checked to be identical first.
+
+The original engine is read from git (`--baseline-rev`, by default the repository's first
+commit), so the benchmark must run inside a checkout with history.
+
+Implementations are timed in interleaved rounds and the best round of each is kept, so a
+noisy or shared machine slows all of them alike rather than whichever happened to run last.
+
+Usage:
+    python -m benchmarks.bench_rule_engine --applicants 500 --repeat 150
+    python -m benchmarks.bench_rule_engine --baseline-rev <commit>
+"""
+import argparse
+import gc
+import os
+import subprocess
+import time
+import types
+
+from backend.app.utils.rule_engine_utils import RulePlan, predict_risk_score_based_on_rule_engine
+from benchmarks.synthetic_applicants import DEFAULT_RULES, make_applicants
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENGINE_PATH = "backend/app/utils/rule_engine_utils.py"
+
+
+def load_baseline(revision=None):
+    """
+    Import the rule engine module as it was at `revision` without touching the working tree.
+
+    :return: Module with that revision's `predict_risk_score_based_on_rule_engine`
+    """
+    git = ["git", "-C", ROOT]
+    if revision is None:
+        revision = subprocess.run(
+            git + ["rev-list", "--max-parents=0", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.split()[-1]
+    source = subprocess.run(
+        git + ["show", f"{revision}:{ENGINE_PATH}"], capture_output=True, text=True, check=True
+    ).stdout
+    module = types.ModuleType(f"rule_engine_utils@{revision[:12]}")
+    exec(compile(source, f"{revision[:12]}:{ENGINE_PATH}", "exec"), module.__dict__)
+    return module
+
+
+def _time_run(score, applicants, strict):
+    started = time.perf_counter()
+    for applicant in applicants:
+        score(applicant, DEFAULT_RULES, strict)
+    return time.perf_counter() - started
+
+
+def time_per_call(implementations, applicants, strict, repeat):
+    """Best seconds per evaluation of each implementation over `repeat` interleaved rounds."""
+    best = {}
+    gc.disable()  # As timeit does, so collections triggered by earlier runs do not skew later ones
+    try:
+        for _ in range(repeat):
+            for name, score in implementations.items():
+                elapsed = _time_run(score, applicants, strict)
+                best[name] = min(best.get(name, elapsed), elapsed)
+    finally:
+        gc.enable()
+    return {name: seconds / len(applicants) for name, seconds in best.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=150, help="Interleaved rounds, best time is kept")
+    parser.add_argument("--baseline-rev", help="Git revision of the original engine")
+    args = parser.parse_args()
+
+    original = load_baseline(args.baseline_rev).predict_risk_score_based_on_rule_engine
+    applicants = make_applicants(args.applicants)
+    implementations = {
+        "original": original,
+        "compiled": lambda data, rules, strict: RulePlan(rules).evaluate(data, strict),
+        "cached": predict_risk_score_based_on_rule_engine,
+    }
+
+    for strict in (False, True):
+        for applicant in applicants:
+            expected = original(applicant, DEFAULT_RULES, strict)
+            for name, score in implementations.items():
+                if score(applicant, DEFAULT_RULES, strict) != expected:
+                    raise SystemExit(f"{name} differs from the original engine for {applicant} (strict={strict})")
+
+    print(f"{'mode':<7} {'implementation':<15} {'us/eval':>8} {'speedup':>8}")
+    for strict in (False, True):
+        timings = time_per_call(implementations, applicants, strict, args.repeat)
+        for name, per_call in timings.items():
+            print(
+                f"{'strict' if strict else 'normal':<7} {name:<15} {per_call * 1e6:>8.2f} "
+                f"{timings['original'] / per_call:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
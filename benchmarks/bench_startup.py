@@ -0,0 +1,130 @@
+"""
+Worker startup budget: how long importing the API takes, measured with `python -X importtime`
+in fresh interpreters, and whether any module that should load lazily was imported.
+
+The check fails (exit code 1) when the median import time exceeds --budget-ms or a module
+from DEFERRED_MODULES shows up, so it can run in CI. Timings depend on the machine; the
+deferred-module check does not.
+
+With --serve it also starts `uvicorn backend.app.main:app` and times how long a new worker
+takes to answer /health. Startup does not wait for the database; job recovery runs in the
+background and only logs errors while it is unreachable.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 10 --budget-ms 1000 --top 20
+    python -m benchmarks.bench_startup --serve --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+APP_MODULE = "backend.app.main"
+# Median import time of APP_MODULE under -X importtime, which itself adds some overhead
+IMPORT_BUDGET_MS = 1200
+# Loaded on first use by the code that needs them, never while a worker starts
+DEFERRED_MODULES = (
+    "pandas", "numpy", "openai", "aiohttp", "PyPDF2", "pdfplumber", "pypdfium2", "asyncpg", "psycopg2"
+)
+
+
+def measure_imports(module):
+    """
+    Import `module` in a fresh interpreter.
+
+    :return: Dict of imported module name to (self, cumulative) microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        timings.setdefault(name.strip(), (int(own), int(cumulative)))
+    return timings
+
+
+def time_to_health(port, timeout=60):
+    """Seconds from spawning a single uvicorn worker until /health answers."""
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{APP_MODULE}:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {server.returncode} during startup")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                time.sleep(0.01)
+        raise RuntimeError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level imports to list")
+    parser.add_argument("--serve", action="store_true", help="Also time uvicorn until /health answers")
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--json", help="Write the results to this file")
+    args = parser.parse_args()
+
+    runs = [measure_imports(APP_MODULE) for _ in range(args.runs)]
+    import_ms = statistics.median(timings[APP_MODULE][1] for timings in runs) / 1000
+    deferred = sorted(module for module in DEFERRED_MODULES if module in runs[0])
+
+    # Modules imported directly by the app's own packages, by cumulative time in the last run
+    slowest = sorted(
+        (
+            (cumulative / 1000, name) for name, (_, cumulative) in runs[-1].items()
+            if name.startswith("backend.") or "." not in name
+        ),
+        reverse=True
+    )[:args.top]
+    print(f"{'ms':>9}  module")
+    for milliseconds, name in slowest:
+        print(f"{milliseconds:>9.1f}  {name}")
+
+    results = {
+        'import_ms': round(import_ms, 1),
+        'budget_ms': args.budget_ms,
+        'deferred_modules_imported': deferred,
+        'slowest': [{'module': name, 'ms': round(milliseconds, 1)} for milliseconds, name in slowest]
+    }
+    print(f"\nimport {APP_MODULE}: {import_ms:.0f} ms median of {args.runs} (budget {args.budget_ms:.0f} ms)")
+    if deferred:
+        print(f"Imported at startup but should load lazily: {', '.join(deferred)}")
+
+    if args.serve:
+        seconds = [time_to_health(args.port) for _ in range(args.runs)]
+        results['time_to_health_ms'] = round(statistics.median(seconds) * 1000, 1)
+        print(f"uvicorn to first /health: {results['time_to_health_ms']:.0f} ms median")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({'settings': vars(args), 'results': results}, f, indent=2)
+
+    if deferred or import_ms > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+"""
+End-to-end load test: concurrent /upload/documents requests with synthetic CIBIL and GST
+reports, plus dashboard traffic on /fetch/logs and /fetch/default, against a real server
+whose LLM calls go to the local stand-in in `benchmarks.mock_openai`.
+
+By default both the mock and the API (`uvicorn backend.app.main:app --workers N`) are started
+here, the API pointed at the mock through OPENAI_API_BASE. The API uses the database configured
+in backend/app/db.py, which must be a migrated local Postgres; every run adds businesses named
+"Load Test <run id> <n>" to it, so use a scratch database.
+
+Reports throughput and p50/p95/p99 latency per endpoint and the resident memory of every
+worker process (read from /proc, Linux only). With --json the results are saved with the
+settings and git revision, and --baseline compares a run with an earlier results file.
+
+Usage:
+    python -m benchmarks.load_test --workers 2 --duration 120 --upload-concurrency 16 --json run.json
+    python -m benchmarks.load_test --mock-latency-ms 1500 --mock-error-rate 0.05 --baseline run.json
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --server-pid 4242
+
+With --url the API is not started; it must already use the mock (OPENAI_API_BASE, with any
+OPENAI_API_KEY set) and --server-pid gives the process whose tree is sampled for memory.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.synthetic_applicants import DEFAULT_RULES
+from benchmarks.synthetic_pdf import DOCUMENT_SIZES, make_document_pair
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}
+        self.failures = 0  # Connection errors and timeouts, no status
+
+    def record(self, started, status):
+        self.latencies.append(time.perf_counter() - started)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def summary(self, seconds, ok_statuses):
+        ordered = sorted(self.latencies)
+        errors = self.failures + sum(count for status, count in self.statuses.items() if status not in ok_statuses)
+        in_ms = lambda value: round(value * 1000, 1) if value is not None else None
+        return {
+            'requests': len(ordered),
+            'errors': errors,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'requests_per_second': round(len(ordered) / seconds, 2),
+            'p50_ms': in_ms(percentile(ordered, 0.50)),
+            'p95_ms': in_ms(percentile(ordered, 0.95)),
+            'p99_ms': in_ms(percentile(ordered, 0.99)),
+            'mean_ms': in_ms(statistics.fmean(ordered)) if ordered else None,
+            'max_ms': in_ms(ordered[-1]) if ordered else None
+        }
+
+
+# Processes
+
+def _read_proc(pid, name):
+    try:
+        with open(f"/proc/{pid}/{name}", "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _children():
+    """Map of parent pid to child pids, from /proc."""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        stat = _read_proc(entry, "stat")
+        if stat is None:
+            continue
+        # The command name in parentheses may contain spaces; fields after it are fixed
+        parent = int(stat[stat.rfind(b")") + 2:].split()[1])
+        children.setdefault(parent, []).append(int(entry))
+    return children
+
+
+def _descendants(pid, children):
+    found = []
+    for child in children.get(pid, []):
+        found.append(child)
+        found.extend(_descendants(child, children))
+    return found
+
+
+def _rss_mb(pid):
+    statm = _read_proc(pid, "statm")
+    return int(statm.split()[1]) * PAGE_SIZE / 1024 ** 2 if statm else 0.0
+
+
+def _is_helper(pid):
+    """multiprocessing's resource tracker is a child of the server but not a worker."""
+    return b"resource_tracker" in (_read_proc(pid, "cmdline") or b"")
+
+
+class MemorySampler:
+    """
+    Resident memory of the API's worker processes, sampled while the test runs. With one
+    worker uvicorn serves from the main process; otherwise each child is a worker. Process
+    pools a worker starts (PDF extraction, scoring) are counted in its `tree` figures.
+    """
+
+    def __init__(self, server_pid, workers):
+        self.server_pid = server_pid
+        self.single_process = workers == 1
+        self.samples = {}
+
+    def sample(self):
+        children = _children()
+        if self.single_process:
+            workers = [self.server_pid]
+        else:
+            workers = [pid for pid in children.get(self.server_pid, []) if not _is_helper(pid)]
+        for pid in workers:
+            own = _rss_mb(pid)
+            tree = own + sum(_rss_mb(child) for child in _descendants(pid, children))
+            self.samples.setdefault(pid, []).append((own, tree))
+
+    async def run(self, interval):
+        while True:
+            self.sample()
+            await asyncio.sleep(interval)
+
+    def summary(self):
+        return [
+            {
+                'pid': pid,
+                'rss_mb_peak': round(max(own for own, _ in samples), 1),
+                'rss_mb_last': round(samples[-1][0], 1),
+                'tree_rss_mb_peak': round(max(tree for _, tree in samples), 1)
+            }
+            for pid, samples in sorted(self.samples.items())
+        ]
+
+
+def _start(arguments, env=None):
+    return subprocess.Popen([sys.executable, "-m", *arguments], cwd=ROOT, env=env)
+
+
+def _stop(process):
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+async def _wait_until_up(url, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(f"{url} exited with code {process.returncode} during startup")
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.25)
+    raise RuntimeError(f"{url} did not come up within {timeout}s")
+
+
+# Traffic
+
+def build_corpus(count, sizes, seed):
+    """`count` distinct document pairs, cycling through the requested sizes."""
+    return [
+        (size, *make_document_pair(size, seed=seed + number))
+        for number, size in zip(range(count), itertools.cycle(sizes))
+    ]
+
+
+async def _ensure_active_rule(client):
+    """Uploads and /fetch/default need an active rule; an existing one is left in place."""
+    response = await client.get("/fetch/default")
+    if response.status_code == 404:
+        response = await client.post("/update/default", json={'rule_config': DEFAULT_RULES})
+        response.raise_for_status()
+
+
+async def upload_loop(client, corpus, counter, run_id, stats, deadline, measure_from):
+    rules = json.dumps(DEFAULT_RULES)
+    while time.monotonic() < deadline:
+        number = next(counter)
+        size, cibil_pdf, gst_pdf = corpus[number % len(corpus)]
+        started = time.perf_counter()
+        measured = time.monotonic() >= measure_from
+        try:
+            response = await client.post(
+                "/upload/documents",
+                files={
+                    'cibil_file': (f"cibil_{number}.pdf", cibil_pdf, "application/pdf"),
+                    'gst_file': (f"gst_{number}.pdf", gst_pdf, "application/pdf")
+                },
+                data={
+                    'business_vintage': "5",
+                    'co_applicant_age': "30",
+                    'proprietor_age': "40",
+                    'company_name': f"Load Test {run_id} {number}",
+                    'rules': rules
+                }
+            )
+        except httpx.HTTPError:
+            if measured:
+                stats[size].failures += 1
+            continue
+        if measured:
+            stats[size].record(started, response.status_code)
+
+
+async def dashboard_loop(client, stats, deadline, measure_from, logs_limit):
+    """Alternates between the two dashboard reads, revalidating the rule like a browser would."""
+    etag = None
+    while time.monotonic() < deadline:
+        for name in ('fetch_logs', 'fetch_default'):
+            started = time.perf_counter()
+            measured = time.monotonic() >= measure_from
+            try:
+                if name == 'fetch_logs':
+                    response = await client.get("/fetch/logs", params={'limit': logs_limit})
+                else:
+                    response = await client.get(
+                        "/fetch/default", headers={'If-None-Match': etag} if etag else None
+                    )
+                    etag = response.headers.get("etag", etag)
+            except httpx.HTTPError:
+                if measured:
+                    stats[name].failures += 1
+                continue
+            if measured:
+                stats[name].record(started, response.status_code)
+
+
+async def run(args, url, server_pid):
+    run_id = uuid.uuid4().hex[:8]
+    sizes = args.sizes.split(",")
+    corpus = build_corpus(args.distinct_documents, sizes, args.seed)
+    upload_stats = {size: EndpointStats() for size in sizes}
+    read_stats = {'fetch_logs': EndpointStats(), 'fetch_default': EndpointStats()}
+
+    concurrency = args.upload_concurrency + args.read_concurrency
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    timeout = httpx.Timeout(args.request_timeout)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=timeout) as client:
+        await _ensure_active_rule(client)
+
+        sampler = MemorySampler(server_pid, args.workers) if server_pid else None
+        sampling = asyncio.create_task(sampler.run(args.sample_interval)) if sampler else None
+
+        counter = iter(range(sys.maxsize))
+        measure_from = time.monotonic() + args.warmup
+        deadline = measure_from + args.duration
+        try:
+            await asyncio.gather(
+                *[
+                    upload_loop(client, corpus, counter, run_id, upload_stats, deadline, measure_from)
+                    for _ in range(args.upload_concurrency)
+                ],
+                *[
+                    dashboard_loop(client, read_stats, deadline, measure_from, args.logs_limit)
+                    for _ in range(args.read_concurrency)
+                ]
+            )
+        finally:
+            if sampling:
+                sampling.cancel()
+        # Requests still in flight at the deadline finish after it; throughput counts them
+        elapsed = time.monotonic() - measure_from
+
+    all_uploads = EndpointStats()
+    for stats in upload_stats.values():
+        all_uploads.latencies += stats.latencies
+        all_uploads.failures += stats.failures
+        for status, count in stats.statuses.items():
+            all_uploads.statuses[status] = all_uploads.statuses.get(status, 0) + count
+
+    endpoints = {'upload': all_uploads.summary(elapsed, {200})}
+    endpoints.update({
+        f"upload_{size}": stats.summary(elapsed, {200}) for size, stats in upload_stats.items()
+    })
+    endpoints['fetch_logs'] = read_stats['fetch_logs'].summary(elapsed, {200})
+    endpoints['fetch_default'] = read_stats['fetch_default'].summary(elapsed, {200, 304})
+    return {
+        'run_id': run_id,
+        'seconds': round(elapsed, 2),
+        'document_bytes': {
+            size: {'cibil': len(cibil_pdf), 'gst': len(gst_pdf)}
+            for size, cibil_pdf, gst_pdf in corpus[:len(sizes)]
+        },
+        'endpoints': endpoints,
+        'memory': sampler.summary() if sampler else None
+    }
+
+
+def _revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results, baseline=None):
+    print(f"{'endpoint':<14} {'requests':>8} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in results['endpoints'].items():
+        print(
+            f"{name:<14} {result['requests']:>8} {result['errors']:>7} {result['requests_per_second']:>8.2f} "
+            f"{result['p50_ms'] or 0:>9.1f} {result['p95_ms'] or 0:>9.1f} {result['p99_ms'] or 0:>9.1f}"
+        )
+    for worker in results['memory'] or []:
+        print(
+            f"worker {worker['pid']}: RSS peak {worker['rss_mb_peak']:.1f} MB, last {worker['rss_mb_last']:.1f} MB, "
+            f"with process pools {worker['tree_rss_mb_peak']:.1f} MB"
+        )
+    if results.get('llm'):
+        print(f"mock LLM: {results['llm']}")
+
+    if baseline is None:
+        return
+    print(f"\nAgainst {baseline['revision'] or 'baseline'} ({baseline['started_at']}):")
+    change = lambda new, old: f"{(new - old) / old * 100:+.1f}%" if new is not None and old else "n/a"
+    for name, result in results['endpoints'].items():
+        old = baseline['results']['endpoints'].get(name)
+        if old is not None:
+            print(
+                f"{name:<14} req/s {change(result['requests_per_second'], old['requests_per_second']):>8}   "
+                f"p95 {change(result['p95_ms'], old['p95_ms']):>8}   p99 {change(result['p99_ms'], old['p99_ms']):>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Test an already running API instead of starting one")
+    parser.add_argument("--server-pid", type=int, help="With --url, the API process to sample memory of")
+    parser.add_argument("--port", type=int, default=8100, help="Port of the API started here")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes of the API started here")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds measured")
+    parser.add_argument("--warmup", type=float, default=10, help="Seconds of traffic before measuring")
+    parser.add_argument("--upload-concurrency", type=int, default=8, help="Uploads in flight at once")
+    parser.add_argument("--read-concurrency", type=int, default=4, help="Dashboard clients polling at once")
+    parser.add_argument("--logs-limit", type=int, default=50, help="Page size of /fetch/logs")
+    parser.add_argument("--sizes", default="small,medium,large", help=f"Document sizes: {', '.join(DOCUMENT_SIZES)}")
+    parser.add_argument(
+        "--distinct-documents", type=int, default=200,
+        help="Distinct document pairs; uploads beyond this reuse files and hit the extraction cache"
+    )
+    parser.add_argument("--request-timeout", type=float, default=300)
+    parser.add_argument("--sample-interval", type=float, default=1, help="Seconds between memory samples")
+    parser.add_argument("--mock-port", type=int, default=8090)
+    parser.add_argument("--mock-latency-ms", type=float, default=800)
+    parser.add_argument("--mock-jitter-ms", type=float, default=200)
+    parser.add_argument("--mock-error-rate", type=float, default=0)
+    parser.add_argument("--mock-rate-limit-rate", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Results file of an earlier run to compare with")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    mock = server = None
+    started_at = datetime.now(timezone.utc).isoformat()
+    with tempfile.TemporaryDirectory() as metrics_directory:
+        try:
+            mock_url = f"http://127.0.0.1:{args.mock_port}"
+            mock = _start([
+                "benchmarks.mock_openai", "--port", str(args.mock_port),
+                "--latency-ms", str(args.mock_latency_ms), "--jitter-ms", str(args.mock_jitter_ms),
+                "--error-rate", str(args.mock_error_rate), "--rate-limit-rate", str(args.mock_rate_limit_rate),
+                "--seed", str(args.seed)
+            ])
+            asyncio.run(_wait_until_up(f"{mock_url}/stats", mock))
+
+            url, server_pid = args.url, args.server_pid
+            if url is None:
+                env = {
+                    **os.environ,
+                    'OPENAI_API_BASE': f"{mock_url}/v1",
+                    # The mock accepts any key, but the client refuses to send a request without one
+                    'OPENAI_API_KEY': os.getenv("OPENAI_API_KEY", "load-test"),
+                    # Several workers need a shared directory for /metrics to stay consistent
+                    'PROMETHEUS_MULTIPROC_DIR': metrics_directory
+                }
+                server = _start([
+                    "uvicorn", "backend.app.main:app", "--host", "127.0.0.1", "--port", str(args.port),
+                    "--workers", str(args.workers), "--log-level", "warning"
+                ], env=env)
+                url, server_pid = f"http://127.0.0.1:{args.port}", server.pid
+                asyncio.run(_wait_until_up(f"{url}/health", server))
+
+            results = asyncio.run(run(args, url, server_pid))
+            results['llm'] = httpx.get(f"{mock_url}/stats").json()
+        finally:
+            _stop(server)
+            _stop(mock)
+
+    print_report(results, baseline)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({'settings': vars(args), 'revision': _revision(), 'started_at': started_at, 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
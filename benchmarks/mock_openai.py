@@ -0,0 +1,132 @@
+"""
+Local stand-in for the OpenAI chat completions API, so load tests exercise the full upload
+pipeline without paying for (or being rate limited by) the real service.
+
+Answers CIBIL and GST extraction prompts with plausible JSON after a configurable delay, and
+fails a configurable share of requests with 500 or 429 responses so the retry path is
+exercised. Responses are derived from the prompt, so the same document gets the same answer.
+
+Usage:
+    python -m benchmarks.mock_openai --port 8090 --latency-ms 800 --jitter-ms 300 --error-rate 0.02
+    OPENAI_API_BASE=http://127.0.0.1:8090/v1 uvicorn backend.app.main:app
+
+GET /stats returns the number of completions served and failures injected.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+
+from aiohttp import web
+
+
+def _cibil_answer(rng):
+    dpd = rng.choice([0, 0, 0, 0, 15, 35, 65, 95])
+    return {
+        "dpd_30_plus_sma_1": dpd > 30,
+        "dpd_60_plus_sma_2": dpd > 60,
+        "dpd_90_plus_npa": dpd > 90,
+        "adverse_remarks": [{"type": "SUB-STANDARD", "source": "Term Loan"}] if dpd > 90 else [],
+        "unsecured_credit_enquiries_90_days": rng.choice([0, 0, 0, 1, 2]),
+        "unsecured_loans_disbursed_3_months": rng.choice([0, 0, 0, 0, 1]),
+        "debt_more_than_one_year": rng.randrange(0, 5000000, 1000),
+        "is_30_plus_dpd": dpd > 30,
+        "is_60_plus_dpd": dpd > 60,
+        "is_90_plus_dpd": dpd > 90,
+        "adverse_remarks_present": dpd > 90,
+        "unsecured_credit_enquiries_in_last_90_days": rng.random() < 0.3,
+        "unsecured_number_of_loans_in_last_3_months": rng.choice([0, 0, 0, 1]),
+        "debt_gt_one_year": rng.random() < 0.1
+    }
+
+
+def _gst_answer(rng):
+    change = rng.uniform(-40, 120)
+    return {
+        "Turnover DIP Acceptance": {
+            "Percentage Change": f"{change:.0f}%",
+            "Acceptable": "Yes" if change > -25 else "No"
+        },
+        "Debt to Turnover Ratio": f"{rng.uniform(0.5, 40):.2f}%",
+        "Last 12 Month Sales": f"₹ {rng.uniform(200000, 90000000):,.2f}",
+        "Anchor Dependency": "N/A",
+        "Vintage with Anchor": "N/A"
+    }
+
+
+def completion_content(prompt):
+    """The JSON answer to an extraction prompt, wrapped in a code fence like the real model does."""
+    rng = random.Random(hashlib.sha256(prompt.encode()).digest())
+    answer = _gst_answer(rng) if "GST SNIPPET" in prompt else _cibil_answer(rng)
+    return "```json\n" + json.dumps(answer, ensure_ascii=False, indent=2) + "\n```"
+
+
+def build_app(latency, jitter, error_rate, rate_limit_rate, seed=None):
+    rng = random.Random(seed)
+    counters = {"completions": 0, "errors": 0, "rate_limited": 0}
+
+    async def chat_completions(request):
+        body = await request.json()
+        await asyncio.sleep(max(0.0, rng.gauss(latency, jitter)) if jitter else latency)
+
+        roll = rng.random()
+        if roll < error_rate:
+            counters["errors"] += 1
+            return web.json_response(
+                {"error": {"message": "Injected failure", "type": "server_error"}}, status=500
+            )
+        if roll < error_rate + rate_limit_rate:
+            counters["rate_limited"] += 1
+            return web.json_response(
+                {"error": {"message": "Injected rate limit", "type": "requests"}}, status=429
+            )
+
+        counters["completions"] += 1
+        prompt = body["messages"][-1]["content"]
+        content = completion_content(prompt)
+        return web.json_response({
+            "id": f"chatcmpl-mock-{counters['completions']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt) // 4,
+                "completion_tokens": len(content) // 4,
+                "total_tokens": (len(prompt) + len(content)) // 4
+            }
+        })
+
+    async def stats(request):
+        return web.json_response(counters)
+
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_post("/chat/completions", chat_completions)
+    app.router.add_get("/stats", stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=800, help="Mean response time of a completion")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Standard deviation of the response time")
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of requests failed with a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0, help="Share of requests failed with a 429")
+    parser.add_argument("--seed", type=int, help="Seed of the latency and failure draws")
+    args = parser.parse_args()
+
+    app = build_app(args.latency_ms / 1000, args.jitter_ms / 1000, args.error_rate, args.rate_limit_rate, args.seed)
+    web.run_app(app, host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
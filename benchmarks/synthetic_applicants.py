@@ -0,0 +1,54 @@
+"""
+Random applicant data points in the shape the upload pipeline feeds to the rule engine.
+"""
+import random
+
+DEFAULT_RULES = {
+    "is_30_plus_dpd": False,
+    "is_60_plus_dpd": False,
+    "is_90_plus_dpd": False,
+    "adverse_remarks_present": False,
+    "unsecured_credit_enquiries_90_days": 0,
+    "unsecured_loans_disbursed_3_months": 0,
+    "debt_gt_one_year": False,
+    "turnover_dip_percent_change": 75,
+    "last_12_month_sales_in_rs": "1000000",
+    "debt_to_turnover_ratio": "2",
+    "business_vintage": "2",
+    "applicant_age": "25",
+    "proprietor_age": "35"
+}
+
+# Data points the GST parser or the LLM cannot always supply; the pipeline leaves them out
+OPTIONAL_KEYS = ("turnover_dip_percent_change", "last_12_month_sales_in_rs", "debt_to_turnover_ratio")
+
+
+def make_applicant(rng, missing_rate=0.05):
+    """
+    Build one applicant. Most pass the default rules so that every verdict and credit-limit
+    adjustment is exercised; a few data points are missing.
+    """
+    applicant = {
+        "is_30_plus_dpd": rng.random() < 0.1,
+        "is_60_plus_dpd": rng.random() < 0.05,
+        "is_90_plus_dpd": rng.random() < 0.02,
+        "adverse_remarks_present": rng.random() < 0.03,
+        "unsecured_credit_enquiries_90_days": rng.choice([0, 0, 0, 0, 1, 2]),
+        "unsecured_loans_disbursed_3_months": rng.choice([0, 0, 0, 0, 0, 1]),
+        "debt_gt_one_year": rng.random() < 0.1,
+        "turnover_dip_percent_change": round(rng.uniform(-40, 90), 2),
+        "last_12_month_sales_in_rs": round(rng.uniform(200000, 90000000), 2),
+        "debt_to_turnover_ratio": round(rng.uniform(0.1, 3), 2),
+        "business_vintage": rng.randint(0, 12),
+        "applicant_age": rng.randint(21, 70),
+        "proprietor_age": rng.randint(25, 75)
+    }
+    for key in OPTIONAL_KEYS:
+        if rng.random() < missing_rate:
+            del applicant[key]
+    return applicant
+
+
+def make_applicants(count, seed=0, missing_rate=0.05):
+    rng = random.Random(seed)
+    return [make_applicant(rng, missing_rate) for _ in range(count)]
@@ -0,0 +1,220 @@
+"""
+Minimal dependency-free PDF writer used to build benchmark corpora.
+"""
+import random
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN = 36
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _text_stream(lines, font_size, top):
+    leading = font_size + 2
+    stream = [f"BT /F1 {font_size} Tf {leading} TL {MARGIN} {top} Td".encode()]
+    stream.extend(f"({_escape(line)}) Tj T*".encode("latin-1", "replace") for line in lines)
+    stream.append(b"ET")
+    return stream, top - leading * len(lines)
+
+
+def _table_stream(header, rows, font_size, top):
+    """Draw a ruled grid with one text cell per column, so table detectors see real cell borders."""
+    row_height = font_size + 8
+    column_width = (PAGE_WIDTH - 2 * MARGIN) / len(header)
+    all_rows = [header] + rows
+    bottom = top - row_height * len(all_rows)
+
+    stream = [b"0.5 w"]
+    for index in range(len(all_rows) + 1):
+        y = top - index * row_height
+        stream.append(f"{MARGIN} {y} m {PAGE_WIDTH - MARGIN} {y} l S".encode())
+    for index in range(len(header) + 1):
+        x = MARGIN + index * column_width
+        stream.append(f"{x:.1f} {top} m {x:.1f} {bottom} l S".encode())
+    for row_index, row in enumerate(all_rows):
+        y = top - (row_index + 1) * row_height + 5
+        for column_index, cell in enumerate(row):
+            x = MARGIN + column_index * column_width + 4
+            stream.append(
+                f"BT /F1 {font_size} Tf {x:.1f} {y} Td ({_escape(str(cell))}) Tj ET".encode("latin-1", "replace")
+            )
+    return stream, bottom
+
+
+def build_pdf(pages, font_size=9):
+    """
+    Build a PDF from page specs.
+
+    :param pages: List of pages. Each page is either a list of text lines, or a dict with an
+                  optional "lines" list and an optional "table" dict with "header" and "rows"
+    :param font_size: Font size in points
+    :return: PDF file content as bytes
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for page in pages:
+        if isinstance(page, list):
+            page = {"lines": page}
+        top = PAGE_HEIGHT - MARGIN
+        stream = []
+        if page.get("lines"):
+            part, top = _text_stream(page["lines"], font_size, top)
+            stream.extend(part)
+        if page.get("table"):
+            part, top = _table_stream(page["table"]["header"], page["table"]["rows"], font_size, top - 10)
+            stream.extend(part)
+        content = b"\n".join(stream)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /CropBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, PAGE_WIDTH, PAGE_HEIGHT, content_ref)
+        )
+        page_refs.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_refs))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+def make_text_pdf(page_count, lines_per_page=60):
+    """
+    Build a PDF of `page_count` pages filled with report-like filler lines.
+    """
+    pages = []
+    for page in range(page_count):
+        pages.append([
+            f"Page {page + 1} Line {line + 1}: Account XXXX{line:04d} Sanctioned 1,50,000 Balance 72,431 DPD 000"
+            for line in range(lines_per_page)
+        ])
+    return build_pdf(pages)
+
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _table_pages(header, rows, rows_per_page, first_page_lines=None):
+    pages = []
+    for start in range(0, len(rows), rows_per_page):
+        page = {"table": {"header": header, "rows": rows[start:start + rows_per_page]}}
+        if start == 0 and first_page_lines:
+            page["lines"] = first_page_lines
+        pages.append(page)
+    return pages
+
+
+def make_gst_pdf(months=24, customers=4, total_debt=1500000, seed=0, rows_per_page=30):
+    """
+    Build a GST sales report: a ruled month-wise taxable value table followed by a
+    customer-wise sales table, with a total debt line on the first page.
+
+    :return: Tuple of (pdf bytes, truth) where truth has the expected "lines", the "fields"
+             the GST metrics depend on, and the generated "monthly" (label, value) pairs
+    """
+    rng = random.Random(seed)
+    monthly = []
+    for index in range(months):
+        year = 2023 + (3 + index) // 12
+        label = f"{MONTH_NAMES[(3 + index) % 12]}-{year}"
+        monthly.append((label, round(rng.uniform(300000, 900000), 2)))
+
+    header_lines = [
+        "GSTR-1 Sales Summary",
+        "GSTIN: 27AAPFU0939F1ZV",
+        f"Total Debt: Rs {total_debt:,.2f}",
+    ]
+    summary_rows = [[label, f"{value:,.2f}"] for label, value in monthly]
+    customer_rows = []
+    for label, value in monthly:
+        shares = [rng.random() for _ in range(customers)]
+        for number, share in enumerate(shares):
+            customer_rows.append([label, f"Customer {number + 1}", f"{value * share / sum(shares):,.2f}"])
+
+    pages = _table_pages(["Tax Period", "Taxable Value"], summary_rows, rows_per_page, header_lines)
+    pages += _table_pages(["Month", "Customer Name", "Taxable Value"], customer_rows, rows_per_page)
+
+    truth = {
+        "lines": header_lines + [" ".join(row) for row in summary_rows + customer_rows],
+        "fields": [header_lines[2]] + [" ".join(row) for row in summary_rows],
+        "monthly": monthly,
+    }
+    return build_pdf(pages), truth
+
+
+def make_cibil_pdf(accounts=40, seed=0, rows_per_page=36):
+    """
+    Build a CIBIL-style credit report: a summary block with the enquiry, disbursal and debt
+    figures followed by a ruled account table with days-past-due and remarks.
+
+    :return: Tuple of (pdf bytes, truth) where truth has the expected "lines" and the
+             "fields" the CIBIL data points depend on
+    """
+    rng = random.Random(seed)
+    rows = []
+    for number in range(accounts):
+        dpd = rng.choice([0, 0, 0, 0, 15, 35, 65, 95])
+        remark = "SUB-STANDARD" if dpd > 90 else ("SMA-2" if dpd > 60 else ("SMA-1" if dpd > 30 else "STANDARD"))
+        rows.append([
+            f"XXXX{number:04d}",
+            rng.choice(["Business Loan", "Credit Card", "Term Loan", "Overdraft"]),
+            f"{rng.randrange(50000, 2500000, 5000):,}",
+            f"{rng.randrange(0, 1500000, 1000):,}",
+            f"{dpd:03d}",
+            remark,
+        ])
+
+    summary_lines = [
+        "CIBIL Commercial Credit Report",
+        "Borrower: Synthetic Traders Pvt Ltd",
+        f"CIBIL Rank: {rng.randint(1, 10)}",
+        f"Unsecured credit enquiries in last 90 days: {rng.randint(0, 5)}",
+        f"Unsecured loans disbursed in last 3 months: {rng.randint(0, 3)}",
+        f"Total debt older than 1 year: Rs {rng.randrange(0, 5000000, 1000):,}",
+    ]
+    header = ["Account", "Type", "Sanctioned", "Balance", "DPD", "Remarks"]
+    pages = _table_pages(header, rows, rows_per_page, summary_lines)
+
+    truth = {
+        "lines": summary_lines + [" ".join(row) for row in rows],
+        "fields": summary_lines[3:] + [f"{row[4]} {row[5]}" for row in rows],
+    }
+    return build_pdf(pages), truth
+
+
+# CIBIL accounts and GST months per document size; large roughly matches the biggest reports seen
+DOCUMENT_SIZES = {
+    "small": {"accounts": 10, "months": 24},
+    "medium": {"accounts": 120, "months": 36},
+    "large": {"accounts": 600, "months": 60},
+}
+
+
+def make_document_pair(size="small", seed=0):
+    """
+    Build the CIBIL and GST reports of one synthetic applicant.
+
+    :param size: Key of DOCUMENT_SIZES
+    :param seed: Seed of both reports; different seeds give files with different content hashes
+    :return: Tuple of (cibil pdf bytes, gst pdf bytes)
+    """
+    spec = DOCUMENT_SIZES[size]
+    cibil_pdf, _ = make_cibil_pdf(accounts=spec["accounts"], seed=seed)
+    gst_pdf, _ = make_gst_pdf(months=spec["months"], seed=seed)
+    return cibil_pdf, gst_pdf
@@ -0,0 +1,30 @@
+"""document content hash
+
+Revision ID: 3c9a1f5e7b20
+Revises: b82edd97b632
+Create Date: 2025-04-18 11:02:47.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a1f5e7b20'
+down_revision: Union[str, None] = 'b82edd97b632'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('document_data', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('document_data', sa.Column('extraction_version', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_document_data_content_hash'), 'document_data', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_document_data_content_hash'), table_name='document_data')
+    op.drop_column('document_data', 'extraction_version')
+    op.drop_column('document_data', 'content_hash')
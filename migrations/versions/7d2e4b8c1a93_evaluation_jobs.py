@@ -0,0 +1,43 @@
+"""evaluation jobs
+
+Revision ID: 7d2e4b8c1a93
+Revises: 3c9a1f5e7b20
+Create Date: 2025-04-18 15:24:09.551803
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b8c1a93'
+down_revision: Union[str, None] = '3c9a1f5e7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('evaluation_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('status', sa.String(length=32), nullable=False),
+        sa.Column('request_data', pg.JSON(), nullable=False),
+        sa.Column('cibil_path', sa.String(length=1024), nullable=False),
+        sa.Column('gst_path', sa.String(length=1024), nullable=False),
+        sa.Column('result', pg.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_evaluation_jobs_status'), 'evaluation_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evaluation_jobs_status'), table_name='evaluation_jobs')
+    op.drop_table('evaluation_jobs')
@@ -0,0 +1,59 @@
+"""business normalized name
+
+Revision ID: 9e4f2a6b3c11
+Revises: 7d2e4b8c1a93
+Create Date: 2025-04-19 09:41:26.104377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4f2a6b3c11'
+down_revision: Union[str, None] = '7d2e4b8c1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('business', sa.Column('normalized_business_name', sa.String(length=255), nullable=True))
+
+    # Same normalization as backend.app.model_utils.name_utils.normalize_business_name.
+    # Where existing rows collide, only the most recent one gets the normalized name,
+    # so the unique index can be built; older duplicates are left NULL.
+    op.execute("""
+        UPDATE business AS b
+        SET normalized_business_name = n.normalized
+        FROM (
+            SELECT id, normalized,
+                   row_number() OVER (PARTITION BY normalized ORDER BY id DESC) AS position
+            FROM (
+                SELECT id, NULLIF(btrim(regexp_replace(lower(business_name), '[^a-z0-9]+', ' ', 'g')), '')
+                       AS normalized
+                FROM business
+            ) AS names
+        ) AS n
+        WHERE b.id = n.id AND n.normalized IS NOT NULL AND n.position = 1
+    """)
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Build the indexes without locking out writes on a large table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_business_normalized_business_name'), 'business', ['normalized_business_name'],
+            unique=True, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_business_normalized_business_name_trgm', 'business', ['normalized_business_name'],
+            postgresql_using='gin', postgresql_ops={'normalized_business_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_business_normalized_business_name_trgm', table_name='business')
+    op.drop_index(op.f('ix_business_normalized_business_name'), table_name='business')
+    op.drop_column('business', 'normalized_business_name')
@@ -0,0 +1,47 @@
+"""business data points and rescore jobs
+
+Revision ID: a4c7e1d9f2b6
+Revises: 9e4f2a6b3c11
+Create Date: 2025-04-20 11:06:43.218564
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e1d9f2b6'
+down_revision: Union[str, None] = '9e4f2a6b3c11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing businesses keep NULL: their form inputs (vintage, ages) were never stored,
+    # so they are skipped by re-scoring until they are uploaded again
+    op.add_column('business', sa.Column('data_points', pg.JSON(), nullable=True))
+    op.create_table('rescore_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('rule_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=32), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=True),
+        sa.Column('processed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('changed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('skipped', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rescore_jobs_status'), 'rescore_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_rescore_jobs_status'), table_name='rescore_jobs')
+    op.drop_table('rescore_jobs')
+    op.drop_column('business', 'data_points')
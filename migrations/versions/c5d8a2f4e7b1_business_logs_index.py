@@ -0,0 +1,25 @@
+"""business created_at, id index for log pagination
+
+Revision ID: c5d8a2f4e7b1
+Revises: a4c7e1d9f2b6
+Create Date: 2025-04-21 09:42:15.774031
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8a2f4e7b1'
+down_revision: Union[str, None] = 'a4c7e1d9f2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_business_created_at_id', 'business', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_business_created_at_id', table_name='business')
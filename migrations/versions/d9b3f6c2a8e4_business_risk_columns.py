@@ -0,0 +1,66 @@
+"""business verdict, credit limit and pass percentage columns
+
+Revision ID: d9b3f6c2a8e4
+Revises: c5d8a2f4e7b1
+Create Date: 2025-04-21 15:18:02.540917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3f6c2a8e4'
+down_revision: Union[str, None] = 'c5d8a2f4e7b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+verdict = pg.ENUM('APPROVED', 'REJECTED', 'NEEDS_MANUAL_REVIEW', name='verdict', create_type=False)
+
+
+def upgrade() -> None:
+    verdict.create(op.get_bind(), checkfirst=True)
+    op.alter_column('business', 'risk_response', type_=pg.JSONB(), postgresql_using='risk_response::jsonb')
+    # Never written before this revision, so there is nothing to convert
+    op.alter_column('business', 'response_computed_on', type_=sa.DateTime(timezone=True))
+    op.add_column('business', sa.Column('verdict', verdict, nullable=True))
+    op.add_column('business', sa.Column('credit_limit', sa.BigInteger(), nullable=True))
+    op.add_column('business', sa.Column('pass_percentage', sa.Float(), nullable=True))
+
+    # Same derivation as model_utils.risk_utils.risk_columns
+    op.execute("""
+        UPDATE business SET
+            verdict = (risk_response ->> 'verdict')::verdict,
+            credit_limit = NULLIF(regexp_replace(risk_response ->> 'credit_limit', '[^0-9]', '', 'g'), '')::bigint,
+            pass_percentage = COALESCE((
+                SELECT 100.0 * count(*) FILTER (WHERE criterion.value ->> 'result' = 'Pass') / NULLIF(count(*), 0)
+                FROM jsonb_each(risk_response -> 'criteria') AS criterion
+            ), 0),
+            response_computed_on = COALESCE(updated_at, created_at)
+        WHERE risk_response ->> 'verdict' IN ('APPROVED', 'REJECTED', 'NEEDS_MANUAL_REVIEW')
+    """)
+
+    op.create_index('ix_business_verdict_created_at_id', 'business', ['verdict', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_business_credit_limit'), 'business', ['credit_limit'], unique=False)
+    op.create_index(op.f('ix_business_response_computed_on'), 'business', ['response_computed_on'], unique=False)
+    # Containment queries on the per-criterion results, e.g. criteria @> '{"is_30_plus_dpd": {"result": "Fail"}}'
+    op.execute(
+        "CREATE INDEX ix_business_risk_criteria ON business "
+        "USING gin ((risk_response -> 'criteria') jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_business_risk_criteria', table_name='business')
+    op.drop_index(op.f('ix_business_response_computed_on'), table_name='business')
+    op.drop_index(op.f('ix_business_credit_limit'), table_name='business')
+    op.drop_index('ix_business_verdict_created_at_id', table_name='business')
+    op.drop_column('business', 'pass_percentage')
+    op.drop_column('business', 'credit_limit')
+    op.drop_column('business', 'verdict')
+    op.alter_column('business', 'response_computed_on', type_=sa.DateTime(timezone=False))
+    op.alter_column('business', 'risk_response', type_=pg.JSON(), postgresql_using='risk_response::json')
+    verdict.drop(op.get_bind(), checkfirst=True)
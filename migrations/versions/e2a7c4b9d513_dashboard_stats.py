@@ -0,0 +1,71 @@
+"""dashboard statistics summary tables
+
+Revision ID: e2a7c4b9d513
+Revises: d9b3f6c2a8e4
+Create Date: 2025-04-22 10:27:49.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c4b9d513'
+down_revision: Union[str, None] = 'd9b3f6c2a8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Created by d9b3f6c2a8e4
+verdict = pg.ENUM('APPROVED', 'REJECTED', 'NEEDS_MANUAL_REVIEW', name='verdict', create_type=False)
+
+# Default STATS_TIMEZONE; the backfill buckets days the way stats_service.stats_day does
+STATS_TIMEZONE = 'Asia/Kolkata'
+
+
+def upgrade() -> None:
+    op.create_table('daily_verdict_stats',
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('business_sector', sa.String(length=255), nullable=False),
+        sa.Column('verdict', verdict, nullable=False),
+        sa.Column('evaluations', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('credit_limit_sum', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('credit_limit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('day', 'business_sector', 'verdict')
+    )
+    op.create_table('daily_criterion_failures',
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('business_sector', sa.String(length=255), nullable=False),
+        sa.Column('criterion', sa.String(length=255), nullable=False),
+        sa.Column('failures', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('day', 'business_sector', 'criterion')
+    )
+
+    # Summarise the businesses evaluated so far; from here on every write keeps the tables current
+    op.execute(f"""
+        INSERT INTO daily_verdict_stats (day, business_sector, verdict, evaluations, credit_limit_sum, credit_limit_count)
+        SELECT (created_at AT TIME ZONE '{STATS_TIMEZONE}')::date, COALESCE(business_sector, ''), verdict,
+               count(*), COALESCE(sum(credit_limit), 0), count(credit_limit)
+        FROM business
+        WHERE verdict IS NOT NULL
+        GROUP BY 1, 2, 3
+    """)
+    op.execute(f"""
+        INSERT INTO daily_criterion_failures (day, business_sector, criterion, failures)
+        SELECT (business.created_at AT TIME ZONE '{STATS_TIMEZONE}')::date, COALESCE(business.business_sector, ''),
+               criterion.key, count(*)
+        FROM business, jsonb_each(business.risk_response -> 'criteria') AS criterion
+        WHERE criterion.value ->> 'result' = 'Fail'
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('daily_criterion_failures')
+    op.drop_table('daily_verdict_stats')
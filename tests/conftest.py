@@ -0,0 +1,83 @@
+"""
+Shared fixtures. Tests run against a throwaway SQLite database through aiosqlite, so they
+need no Postgres; code paths that only exist on Postgres (COPY, pg_notify, pg_trgm) are
+left to the benchmarks.
+
+    python -m pytest -q
+"""
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db import get_async_db
+from backend.app.main import create_app
+from backend.app.models import Base
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _enable_savepoints(engine):
+    """
+    The sqlite3 driver opens transactions itself and breaks SAVEPOINT; let SQLAlchemy emit
+    BEGIN instead, as the SQLAlchemy documentation recommends for pysqlite and aiosqlite.
+    """
+    @event.listens_for(engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    path = os.path.join(tmp_path, "test.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def sync_session_factory(database_path):
+    engine = create_engine(f"sqlite:///{database_path}")
+    _enable_savepoints(engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(database_path):
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    _enable_savepoints(async_engine.sync_engine)
+    yield async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    async_engine.sync_engine.dispose()
+
+
+@pytest.fixture
+async def db(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def client(session_factory):
+    """
+    API client on the test database. Startup hooks are not run, so the background job
+    workers, the rule listener and the re-score recovery stay off.
+    """
+    async def get_test_db():
+        async with session_factory() as session:
+            yield session
+
+    app = create_app()
+    app.dependency_overrides[get_async_db] = get_test_db
+    return TestClient(app)
@@ -0,0 +1,93 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.utils.batch_rule_engine import score_portfolio
+from backend.app.utils.rule_engine_utils import DATA_TYPES, FLAG_KEYS, COUNT_KEYS, predict_risk_score_based_on_rule_engine
+from benchmarks.synthetic_applicants import DEFAULT_RULES, OPTIONAL_KEYS, make_applicants
+
+# Results that only match thanks to behaviour pandas has deprecated should fail here first
+pytestmark = pytest.mark.filterwarnings("error::FutureWarning")
+
+RULE_CONFIGS = {
+    "default": DEFAULT_RULES,
+    "numeric": {
+        **DEFAULT_RULES,
+        "unsecured_credit_enquiries_90_days": 1,
+        "last_12_month_sales_in_rs": 5000000,
+        "debt_to_turnover_ratio": 1.5,
+        "business_vintage": 3
+    },
+    "subset": {key: DEFAULT_RULES[key] for key in ("is_30_plus_dpd", "turnover_dip_percent_change", "business_vintage")}
+}
+
+
+def assert_parity(applicants, frame, rules, strict):
+    """Every applicant gets the same per-criterion results, verdict and credit limit from both engines."""
+    scored = score_portfolio(frame, rules, strict=strict, include_masks=True)
+    for applicant, row in zip(applicants, scored.to_dict("records")):
+        expected = predict_risk_score_based_on_rule_engine(applicant, rules, strict=strict)
+        passed = {key: criterion["result"] == "Pass" for key, criterion in expected["criteria"].items()}
+        assert {key: bool(row[f"{key}_passed"]) for key in passed} == passed, applicant
+        assert row["passed_criteria"] == sum(passed.values()), applicant
+        assert row["verdict"] == expected["verdict"], applicant
+        assert row["credit_limit"] == expected["credit_limit"], applicant
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("rules", RULE_CONFIGS.values(), ids=RULE_CONFIGS.keys())
+def test_missing_keys_are_nan_in_the_frame(rules, strict):
+    applicants = make_applicants(2000, seed=1, missing_rate=0.2)
+    frame = pd.DataFrame(applicants)
+    assert frame[list(OPTIONAL_KEYS)].isna().any().all()
+    assert_parity(applicants, frame, rules, strict)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_missing_columns(strict):
+    applicants = make_applicants(500, seed=2)
+    for applicant in applicants:
+        for key in OPTIONAL_KEYS:
+            applicant.pop(key, None)
+    assert_parity(applicants, pd.DataFrame(applicants), DEFAULT_RULES, strict)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_none_flags_and_counts_and_string_numbers(strict):
+    rng = random.Random(3)
+    applicants = make_applicants(1000, seed=3)
+    for applicant in applicants:
+        for key in FLAG_KEYS + COUNT_KEYS:
+            if rng.random() < 0.1:
+                applicant[key] = None
+        for key, convert in DATA_TYPES.items():
+            if key in applicant and rng.random() < 0.3:
+                applicant[key] = str(int(applicant[key]) if convert is int else applicant[key])
+    assert_parity(applicants, pd.DataFrame(applicants), DEFAULT_RULES, strict)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("rules", RULE_CONFIGS.values(), ids=RULE_CONFIGS.keys())
+def test_nullable_dtypes(rules, strict):
+    rng = random.Random(4)
+    applicants = make_applicants(1000, seed=4, missing_rate=0.2)
+    for applicant in applicants:
+        for key in FLAG_KEYS + COUNT_KEYS:
+            if rng.random() < 0.1:
+                del applicant[key]
+    frame = pd.DataFrame(applicants).convert_dtypes()
+    assert frame["is_30_plus_dpd"].dtype == "boolean"
+    assert frame["unsecured_credit_enquiries_90_days"].dtype == "Int64"
+    assert frame["debt_to_turnover_ratio"].dtype == "Float64"
+    assert_parity(applicants, frame, rules, strict)
+
+
+def test_explicit_nan_counts_as_missing():
+    applicants = make_applicants(200, seed=5, missing_rate=0)
+    frame = pd.DataFrame(applicants)
+    frame.loc[::3, "debt_to_turnover_ratio"] = np.nan
+    for applicant in applicants[::3]:
+        del applicant["debt_to_turnover_ratio"]
+    assert_parity(applicants, frame, DEFAULT_RULES, strict=False)
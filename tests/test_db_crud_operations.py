@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.crud.db_crud_operations import (
+    create_model_entries, create_model_entries_async, create_model_entry, unit_of_work, unit_of_work_async
+)
+from backend.app.models import Business
+
+EXISTING = "Existing Traders"
+
+
+def _rows():
+    """Rows 3, 7 and 9 repeat an earlier name; two column sets make two groups of batches."""
+    names = [
+        "Alpha Co", "Beta Co", "Gamma Co", "Alpha Co", "Delta Co",
+        "Epsilon Co", "Zeta Co", "Epsilon Co", "Eta Co", EXISTING
+    ]
+    return [
+        {'business_name': name, 'business_sector': "IT"} if index % 2 else {'business_name': name}
+        for index, name in enumerate(names)
+    ]
+
+
+def _assert_bulk_result(result, rows):
+    assert [error['index'] for error in result['errors']] == [3, 7, 9]
+    assert all("UNIQUE" in error['error'] for error in result['errors'])
+    assert result['inserted'] == len(rows) - 3
+    for index, row in enumerate(result['rows']):
+        if index in (3, 7, 9):
+            assert row is None
+        else:
+            assert row.business_name == rows[index]['business_name']
+
+
+def test_bulk_insert_reports_failed_rows_by_input_index(sync_session_factory):
+    rows = _rows()
+    with sync_session_factory() as db:
+        create_model_entry(db, {'business_name': EXISTING}, Business)
+        result = create_model_entries(db, rows, Business, batch_size=4, returning=['id', 'business_name'])
+        _assert_bulk_result(result, rows)
+        assert db.scalar(select(func.count()).select_from(Business)) == len(rows) - 3 + 1
+
+
+@pytest.mark.anyio
+async def test_bulk_insert_async_reports_failed_rows_by_input_index(db):
+    rows = _rows()
+    await db.run_sync(lambda session: create_model_entry(session, {'business_name': EXISTING}, Business))
+    result = await create_model_entries_async(db, rows, Business, batch_size=4, returning=['id', 'business_name'])
+    _assert_bulk_result(result, rows)
+    assert await db.scalar(select(func.count()).select_from(Business)) == len(rows) - 3 + 1
+
+
+def test_bulk_insert_without_commit_is_rolled_back_with_the_unit_of_work(sync_session_factory):
+    with sync_session_factory() as db:
+        with pytest.raises(RuntimeError):
+            with unit_of_work(db):
+                result = create_model_entries(db, _rows(), Business, commit=False)
+                assert result['inserted'] == 8
+                raise RuntimeError("Later step failed")
+        assert db.scalar(select(func.count()).select_from(Business)) == 0
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_async_commits_once_or_not_at_all(db, session_factory):
+    async with unit_of_work_async(db):
+        db.add(Business(business_name="Kept Co"))
+    with pytest.raises(RuntimeError):
+        async with unit_of_work_async(db):
+            db.add(Business(business_name="Dropped Co"))
+            await db.flush()
+            raise RuntimeError("Later step failed")
+
+    async with session_factory() as other:
+        names = (await other.scalars(select(Business.business_name))).all()
+    assert names == ["Kept Co"]
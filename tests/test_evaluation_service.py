@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.models import Business, DocumentData
+from backend.app.services import evaluation_service
+from backend.app.services.evaluation_service import BusinessAlreadyExists, evaluate_business
+from benchmarks.synthetic_applicants import DEFAULT_RULES
+
+pytestmark = pytest.mark.anyio
+
+CIBIL_RESPONSE = {
+    "is_30_plus_dpd": False, "is_60_plus_dpd": False, "is_90_plus_dpd": False, "adverse_remarks_present": False,
+    "unsecured_credit_enquiries_90_days": 0, "unsecured_loans_disbursed_3_months": 0, "debt_gt_one_year": False
+}
+GST_RESPONSE = {
+    "Turnover DIP Acceptance": {"Percentage Change": "12%"},
+    "Debt to Turnover Ratio": "1.5",
+    "Last 12 Month Sales": "₹ 60,987,301.20"
+}
+
+
+@pytest.fixture(autouse=True)
+def extracted_documents(monkeypatch):
+    """Stand in for PDF parsing and the LLM; the database path is what is under test."""
+    async def extract_documents(db, documents):
+        await db.commit()
+        return {
+            doc_type: {
+                'raw_response': raw_response,
+                'content_hash': f"{doc_type.lower()}-hash",
+                'extraction_version': "test",
+                'cache': "miss"
+            }
+            for doc_type, raw_response in (("CIBIL", CIBIL_RESPONSE), ("GST", GST_RESPONSE))
+        }
+    monkeypatch.setattr(evaluation_service, "extract_documents", extract_documents)
+
+
+def _evaluate(db, company_name="Acme Traders"):
+    return evaluate_business(
+        db=db,
+        cibil_upload={},
+        gst_upload={},
+        business_vintage=5,
+        co_applicant_age=30,
+        proprietor_age=40,
+        company_name=company_name,
+        rules_dict=DEFAULT_RULES
+    )
+
+
+async def _counts(session_factory):
+    async with session_factory() as session:
+        return (
+            await session.scalar(select(func.count()).select_from(Business)),
+            await session.scalar(select(func.count()).select_from(DocumentData))
+        )
+
+
+async def test_evaluation_writes_business_and_documents(db, session_factory):
+    response = await _evaluate(db)
+    assert response['risk_response']['verdict'] == "APPROVED"
+    assert await _counts(session_factory) == (1, 2)
+
+
+async def test_failed_evaluation_leaves_no_rows(db, session_factory, monkeypatch):
+    async def record_evaluations(db, added=(), removed=()):
+        raise RuntimeError("Statistics update failed")
+    # Fails after the business has been flushed and before the documents are added
+    monkeypatch.setattr(evaluation_service, "record_evaluations", record_evaluations)
+
+    with pytest.raises(RuntimeError):
+        await _evaluate(db)
+    assert await _counts(session_factory) == (0, 0)
+
+
+async def test_duplicate_business_leaves_no_documents(db, session_factory):
+    await _evaluate(db)
+    with pytest.raises(BusinessAlreadyExists):
+        await _evaluate(db, company_name="ACME traders")
+    assert await _counts(session_factory) == (1, 2)
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.models import Rule
+from benchmarks.synthetic_applicants import DEFAULT_RULES
+
+
+async def _count_rules(session_factory):
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(Rule))
+
+
+@pytest.mark.anyio
+async def test_update_default_refuses_non_numeric_threshold(client, session_factory):
+    response = client.post("/update/default", json={
+        'rule_config': {'is_30_plus_dpd': False, 'unsecured_credit_enquiries_90_days': 'abc'}
+    })
+    assert response.status_code == 400
+    assert "unsecured_credit_enquiries_90_days" in response.json()["error"]
+    assert await _count_rules(session_factory) == 0
+
+
+def test_update_default_refuses_non_object_config(client):
+    assert client.post("/update/default", json={'rule_config': [DEFAULT_RULES]}).status_code == 400
+
+
+def test_simulate_rules_refuses_non_numeric_threshold(client):
+    response = client.post("/simulate/rules", json={
+        'rule_configs': [DEFAULT_RULES, {**DEFAULT_RULES, 'turnover_dip_percent_change': 'x'}]
+    })
+    assert response.status_code == 400
+    assert response.json()["error"].startswith("Invalid rule config at index 1")
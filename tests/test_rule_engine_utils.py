@@ -0,0 +1,38 @@
+import pytest
+
+from backend.app.utils.rule_engine_utils import compile_rules, predict_risk_score_based_on_rule_engine
+from benchmarks.synthetic_applicants import DEFAULT_RULES
+
+
+def test_string_thresholds_are_converted():
+    rules = compile_rules({
+        **DEFAULT_RULES,
+        "unsecured_credit_enquiries_90_days": "2",
+        "turnover_dip_percent_change": "75.5",
+        "debt_gt_one_year": "False"
+    }).rules
+    assert rules["unsecured_credit_enquiries_90_days"] == 2
+    assert rules["turnover_dip_percent_change"] == 75.5
+    assert rules["last_12_month_sales_in_rs"] == 1000000
+    assert rules["debt_to_turnover_ratio"] == 2.0
+    assert rules["debt_gt_one_year"] is False
+
+
+@pytest.mark.parametrize("key, value", [
+    ("unsecured_credit_enquiries_90_days", "abc"),
+    ("turnover_dip_percent_change", "x"),
+    ("last_12_month_sales_in_rs", None),
+    ("debt_to_turnover_ratio", float("nan")),
+    ("business_vintage", True),
+    ("applicant_age", [25]),
+    ("is_30_plus_dpd", "no"),
+    ("adverse_remarks_present", 0),
+])
+def test_invalid_thresholds_are_refused(key, value):
+    with pytest.raises(ValueError, match=key):
+        compile_rules({**DEFAULT_RULES, key: value})
+
+
+def test_unknown_keys_keep_their_value():
+    result = predict_risk_score_based_on_rule_engine({"region": "north"}, {"region": "north"})
+    assert result["criteria"]["region"]["result"] == "Pass"